@@ -1,9 +1,23 @@
-from rest_framework import status
+import hashlib
+import json
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date, quote_etag
+from rest_framework import serializers, status
 from rest_framework.decorators import action
 from drf_rw_serializers.viewsets import ModelViewSet
 from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.response import Response
 
+from api.v1.compiled import CompiledSerializer, NotCompilable
+from api.v1.facets import count_facets, get_facet_models
+from api.v1.pagination import KeysetPagination
+from api.v1.utils import eager_load, get_sparse_fieldset, get_serializer_models, get_lookup_models
+from components.cache import get_cache, get_generations
+from components.similarity import DEFAULT_LIMIT, similarity_index
+
 
 class SuggestionActionsMixin:
 
@@ -39,3 +53,271 @@ class SuggestionActionsMixin:
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user, status='pending')
+
+
+class AlternativesQuerySerializer(serializers.Serializer):
+    """Query parameters of ``alternatives/``: ``limit``, up to ``max_limit``."""
+    limit = serializers.IntegerField(default=DEFAULT_LIMIT, min_value=1)
+
+    def __init__(self, *args, max_limit=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if max_limit is not None:
+            self.fields['limit'] = serializers.IntegerField(default=DEFAULT_LIMIT, min_value=1, max_value=max_limit)
+
+
+class AlternativesMixin:
+    """
+    Adds ``alternatives/`` to a component viewset: the parts of the same type
+    closest to this one by their numeric attributes (see
+    ``components.similarity``), nearest first, each with its ``distance``.
+    """
+    component_type = None
+    max_alternatives = 50
+
+    @action(detail=True)
+    def alternatives(self, request, pk=None):
+        query = AlternativesQuerySerializer(data=request.query_params, max_limit=self.max_alternatives)
+        query.is_valid(raise_exception=True)
+        limit = query.validated_data['limit']
+        instance = self.get_object()
+
+        alternatives = similarity_index.get_alternatives(self.component_type, instance.pk, limit)
+        parts = self.get_queryset().in_bulk([alternative_pk for alternative_pk, _distance in alternatives])
+        results = []
+        for alternative_pk, distance in alternatives:
+            if alternative_pk in parts:
+                results.append({**self.get_serializer(parts[alternative_pk]).data, 'distance': distance})
+        return Response({'results': results})
+
+
+class EagerLoadingMixin:
+    """
+    Applies the viewset's ``eager_loading`` plan to its queryset, so the nested
+    serializers read prefetched relations instead of querying per row.
+
+    With ``?fields=`` and ``?expand=`` (see ``SparseFieldsetMixin``) only the
+    requested columns and relations are loaded.
+    """
+    eager_loading = {}
+
+    def get_queryset(self):
+        fields, expand = get_sparse_fieldset(self.request)
+        queryset = eager_load(super().get_queryset(), self.get_eager_loading(), fields=fields, expand=expand)
+        if fields is not None:
+            queryset = queryset.only(*self.get_only_fields(queryset.model, fields))
+        return queryset
+
+    def get_eager_loading(self):
+        return self.eager_loading
+
+    def get_only_fields(self, model, fields):
+        """Requested concrete fields, plus the key and ordering columns pagination reads."""
+        ordering = [field.lstrip('-') for field in model._meta.ordering]
+        return {'pk', *ordering, *(field.name for field in model._meta.concrete_fields if field.name in fields)}
+
+
+class CompiledListMixin:
+    """
+    Serves ``list`` through ``CompiledSerializer``: page rows are read with
+    ``.values()`` and mapped by precompiled field mappers instead of building
+    model instances. Falls back to the regular serializer when a field cannot
+    be compiled.
+    """
+
+    def list(self, request, *args, **kwargs):
+        try:
+            compiled = CompiledSerializer(self.get_serializer())
+        except NotCompilable:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        ordering = [field.lstrip('-') for field in model._meta.ordering]
+        rows = compiled.values(queryset, *ordering, model._meta.pk.name)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.to_representation(page))
+        return Response(compiled.to_representation(list(rows)))
+
+
+def get_normalized_query(request):
+    return sorted((param, value) for param, values in request.query_params.lists() for value in values)
+
+
+def get_not_modified_response(request, headers):
+    """
+    A 304 (or 412) response when the request's conditional headers match the
+    ``ETag`` and ``Last-Modified`` in ``headers``, else ``None``.
+    """
+    last_modified = headers.get('Last-Modified')
+    response = get_conditional_response(request, etag=headers.get('ETag'),
+                                        last_modified=parse_http_date(last_modified) if last_modified else None)
+    if response is not None:
+        for header, value in headers.items():
+            response[header] = value
+    return response
+
+
+class ResponseModelsMixin:
+    """Works out which models a response is read from, for cache keys and validators."""
+
+    def get_response_models(self):
+        """
+        The serializer's models, nested ones included, and the models the
+        filters look through or declare (``models``).
+        """
+        model = self.queryset.model if self.queryset is not None else self.get_queryset().model
+        models = {model, *get_serializer_models(self.get_serializer())}
+        filterset_class = getattr(self, 'filterset_class', None)
+        if filterset_class is not None:
+            for filter_ in filterset_class.base_filters.values():
+                models |= get_lookup_models(model, filter_.field_name)
+                models |= set(getattr(filter_, 'models', ()))
+        return models
+
+
+class CachedResponseMixin(ResponseModelsMixin):
+    """
+    Caches ``list`` and ``retrieve`` responses by path and normalized query
+    string.
+
+    The key also holds the generation of every model the response is built
+    from. Saving or deleting a model bumps its generation (see
+    ``components.signals``), so a motor edit gives motor and drone responses
+    new keys while cached antenna responses stay valid.
+
+    The validators set by ``ConditionalGetMixin`` are cached with the data, so
+    a cache hit answers conditional requests without querying the database.
+    """
+    cache_key_prefix = 'api:response'
+    cached_headers = ('ETag', 'Last-Modified')
+
+    def list(self, request, *args, **kwargs):
+        return self.get_cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cached_response(self, handler, request, *args, **kwargs):
+        cache = get_cache()
+        key = self.get_cache_key(request)
+        cached = cache.get(key)
+        if cached is not None:
+            data, headers = cached
+            return get_not_modified_response(request, headers) or Response(data, headers=headers)
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            headers = {header: response[header] for header in self.cached_headers if header in response}
+            cache.set(key, (response.data, headers), settings.API_CACHE_TIMEOUT)
+        return response
+
+    def get_cache_key(self, request):
+        generations = get_generations(self.get_response_models())
+        key = json.dumps([request.build_absolute_uri(request.path), get_normalized_query(request),
+                          request.accepted_media_type, generations])
+        return f'{self.cache_key_prefix}:{hashlib.sha256(key.encode()).hexdigest()}'
+
+
+class FacetsMixin(ResponseModelsMixin):
+    """
+    Adds ``facets/`` to a component viewset: for every filter of
+    ``facet_fields``, how many of the objects matching the current filters
+    have each of its options, counted in one query (see
+    ``api.v1.facets.count_facets``). Cached per filter state like ``list``
+    (see ``CachedResponseMixin``).
+    """
+    facet_fields = ()
+
+    @action(detail=False)
+    def facets(self, request, *args, **kwargs):
+        return self.get_cached_response(self.get_facets, request, *args, **kwargs)
+
+    def get_facets(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(count_facets(queryset, self.get_facet_lookups()))
+
+    def get_facet_lookups(self):
+        """Facet name to the lookup its filter reads."""
+        filters = self.filterset_class.base_filters
+        return {name: filters[name].field_name for name in self.facet_fields}
+
+    def get_response_models(self):
+        models = super().get_response_models()
+        if self.action == 'facets':
+            models |= get_facet_models(self.queryset.model, self.get_facet_lookups())
+        return models
+
+
+class ConditionalGetMixin(ResponseModelsMixin):
+    """
+    Conditional GET for ``list`` and ``retrieve``.
+
+    ``ETag`` and ``Last-Modified`` come from a single aggregate query,
+    ``MAX(updated_at)`` and ``COUNT(*)`` over the filtered queryset, and from
+    the generations of the models the response reads, which move on every
+    save or delete of a related row. ``If-None-Match`` and
+    ``If-Modified-Since`` are answered with 304 before anything is serialized.
+    The count is handed to the pagination (``known_count``), so a paginated
+    list runs no more queries than without validators. Keyset pages that skip
+    the total count (see ``KeysetPagination``) are validated without it: the
+    generations already move on every insert or delete.
+    """
+    last_modified_field = 'updated_at'
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.get_conditional_response(queryset, super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return self.get_conditional_response(queryset, super().retrieve, request, *args, **kwargs)
+
+    def get_conditional_response(self, queryset, handler, request, *args, **kwargs):
+        aggregates = {'last_modified': Max(self.last_modified_field)}
+        if self.get_with_count(request):
+            aggregates['count'] = Count('pk')
+        stats = {'count': None, **queryset.order_by().aggregate(**aggregates)}
+        if self.action == 'retrieve' and not stats['count']:
+            return handler(request, *args, **kwargs)
+        if stats['count'] is not None:
+            # The pagination reuses the count instead of running its own COUNT query.
+            self.known_count = stats['count']
+
+        generations = get_generations(self.get_response_models())
+        headers = {
+            'ETag': self.get_etag(request, stats, generations),
+            'Last-Modified': http_date(self.get_last_modified(stats, generations)),
+        }
+        response = get_not_modified_response(request, headers)
+        if response is not None:
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            for header, value in headers.items():
+                response[header] = value
+        return response
+
+    def get_with_count(self, request):
+        """Whether the response counts the rows: not for keyset pages without ``?count=true``."""
+        paginator = self.paginator if self.action == 'list' else None
+        if not isinstance(paginator, KeysetPagination) or paginator.cursor_query_param not in request.query_params:
+            return True
+        return paginator.get_with_count(request)
+
+    def get_etag(self, request, stats, generations):
+        last_modified = stats['last_modified'].isoformat() if stats['last_modified'] else None
+        etag = json.dumps([request.build_absolute_uri(request.path), get_normalized_query(request),
+                           request.accepted_media_type, stats['count'], last_modified, generations])
+        return quote_etag(hashlib.sha256(etag.encode()).hexdigest())
+
+    def get_last_modified(self, stats, generations):
+        """Latest of the rows' ``updated_at`` and the related models' last change, as a timestamp."""
+        timestamps = [generation / 1e9 for _key, generation in generations]
+        if stats['last_modified']:
+            timestamps.append(stats['last_modified'].timestamp())
+        return int(max(timestamps))
@@ -0,0 +1,280 @@
+from itertools import cycle
+from random import Random
+
+from django.apps import apps
+
+from builds.models import Drone
+from builds.summary import rebuild_summaries
+from components.cache import bump_generation, is_tracked_model
+from components.models import (Antenna, AntennaConnector, AntennaDetail, AntennaType, Battery, Camera, CameraDetail,
+                               FlightController, FlightControllerFirmware, Frame, FrameCameraDetail, FrameMotorDetail,
+                               FrameVTXDetail, Gyro, Motor, MotorDetail, OutputPower, Propeller, RatedVoltage,
+                               Receiver, ReceiverDetail, ReceiverProtocolType, SpeedController,
+                               SpeedControllerFirmware, SpeedControllerProtocol, Stack, Transmitter, VideoFormat)
+from documents.models import (AntennaDocument, CameraDocument, FrameDocument, MotorDocument, PropellerDocument,
+                              ReceiverDocument, StackDocument, TransmitterDocument, FlightControllerDocument,
+                              SpeedControllerDocument, DroneDocument)
+from galleries.models import (AntennaGallery, CameraGallery, FrameGallery, MotorGallery, PropellerGallery,
+                              ReceiverGallery, StackGallery, TransmitterGallery, FlightControllerGallery,
+                              SpeedControllerGallery, DroneGallery)
+from lists.models import List
+from lists.registry import ComponentRegistry
+from search.indexing import rebuild_index
+
+MEDIA = {
+    Antenna: (AntennaGallery, AntennaDocument),
+    Camera: (CameraGallery, CameraDocument),
+    Frame: (FrameGallery, FrameDocument),
+    Motor: (MotorGallery, MotorDocument),
+    Propeller: (PropellerGallery, PropellerDocument),
+    Receiver: (ReceiverGallery, ReceiverDocument),
+    Stack: (StackGallery, StackDocument),
+    Transmitter: (TransmitterGallery, TransmitterDocument),
+    FlightController: (FlightControllerGallery, FlightControllerDocument),
+    SpeedController: (SpeedControllerGallery, SpeedControllerDocument),
+    Drone: (DroneGallery, DroneDocument),
+}
+
+
+class SyntheticCatalog:
+    """
+    Deterministic synthetic catalog used by the API benchmarks.
+
+    Rows are written with bulk_create(), so seeding stays fast on SQLite even
+    for large catalogs. Every component type gets ``size`` parts with details,
+    two images, one document and all of its many-to-many lookups filled in.
+
+    The owner's list only holds a few items per type: ``List.count_all``
+    aggregates over a join of every item table, so its cost grows with the
+    product of the per-type counts.
+    """
+    IMAGES_PER_PART = 2
+    LIST_ITEMS_PER_TYPE = 2
+
+    def __init__(self, size=50, seed=0):
+        self.size = size
+        self.random = Random(seed)
+        self.parts = {}
+
+    def seed(self, owner=None):
+        self._seed_lookups()
+        self._seed_components()
+        self._seed_drones()
+        self._seed_media()
+        if owner is not None:
+            self._seed_list(owner)
+        self._invalidate_cache()
+        rebuild_index()
+        rebuild_summaries()
+        return self
+
+    def _invalidate_cache(self):
+        # bulk_create() sends no post_save, so neither the response cache, the search index nor the drone
+        # summaries follow it.
+        for model in apps.get_models(include_auto_created=True):
+            if is_tracked_model(model):
+                bump_generation(model)
+
+    def _names(self, prefix):
+        return [(f'{prefix}Maker{i % 7}', f'{prefix} {i:05d}') for i in range(self.size)]
+
+    def _pick(self, values, count=1):
+        return self.random.sample(values, count)
+
+    def _seed_lookups(self):
+        self.voltages = RatedVoltage.objects.bulk_create([
+            RatedVoltage(min_cells=low, max_cells=high) for low, high in ((1, 2), (2, 4), (3, 6), (4, 8))
+        ])
+        self.antenna_types = AntennaType.objects.bulk_create([
+            AntennaType(type=name) for name in ('Dipole', 'Monopole', 'Patch')
+        ])
+        self.connectors = AntennaConnector.objects.bulk_create([
+            AntennaConnector(type=name) for name in ('SMA', 'RP-SMA', 'U.FL', 'MMCX')
+        ])
+        self.video_formats = VideoFormat.objects.bulk_create([
+            VideoFormat(format=name) for name in ('PAL', 'NTSC')
+        ])
+        self.receiver_protocols = ReceiverProtocolType.objects.bulk_create([
+            ReceiverProtocolType(type=name) for name in ('CRSF', 'SBUS', 'PPM')
+        ])
+        self.output_powers = OutputPower.objects.bulk_create([
+            OutputPower(output_power=power) for power in (25, 200, 400, 800)
+        ])
+        self.gyros = Gyro.objects.bulk_create([
+            Gyro(manufacturer='InvenSense', imu=imu, max_freq=freq) for imu, freq in (('MPU6000', 8), ('ICM42688', 32))
+        ])
+        self.fc_firmwares = FlightControllerFirmware.objects.bulk_create([
+            FlightControllerFirmware(firmware=name) for name in ('Betaflight', 'INAV', 'ArduPilot')
+        ])
+        self.esc_firmwares = SpeedControllerFirmware.objects.bulk_create([
+            SpeedControllerFirmware(firmware=name) for name in ('BLHeli_S', 'BLHeli_32', 'AM32')
+        ])
+        self.esc_protocols = SpeedControllerProtocol.objects.bulk_create([
+            SpeedControllerProtocol(protocol=name) for name in ('DShot300', 'DShot600', 'PWM')
+        ])
+
+    def _seed_components(self):
+        rnd = self.random
+
+        self.parts[Antenna] = Antenna.objects.bulk_create([
+            Antenna(manufacturer=manufacturer, model=model, description='<p>Synthetic antenna</p>',
+                    type=rnd.choice(self.antenna_types), center_frequency=5800,
+                    bandwidth_min=5650, bandwidth_max=5950, swr=rnd.uniform(1, 2), gain=rnd.uniform(1, 10),
+                    radiation=rnd.randint(50, 99))
+            for manufacturer, model in self._names('Antenna')
+        ])
+        AntennaDetail.objects.bulk_create([
+            AntennaDetail(antenna=antenna, connector_type=connector, weight=rnd.uniform(2, 15))
+            for antenna in self.parts[Antenna] for connector in self._pick(self.connectors, 2)
+        ])
+
+        self.parts[Camera] = Camera.objects.bulk_create([
+            Camera(manufacturer=manufacturer, model=model, description='<p>Synthetic camera</p>',
+                   voltage_min=5, voltage_max=rnd.randint(5, 25), fov=rnd.randint(90, 180),
+                   weight=rnd.uniform(5, 20))
+            for manufacturer, model in self._names('Camera')
+        ])
+        CameraDetail.objects.bulk_create([
+            CameraDetail(camera=camera, height=size, width=size)
+            for camera in self.parts[Camera] for size in (14, 19)
+        ])
+        self._seed_m2m(Camera.video_formats, self.parts[Camera], self.video_formats, 2)
+
+        frames = [
+            Frame(manufacturer=manufacturer, model=model, description='<p>Synthetic frame</p>',
+                  prop_size=str(rnd.randint(3, 7)), size=str(rnd.randint(120, 300)), weight=rnd.uniform(80, 200),
+                  material=Frame.MaterialChoice.FIBRE, configuration=Frame.ConfigurationChoice.X)
+            for manufacturer, model in self._names('Frame')
+        ]
+        for frame in frames:
+            frame.set_prop_sizes()
+        self.parts[Frame] = Frame.objects.bulk_create(frames)
+        FrameCameraDetail.objects.bulk_create([
+            FrameCameraDetail(frame=frame, camera_mount_height=19, camera_mount_width=19) for frame in self.parts[Frame]
+        ])
+        FrameMotorDetail.objects.bulk_create([
+            FrameMotorDetail(frame=frame, motor_mount_height=16, motor_mount_width=16) for frame in self.parts[Frame]
+        ])
+        FrameVTXDetail.objects.bulk_create([
+            FrameVTXDetail(frame=frame, vtx_mount_height=size, vtx_mount_width=size)
+            for frame, size in zip(self.parts[Frame], cycle((20, 30.5)))
+        ])
+
+        self.parts[Motor] = Motor.objects.bulk_create([
+            Motor(manufacturer=manufacturer, model=model, description='<p>Synthetic motor</p>',
+                  stator_diameter=str(rnd.randint(10, 40)), stator_height=f'{rnd.randint(2, 12):02d}',
+                  configuration='12N14P', mount_height=16, mount_width=16)
+            for manufacturer, model in self._names('Motor')
+        ])
+        MotorDetail.objects.bulk_create([
+            MotorDetail(motor=motor, voltage=rnd.choice(self.voltages), kv_per_volt=kv,
+                        weight=rnd.uniform(20, 60), max_power=rnd.randint(300, 1200),
+                        peak_current=rnd.uniform(20, 60), idle_current=rnd.uniform(0.5, 2),
+                        resistance=rnd.uniform(20, 100))
+            for motor in self.parts[Motor] for kv in (1700, 2450)
+        ])
+
+        self.parts[Propeller] = Propeller.objects.bulk_create([
+            Propeller(manufacturer=manufacturer, model=model, description='<p>Synthetic propeller</p>',
+                      size=rnd.randint(3, 7), pitch=rnd.uniform(2, 5), blade_count='3', weight=rnd.uniform(2, 6))
+            for manufacturer, model in self._names('Propeller')
+        ])
+
+        self.parts[Receiver] = Receiver.objects.bulk_create([
+            Receiver(manufacturer=manufacturer, model=model, description='<p>Synthetic receiver</p>',
+                     processor='ESP8285', voltage_min=5, voltage_max=rnd.choice((None, 8.4)))
+            for manufacturer, model in self._names('Receiver')
+        ])
+        ReceiverDetail.objects.bulk_create([
+            ReceiverDetail(receiver=receiver, frequency=frequency, weight=rnd.uniform(1, 5),
+                           telemetry_power=rnd.uniform(10, 20), rf_chip='SX1280')
+            for receiver in self.parts[Receiver] for frequency in (915, 2400)
+        ])
+        self._seed_m2m(Receiver.protocols, self.parts[Receiver], self.receiver_protocols, 2)
+        self._seed_m2m(Receiver.antenna_connectors, self.parts[Receiver], self.connectors, 2)
+
+        self.parts[Transmitter] = Transmitter.objects.bulk_create([
+            Transmitter(manufacturer=manufacturer, model=model, description='<p>Synthetic transmitter</p>',
+                        input_voltage_min=7, input_voltage_max=26, output_voltage=5, channels_quantity=48,
+                        max_power=rnd.choice((400, 800, 1600)), length=30, height=30, thickness=8,
+                        weight=rnd.uniform(5, 15))
+            for manufacturer, model in self._names('Transmitter')
+        ])
+        self._seed_m2m(Transmitter.video_formats, self.parts[Transmitter], self.video_formats, 2)
+        self._seed_m2m(Transmitter.output_powers, self.parts[Transmitter], self.output_powers, 3)
+        self._seed_m2m(Transmitter.antenna_connectors, self.parts[Transmitter], self.connectors, 1)
+
+        self.parts[FlightController] = FlightController.objects.bulk_create([
+            FlightController(manufacturer=manufacturer, model=model, description='<p>Synthetic FC</p>',
+                             microcontroller='STM32F405', gyro=rnd.choice(self.gyros),
+                             voltage=rnd.choice(self.voltages), connector_type='c', mount_length=30.5,
+                             mount_width=30.5, weight=rnd.uniform(5, 10), length=36, width=36)
+            for manufacturer, model in self._names('FlightController')
+        ])
+        self._seed_m2m(FlightController.firmwares, self.parts[FlightController], self.fc_firmwares, 2)
+
+        self.parts[SpeedController] = SpeedController.objects.bulk_create([
+            SpeedController(manufacturer=manufacturer, model=model, description='<p>Synthetic ESC</p>',
+                            voltage=rnd.choice(self.voltages), esc_type='all', cont_current=rnd.randint(30, 60),
+                            burst_current=rnd.randint(60, 80), mount_length=30.5, mount_width=30.5,
+                            weight=rnd.uniform(8, 15), length=40, width=40)
+            for manufacturer, model in self._names('SpeedController')
+        ])
+        self._seed_m2m(SpeedController.firmwares, self.parts[SpeedController], self.esc_firmwares, 2)
+        self._seed_m2m(SpeedController.protocols, self.parts[SpeedController], self.esc_protocols, 2)
+
+        self.parts[Stack] = Stack.objects.bulk_create([
+            Stack(manufacturer=manufacturer, model=model, description='<p>Synthetic stack</p>',
+                  flight_controller=flight_controller, speed_controller=speed_controller)
+            for (manufacturer, model), flight_controller, speed_controller in zip(
+                self._names('Stack'), self.parts[FlightController], self.parts[SpeedController])
+        ])
+
+        self.parts[Battery] = Battery.objects.bulk_create([
+            Battery(manufacturer=f'BatteryMaker{i % 7}', description='<p>Synthetic battery</p>',
+                    series=rnd.randint(1, 6), parallels=1, size='18650', capacity=rnd.randint(450, 3000),
+                    voltage=rnd.uniform(3.7, 25), discharge_current=rnd.randint(30, 150), charge_current=5,
+                    weight=rnd.uniform(20, 300), length=70, height=35, width=30)
+            for i in range(self.size)
+        ])
+
+    def _seed_m2m(self, descriptor, objects, choices, count):
+        through = descriptor.through
+        source = descriptor.field.m2m_field_name()
+        target = descriptor.field.m2m_reverse_field_name()
+        through.objects.bulk_create([
+            through(**{source: obj, target: choice})
+            for obj in objects for choice in self._pick(choices, count)
+        ])
+
+    def _seed_media(self):
+        for model, (gallery_model, document_model) in MEDIA.items():
+            name = model._meta.model_name
+            gallery_model.objects.bulk_create([
+                gallery_model(object=obj, image=f'images/benchmark/{name}_{obj.pk}_{order}.webp',
+                              order=order, accepted=True)
+                for obj in self.parts[model] for order in range(self.IMAGES_PER_PART)
+            ])
+            document_model.objects.bulk_create([
+                document_model(object=obj, file=f'documents/benchmark/{name}_{obj.pk}.pdf', accepted=True)
+                for obj in self.parts[model]
+            ])
+
+    def _seed_drones(self):
+        self.parts[Drone] = Drone.objects.bulk_create([
+            Drone(manufacturer=f'DroneMaker{i % 7}', model=f'Drone {i:05d}', description='<p>Synthetic drone</p>',
+                  antenna=self.parts[Antenna][i], battery=self.parts[Battery][i], camera=self.parts[Camera][i],
+                  frame=self.parts[Frame][i], motor=self.parts[Motor][i], propeller=self.parts[Propeller][i],
+                  receiver=self.parts[Receiver][i], transmitter=self.parts[Transmitter][i],
+                  flight_controller=self.parts[FlightController][i],
+                  speed_controller=self.parts[SpeedController][i])
+            for i in range(self.size)
+        ])
+
+    def _seed_list(self, owner):
+        self.list = List.objects.create(owner=owner, name='Benchmark list')
+        for component_type in ComponentRegistry.get_all_types():
+            item_model = ComponentRegistry.get_model(component_type)
+            component_model = item_model._meta.get_field('component').related_model
+            components = self.parts[component_model][:self.LIST_ITEMS_PER_TYPE]
+            item_model.objects.bulk_create([item_model(list=self.list, component=item) for item in components])
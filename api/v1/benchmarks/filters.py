@@ -0,0 +1,112 @@
+import re
+from itertools import cycle, islice
+from time import perf_counter
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Max
+from django.db.models.constants import LOOKUP_SEP
+from django_filters import rest_framework as filters
+
+from api.v1.builds.filters import DroneFilter
+from builds.compatibility import DRONE_PARTS
+from builds.models import Drone
+from builds.summary import rebuild_summaries
+
+BATCH_SIZE = 1000
+
+
+def get_tables(model, field_name):
+    """Tables the ``field_name`` lookup path reads from, besides ``model``'s own."""
+    tables = []
+    for name in field_name.split(LOOKUP_SEP):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation:
+            break
+        model = field.related_model
+        tables.append(model._meta.db_table)
+    return tables
+
+
+def get_sample_value(filter_):
+    """A query string value the filter accepts, taken from the choices or the seeded rows."""
+    if isinstance(filter_, filters.BooleanFilter):
+        return 'true'
+    if isinstance(filter_, (filters.ModelChoiceFilter, filters.ModelMultipleChoiceFilter)):
+        obj = filter_.queryset.first()
+        return getattr(obj, filter_.extra.get('to_field_name') or 'pk')
+    if isinstance(filter_, filters.ChoiceFilter):
+        choices = filter_.extra['choices']
+        return (choices() if callable(choices) else choices)[0][0]
+    return (Drone.objects.exclude(**{f'{filter_.field_name}__isnull': True})
+            .values_list(filter_.field_name, flat=True).first())
+
+
+def get_params(name, filter_):
+    if isinstance(filter_, filters.RangeFilter):
+        # The highest value, so the filter is as selective as the seeded rows allow
+        return {f'{name}_min': Drone.objects.aggregate(value=Max(filter_.field_name))['value']}
+    if isinstance(filter_, filters.ModelMultipleChoiceFilter):
+        return {name: [get_sample_value(filter_)]}
+    return {name: get_sample_value(filter_)}
+
+
+def uses_index(plan, table):
+    """
+    Whether the query plan looks the ``table`` rows up through an index
+    instead of reading all of them, in index order or not (SQLite and
+    PostgreSQL plans).
+    """
+    return bool(re.search(rf'\bSEARCH {table}\b', plan)
+                or re.search(rf'\b(?:Index|Index Only|Bitmap Heap) Scan (?:using \w+ )?on {table}\b', plan))
+
+
+def seed_drones(catalog, count):
+    """
+    Adds drones built from the catalog's parts until there are ``count`` of
+    them. A battery belongs to one drone only, so the added ones go without.
+    """
+    drones = catalog.parts[Drone]
+    missing = count - len(drones)
+    if missing > 0:
+        Drone.objects.bulk_create(
+            [Drone(manufacturer=drone.manufacturer, model=f'{drone.model} #{index}', description=drone.description,
+                   **{f'{part}_id': getattr(drone, f'{part}_id') for part in DRONE_PARTS if part != 'battery'})
+             for index, drone in enumerate(islice(cycle(drones), missing), start=1)],
+            batch_size=BATCH_SIZE,
+        )
+        rebuild_summaries()
+    return Drone.objects.count()
+
+
+def run(catalog, drones=100000):
+    """
+    Explains the drone list query of every filter that reads from another
+    table than ``builds_drone`` against ``drones`` drones, and reports
+    whether it looks the drones up through an index, the matching rows and
+    the query time.
+    """
+    report = {'drones': seed_drones(catalog, drones), 'filters': {}}
+    queryset = Drone.objects.order_by('manufacturer', 'model', 'pk')
+    for name, filter_ in DroneFilter.base_filters.items():
+        if LOOKUP_SEP not in filter_.field_name:
+            continue
+        tables = get_tables(Drone, filter_.field_name)
+        params = get_params(name, filter_)
+        filterset = DroneFilter(params, queryset=queryset)
+        filtered = filterset.qs
+        plan = filtered.explain()
+        started = perf_counter()
+        rows = len(filtered[:100])
+        report['filters'][name] = {
+            'params': params,
+            'valid': filterset.is_valid(),
+            'tables': tables,
+            'index_used': uses_index(plan, Drone._meta.db_table),
+            'rows': rows,
+            'time_ms': round((perf_counter() - started) * 1000, 2),
+            'plan': plan,
+        }
+    return report
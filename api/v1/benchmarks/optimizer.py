@@ -0,0 +1,39 @@
+from time import perf_counter
+
+from builds.compatibility import compatibility_engine
+from builds.optimizer import OBJECTIVES, BuildOptimizer
+
+CHECKED_TYPES = ('frame', 'motor', 'propeller', 'battery', 'speed_controller', 'flight_controller', 'camera',
+                 'transmitter')
+
+
+def get_issues(build):
+    """Compatibility engine issues of an optimizer build, as rule names."""
+    parts = {component_type: build['parts'][component_type] for component_type in CHECKED_TYPES}
+    return [issue.rule for issue in compatibility_engine.check(parts)]
+
+
+def run(limit=10, max_weight=None, repeat=3):
+    """
+    Times loading the optimizer's column arrays and the search for every
+    objective (best of ``repeat`` runs), and checks every returned build
+    against the compatibility engine.
+    """
+    optimizer = BuildOptimizer()
+    started = perf_counter()
+    optimizer.get_catalog()
+    report = {'load_ms': round((perf_counter() - started) * 1000, 2), 'objectives': {}}
+
+    for objective in OBJECTIVES:
+        timings = []
+        for _run in range(repeat):
+            started = perf_counter()
+            builds = optimizer.optimize(max_weight=max_weight, objective=objective, limit=limit)
+            timings.append(perf_counter() - started)
+        report['objectives'][objective] = {
+            'time_ms': round(min(timings) * 1000, 2),
+            'builds': len(builds),
+            'scores': [build['score'] for build in builds],
+            'issues': {index: issues for index, issues in enumerate(map(get_issues, builds)) if issues},
+        }
+    return report
@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+from time import perf_counter
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from api.v1.builds.urls import router as builds_router
+from api.v1.components.urls import router as components_router
+from api.v1.lists.urls import router as lists_router
+from lists.models import List
+
+BASELINE_PATH = Path(__file__).with_name('baseline.json')
+
+ROUTERS = (
+    ('api:v1:components', components_router),
+    ('api:v1:builds', builds_router),
+    ('api:v1:lists', lists_router),
+)
+
+
+def get_endpoints(catalog):
+    """
+    Returns ``(name, url)`` pairs for the list and retrieve route of every
+    viewset registered in the public API routers.
+    """
+    endpoints = []
+    for namespace, router in ROUTERS:
+        for _prefix, viewset, basename in router.registry:
+            queryset = getattr(viewset, 'queryset', None)
+            model = queryset.model if queryset is not None else List
+            obj = catalog.list if model is List else catalog.parts[model][0]
+
+            endpoints.append((f'{basename}-list', reverse(f'{namespace}:{basename}-list')))
+            endpoints.append((f'{basename}-detail', reverse(f'{namespace}:{basename}-detail', args=[obj.pk])))
+    return endpoints
+
+
+def measure(client, url):
+    """Requests ``url`` once and returns its status, SQL query count, wall time and response size."""
+    with CaptureQueriesContext(connection) as context:
+        started = perf_counter()
+        response = client.get(url)
+        elapsed = perf_counter() - started
+
+    return {
+        'status': response.status_code,
+        'queries': len(context.captured_queries),
+        'time_ms': round(elapsed * 1000, 2),
+        'bytes': len(response.content),
+    }
+
+
+def run(client, catalog):
+    return {
+        'size': catalog.size,
+        'vendor': connection.vendor,
+        'endpoints': {name: {'url': url, **measure(client, url)} for name, url in get_endpoints(catalog)},
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path) as file:
+        return json.load(file)
+
+
+def dump_report(report, path=BASELINE_PATH):
+    with open(path, 'w') as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+        file.write('\n')
@@ -0,0 +1,59 @@
+from time import perf_counter
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.v1.compiled import CompiledSerializer
+from api.v1.components.urls import router as components_router
+
+
+def get_list_view(viewset, request):
+    view = viewset(action='list', request=request, format_kwarg=None, args=(), kwargs={})
+    view.headers = {}
+    return view
+
+
+def serialize_with_drf(view, limit):
+    objects = list(view.get_queryset()[:limit])
+    return JSONRenderer().render(view.get_serializer(objects, many=True).data)
+
+
+def serialize_compiled(view, limit):
+    compiled = CompiledSerializer(view.get_serializer())
+    rows = list(compiled.values(view.get_queryset())[:limit])
+    return JSONRenderer().render(compiled.to_representation(rows))
+
+
+def rows_per_second(rows, seconds):
+    return round(rows / seconds, 1) if seconds else None
+
+
+def compare(viewset, limit, repeat=3):
+    """
+    Serializes the first ``limit`` rows of the viewset's list queryset with the
+    regular DRF serializer and with ``CompiledSerializer``, and returns both
+    throughputs (best of ``repeat`` runs) and whether the JSON is identical.
+    """
+    request = Request(APIRequestFactory().get('/'))
+    view = get_list_view(viewset, request)
+
+    timings = {serialize_with_drf: [], serialize_compiled: []}
+    output = {}
+    for _ in range(repeat):
+        for serialize in timings:
+            started = perf_counter()
+            output[serialize] = serialize(view, limit)
+            timings[serialize].append(perf_counter() - started)
+
+    rows = view.get_queryset()[:limit].count()
+    return {
+        'rows': rows,
+        'drf_rows_per_second': rows_per_second(rows, min(timings[serialize_with_drf])),
+        'compiled_rows_per_second': rows_per_second(rows, min(timings[serialize_compiled])),
+        'identical': output[serialize_with_drf] == output[serialize_compiled],
+    }
+
+
+def run(limit):
+    return {basename: compare(viewset, limit) for _prefix, viewset, basename in components_router.registry}
@@ -0,0 +1,79 @@
+import os
+
+from api.v1.benchmarks import filters, optimizer, serialization
+from api.v1.benchmarks.catalog import SyntheticCatalog
+from api.v1.benchmarks.runner import run, load_baseline, dump_report, BASELINE_PATH
+from api.v1.tests import BaseAPITest
+
+
+class APIQueryCountBenchmark(BaseAPITest):
+    """
+    Requests every list and retrieve endpoint against a synthetic catalog and
+    fails when an endpoint issues more SQL queries than recorded in
+    ``baseline.json``. N+1 endpoints scale with the catalog, so counts are
+    only compared when the catalog size matches the recorded one.
+
+    Environment variables:
+        API_BENCHMARK_SIZE   - parts per component type (default: baseline size)
+        API_BENCHMARK_OUTPUT - path to write the full report to
+        API_BENCHMARK_UPDATE - rewrite ``baseline.json`` with the current run
+        API_BENCHMARK_DRONES - drones to explain the DroneFilter queries against (default: catalog size;
+                               100000 for the full check)
+    """
+
+    def setUp(self):
+        self.user = self.create_and_login()
+        self.client.force_authenticate(self.user)
+        self.baseline = load_baseline()
+        size = int(os.getenv('API_BENCHMARK_SIZE', self.baseline['size']))
+        self.catalog = SyntheticCatalog(size=size).seed(owner=self.user)
+
+    def test_query_counts(self):
+        report = run(self.client, self.catalog)
+
+        if os.getenv('API_BENCHMARK_OUTPUT'):
+            dump_report(report, os.getenv('API_BENCHMARK_OUTPUT'))
+        if os.getenv('API_BENCHMARK_UPDATE'):
+            dump_report(report, BASELINE_PATH)
+
+        baseline = self.baseline['endpoints']
+        for name, result in report['endpoints'].items():
+            with self.subTest(endpoint=name):
+                self.assertEqual(result['status'], 200)
+                self.assertIn(name, baseline, 'Endpoint is missing from baseline.json')
+                if report['size'] == self.baseline['size']:
+                    self.assertLessEqual(result['queries'], baseline[name]['queries'])
+
+    def test_compiled_serialization(self):
+        report = serialization.run(limit=self.catalog.size)
+
+        if os.getenv('API_BENCHMARK_OUTPUT'):
+            dump_report(report, f"{os.getenv('API_BENCHMARK_OUTPUT')}.serialization.json")
+
+        for name, result in report.items():
+            with self.subTest(endpoint=name):
+                self.assertEqual(result['rows'], self.catalog.size)
+                self.assertTrue(result['identical'])
+
+    def test_build_optimizer(self):
+        report = optimizer.run()
+
+        if os.getenv('API_BENCHMARK_OUTPUT'):
+            dump_report(report, f"{os.getenv('API_BENCHMARK_OUTPUT')}.optimizer.json")
+
+        for objective, result in report['objectives'].items():
+            with self.subTest(objective=objective):
+                self.assertEqual(result['builds'], 10)
+                self.assertEqual(result['scores'], sorted(result['scores'], reverse=True))
+                self.assertEqual(result['issues'], {})
+
+    def test_drone_filter_plans(self):
+        report = filters.run(self.catalog, drones=int(os.getenv('API_BENCHMARK_DRONES', self.catalog.size)))
+
+        if os.getenv('API_BENCHMARK_OUTPUT'):
+            dump_report(report, f"{os.getenv('API_BENCHMARK_OUTPUT')}.filters.json")
+
+        for name, result in report['filters'].items():
+            with self.subTest(filter=name):
+                self.assertTrue(result['valid'], result['params'])
+                self.assertTrue(result['index_used'], result['plan'])
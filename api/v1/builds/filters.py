@@ -1,22 +1,27 @@
 from django_filters import rest_framework as filters
 
+from api.v1.filters import RelatedExistsFilterSet, SummaryValueFilter, SummaryValuesFilter
 from builds.models import Drone
-from components.models import Antenna, AntennaConnector, VideoFormat, ReceiverProtocolType
+from components.models import Antenna, AntennaConnector, AntennaDetail, VideoFormat, ReceiverProtocolType
 
 
-class DroneFilter(filters.FilterSet):
+class DroneFilter(RelatedExistsFilterSet):
+    weight = filters.RangeFilter(field_name='summary__weight')
+
     antenna__center_frequency = filters.RangeFilter(field_name='antenna__center_frequency')
     antenna__swr = filters.RangeFilter(field_name='antenna__swr', )
     antenna__gain = filters.RangeFilter(field_name='antenna__gain')
     antenna__radiation = filters.RangeFilter(field_name='antenna__radiation')
+    antenna__details__angle_type = SummaryValueFilter(field_name='summary__antenna_angle_types',
+                                                      choices=AntennaDetail.ConnectorChoice.choices)
 
     battery__series = filters.RangeFilter(field_name='battery__series')
     battery__parallels = filters.RangeFilter(field_name='battery__parallels')
     battery__voltage = filters.RangeFilter(field_name='battery__voltage')
 
-    camera__fov = filters.RangeFilter(field_name='fov')
-    camera__formats = filters.ModelMultipleChoiceFilter(
-        field_name='camera__video_formats__format',
+    camera__fov = filters.RangeFilter(field_name='camera__fov')
+    camera__formats = SummaryValuesFilter(
+        field_name='summary__camera_video_formats',
         to_field_name='format',
         queryset=VideoFormat.objects.all(),
         conjoined=True,
@@ -27,8 +32,8 @@ class DroneFilter(filters.FilterSet):
 
     receiver__frequency = filters.RangeFilter(field_name='receiver__details__frequency')
     receiver__telemetry_power = filters.RangeFilter(field_name='receiver__details__telemetry_power')
-    receiver__protocols = filters.ModelMultipleChoiceFilter(
-        field_name='receiver__protocols__type',
+    receiver__protocols = SummaryValuesFilter(
+        field_name='summary__receiver_protocols',
         to_field_name='type',
         queryset=ReceiverProtocolType.objects.all(),
         conjoined=True,
@@ -36,8 +41,8 @@ class DroneFilter(filters.FilterSet):
 
     transmitter__channels_quantity = filters.RangeFilter(field_name='transmitter__channels_quantity')
     transmitter__max_power = filters.RangeFilter(field_name='transmitter__max_power')
-    transmitter__formats = filters.ModelMultipleChoiceFilter(
-        field_name='video_formats__format',
+    transmitter__formats = SummaryValuesFilter(
+        field_name='summary__transmitter_video_formats',
         to_field_name='format',
         queryset=VideoFormat.objects.all(),
         conjoined=True,
@@ -45,7 +50,7 @@ class DroneFilter(filters.FilterSet):
 
     class Meta:
         model = Drone
-        fields = ['manufacturer', 'type',
+        fields = ['manufacturer', 'type', 'weight',
                   'antenna', 'camera', 'frame', 'motor', 'propeller',
                   'receiver', 'transmitter', 'flight_controller', 'speed_controller',
 
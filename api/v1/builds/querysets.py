@@ -0,0 +1,47 @@
+from django.db.models import Prefetch
+
+from api.v1.components.querysets import (ANTENNA_EAGER_LOADING, CAMERA_EAGER_LOADING, FRAME_EAGER_LOADING,
+                                         MOTOR_EAGER_LOADING, PROPELLER_EAGER_LOADING, RECEIVER_EAGER_LOADING,
+                                         TRANSMITTER_EAGER_LOADING, FLIGHT_CONTROLLER_EAGER_LOADING,
+                                         SPEED_CONTROLLER_EAGER_LOADING)
+from api.v1.utils import nest_eager_loading
+from galleries.models import (AntennaGallery, CameraGallery, FrameGallery, MotorGallery, PropellerGallery,
+                              ReceiverGallery, TransmitterGallery, FlightControllerGallery,
+                              SpeedControllerGallery)
+
+# Eager-loading plans for the drone serializers, see api.v1.components.querysets.
+
+PART_EAGER_LOADING = {
+    'antenna': ANTENNA_EAGER_LOADING,
+    'camera': CAMERA_EAGER_LOADING,
+    'frame': FRAME_EAGER_LOADING,
+    'motor': MOTOR_EAGER_LOADING,
+    'propeller': PROPELLER_EAGER_LOADING,
+    'receiver': RECEIVER_EAGER_LOADING,
+    'transmitter': TRANSMITTER_EAGER_LOADING,
+    'flight_controller': FLIGHT_CONTROLLER_EAGER_LOADING,
+    'speed_controller': SPEED_CONTROLLER_EAGER_LOADING,
+}
+
+PART_GALLERIES = {
+    'antenna': AntennaGallery,
+    'camera': CameraGallery,
+    'frame': FrameGallery,
+    'motor': MotorGallery,
+    'propeller': PropellerGallery,
+    'receiver': ReceiverGallery,
+    'transmitter': TransmitterGallery,
+    'flight_controller': FlightControllerGallery,
+    'speed_controller': SpeedControllerGallery,
+}
+
+# Full tree of every part, for retrieve
+DRONE_EAGER_LOADING = {part: [part, *nest_eager_loading(part, plan)] for part, plan in PART_EAGER_LOADING.items()}
+
+# Parts with their accepted images only, for the compact list representation
+DRONE_OVERVIEW_EAGER_LOADING = {
+    'battery': ['battery'],
+    **{part: [part, Prefetch(f'{part}__images', queryset=gallery.objects.filter(accepted=True),
+                             to_attr='accepted_images')]
+       for part, gallery in PART_GALLERIES.items()},
+}
@@ -3,10 +3,60 @@ from rest_framework import serializers
 from api.v1.components.serializers import (AntennaSerializer, CameraSerializer, FrameSerializer, \
     MotorSerializer, PropellerSerializer, ReceiverSerializer, TransmitterSerializer,
                                            SpeedControllerSerializer, FlightControllerSerializer)
+from api.v1.utils import SparseFieldsetMixin
+from builds.metrics import TABLES as METRICS_TABLES, build_metrics, get_build_key, get_drone_parts
 from builds.models import Drone
+from builds.optimizer import OBJECTIVES
 
 
-class DroneSerializer(serializers.ModelSerializer):
+class DroneListSerializer(serializers.ListSerializer):
+    """Computes the metrics of every drone on the page in one pass before serializing them."""
+
+    def to_representation(self, data):
+        drones = data.all() if hasattr(data, 'all') else data
+        builds = [get_drone_parts(drone) for drone in drones]
+        self.context['metrics'] = dict(zip(map(get_build_key, builds), build_metrics.get_many(builds)))
+        return super().to_representation(drones)
+
+
+class BuildMetricsField(serializers.Field):
+    """
+    Metrics of the drone (see ``builds.metrics``), taken from the ones
+    ``DroneListSerializer`` computed for the page when there are any.
+    """
+    models = {model for _load, table_models in METRICS_TABLES.values() for model in table_models}
+
+    def __init__(self, **kwargs):
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, drone):
+        parts = get_drone_parts(drone)
+        metrics = self.context.get('metrics', {}).get(get_build_key(parts))
+        return metrics if metrics is not None else build_metrics.get(parts)
+
+
+class DronePartSerializer(serializers.Serializer):
+    """Id, name and first accepted image of a part, for the compact drone representation."""
+    id = serializers.IntegerField(read_only=True)
+    display_name = serializers.CharField(source='__str__', read_only=True)
+    thumbnail = serializers.SerializerMethodField()
+
+    def get_thumbnail(self, obj):
+        if hasattr(obj, 'accepted_images'):
+            image = obj.accepted_images[0] if obj.accepted_images else None
+        elif hasattr(obj, 'images'):
+            image = obj.images.filter(accepted=True).first()
+        else:
+            return None
+        if image is None:
+            return None
+        request = self.context.get('request')
+        return request.build_absolute_uri(image.image.url) if request is not None else image.image.url
+
+
+class DroneSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     antenna = AntennaSerializer(read_only=True)
     camera = CameraSerializer(read_only=True)
     frame = FrameSerializer(read_only=True)
@@ -16,7 +66,67 @@ class DroneSerializer(serializers.ModelSerializer):
     receiver = ReceiverSerializer(read_only=True)
     speed_controller = SpeedControllerSerializer(read_only=True)
     transmitter = TransmitterSerializer(read_only=True)
+    metrics = BuildMetricsField()
 
     class Meta:
         model = Drone
         fields = '__all__'
+        list_serializer_class = DroneListSerializer
+
+
+class DroneOverviewSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Compact drone representation for listings: every part as its id, name
+    and thumbnail, plus the build metrics. ``DroneSerializer`` keeps the full
+    nested parts for the detail view.
+    """
+    antenna = DronePartSerializer(read_only=True)
+    battery = DronePartSerializer(read_only=True)
+    camera = DronePartSerializer(read_only=True)
+    frame = DronePartSerializer(read_only=True)
+    flight_controller = DronePartSerializer(read_only=True)
+    motor = DronePartSerializer(read_only=True)
+    propeller = DronePartSerializer(read_only=True)
+    receiver = DronePartSerializer(read_only=True)
+    speed_controller = DronePartSerializer(read_only=True)
+    transmitter = DronePartSerializer(read_only=True)
+    metrics = BuildMetricsField()
+
+    class Meta:
+        model = Drone
+        fields = ('id', 'manufacturer', 'model', 'short_description', 'type', 'created_at', 'updated_at',
+                  'antenna', 'battery', 'camera', 'frame', 'flight_controller', 'motor', 'propeller', 'receiver',
+                  'speed_controller', 'transmitter', 'metrics')
+        list_serializer_class = DroneListSerializer
+
+
+class BuildOptimizerQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the build optimizer. Every part type takes one or more
+    ids (``?frame=3&frame=7``) that the builds are restricted to.
+    """
+    max_weight = serializers.FloatField(required=False, min_value=0)
+    objective = serializers.ChoiceField(choices=OBJECTIVES, default='power_to_weight')
+    limit = serializers.IntegerField(default=10, min_value=1, max_value=50)
+    frame = serializers.ListField(child=serializers.IntegerField(), required=False)
+    motor = serializers.ListField(child=serializers.IntegerField(), required=False)
+    propeller = serializers.ListField(child=serializers.IntegerField(), required=False)
+    battery = serializers.ListField(child=serializers.IntegerField(), required=False)
+    speed_controller = serializers.ListField(child=serializers.IntegerField(), required=False)
+    flight_controller = serializers.ListField(child=serializers.IntegerField(), required=False)
+    camera = serializers.ListField(child=serializers.IntegerField(), required=False)
+    transmitter = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+
+class BuildPartsSerializer(serializers.Serializer):
+    """Part ids of an ad-hoc build, by the name of the part on ``Drone``."""
+    antenna = serializers.IntegerField(required=False, allow_null=True)
+    battery = serializers.IntegerField(required=False, allow_null=True)
+    camera = serializers.IntegerField(required=False, allow_null=True)
+    frame = serializers.IntegerField(required=False, allow_null=True)
+    motor = serializers.IntegerField(required=False, allow_null=True)
+    propeller = serializers.IntegerField(required=False, allow_null=True)
+    receiver = serializers.IntegerField(required=False, allow_null=True)
+    transmitter = serializers.IntegerField(required=False, allow_null=True)
+    flight_controller = serializers.IntegerField(required=False, allow_null=True)
+    speed_controller = serializers.IntegerField(required=False, allow_null=True)
@@ -1,10 +1,16 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from mixer.backend.django import mixer
 from mixer.backend.django import mixer
 from rest_framework.reverse import reverse
 
+from api.v1.builds.filters import DroneFilter
 from api.v1.tests import BaseAPITest
+from builds.metrics import build_metrics
 from builds.models import Drone
-from components.models import Antenna
+from components.models import Antenna, Camera, Frame, Motor, MotorDetail, Transmitter, VideoFormat
+from galleries.models import FrameGallery
 
 
 class TestDroneAPIView(BaseAPITest):
@@ -27,6 +33,28 @@ class TestDroneAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Drone.objects.all().count())
 
+    def test_list_drone_overview(self):
+        for i in range(5):
+            frame = mixer.blend(Frame)
+            mixer.blend(FrameGallery, object=frame, order=1)
+            mixer.blend(FrameGallery, object=frame, order=0)
+            mixer.blend(Drone, frame=frame, motor=mixer.blend(Motor), antenna=self.antenna1)
+
+        url = reverse('api:v1:builds:drone-list')
+        build_metrics.get_tables(build_metrics.tables)
+        # Count, page, then one query per gallery of the parts on the page
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        drone = next(drone for drone in response.data['results'] if drone['frame'])
+        frame = Frame.objects.get(pk=drone['frame']['id'])
+        self.assertEqual(drone['frame']['display_name'], str(frame))
+        self.assertTrue(drone['frame']['thumbnail'].endswith(frame.images.get(order=0).image.url))
+        self.assertIsNone(drone['motor']['thumbnail'])
+        self.assertIsNone(drone['camera'])
+        self.assertIn('weight', drone['metrics'])
+
     def test_detail_drone(self):
         url = reverse('api:v1:builds:drone-detail', args={self.drone1.id})
         response = self.client.get(url)
@@ -52,4 +80,112 @@ class TestDroneAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), 2)
 
+    def test_filter_drone_summary(self):
+        motor = mixer.blend(Motor)
+        mixer.blend(MotorDetail, motor=motor, max_power=800)
+        mixer.blend(MotorDetail, motor=motor, max_power=1200)
+        pal = mixer.blend(VideoFormat, format='PAL')
+        camera = mixer.blend(Camera)
+        camera.video_formats.add(pal)
+        transmitter = mixer.blend(Transmitter)
+        transmitter.video_formats.add(pal, mixer.blend(VideoFormat, format='NTSC'))
+        self.drone1.motor = motor
+        self.drone1.camera = camera
+        self.drone1.transmitter = transmitter
+        self.drone1.save()
+
+        url = reverse('api:v1:builds:drone-list')
+        for params, count in (({'motor__max_power_min': 1000}, 1), ({'motor__max_power_min': 1300}, 0),
+                              ({'motor__max_power_max': 700}, 0), ({'camera__formats': 'PAL'}, 1),
+                              ({'camera__formats': 'NTSC'}, 0), ({'transmitter__formats': ['PAL', 'NTSC']}, 1)):
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data.get('count'), count)
+
+    def test_filter_drone_variant_range(self):
+        motor = mixer.blend(Motor)
+        mixer.blend(MotorDetail, motor=motor, max_power=100)
+        mixer.blend(MotorDetail, motor=motor, max_power=500)
+        self.drone1.motor = motor
+        self.drone1.save()
 
+        url = reverse('api:v1:builds:drone-list')
+        # A drone matches when one variant is in range, not when the range falls between its variants
+        for params, count in (({'motor__max_power_min': 200, 'motor__max_power_max': 300}, 0),
+                              ({'motor__max_power_min': 400, 'motor__max_power_max': 600}, 1),
+                              ({'motor__max_power_min': 100, 'motor__max_power_max': 100}, 1)):
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data.get('count'), count)
+
+    def test_filter_drone_related_semi_join(self):
+        self.drone1.camera = mixer.blend(Camera, fov=120)
+        self.drone1.save()
+        self.drone2.camera = mixer.blend(Camera, fov=90)
+        self.drone2.save()
+
+        queryset = DroneFilter({'camera__fov_min': 100, 'antenna__swr_min': 0}, queryset=Drone.objects.all()).qs
+        sql = str(queryset.query)
+        self.assertEqual(sql.count(' IN (SELECT'), 2)
+        self.assertNotIn('EXISTS', sql)
+        self.assertNotIn('JOIN', sql)
+
+        url = reverse('api:v1:builds:drone-list')
+        for params, count in (({'camera__fov_min': 100}, 1), ({'camera__fov_max': 100}, 1),
+                              ({'camera__fov_min': 80, 'camera__fov_max': 130}, 2), ({'camera__fov_min': 130}, 0)):
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.data.get('count'), count)
+
+    def test_list_drone_keyset(self):
+        for i in range(45):
+            mixer.blend(Drone, manufacturer=None if i % 3 else f'Manufacturer{i % 2}', model=f'Drone{i % 5}{i}')
+        expected = [drone.id for drone in sorted(
+            Drone.objects.all(), key=lambda drone: (drone.manufacturer is None, drone.manufacturer, drone.model))]
+
+        url = reverse('api:v1:builds:drone-list')
+        response = self.client.get(url, {'cursor': ''})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('count', response.data)
+        self.assertIsNone(response.data['previous'])
+        ids = [drone['id'] for drone in response.data['results']]
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data['next'])
+        ids += [drone['id'] for drone in response.data['results']]
+        self.assertEqual(ids, expected)
+
+        response = self.client.get(response.data['previous'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([drone['id'] for drone in response.data['results']], expected[:len(response.data['results'])])
+        self.assertIsNone(response.data['previous'])
+
+    def test_list_drone_keyset_count(self):
+        url = reverse('api:v1:builds:drone-list')
+        response = self.client.get(url, {'cursor': '', 'count': 'true'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], Drone.objects.count())
+
+        response = self.client.get(url, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(API_CACHE_TIMEOUT=0)
+    def test_list_drone_keyset_not_modified_without_count(self):
+        url = reverse('api:v1:builds:drone-list')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, {'cursor': ''})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any('COUNT(' in query['sql'] for query in context.captured_queries))
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, {'cursor': ''}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+
+        self.drone2.delete()
+        response = self.client.get(url, {'cursor': ''}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([drone['id'] for drone in response.data['results']], [self.drone1.id])
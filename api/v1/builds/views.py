@@ -1,16 +1,75 @@
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
+from api.mixins import CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin
 from api.v1.builds.filters import DroneFilter
-from api.v1.builds.serializers import DroneSerializer
+from api.v1.filters import RankedSearchFilter
+from api.v1.builds.querysets import DRONE_EAGER_LOADING, DRONE_OVERVIEW_EAGER_LOADING
+from api.v1.builds.serializers import (BuildOptimizerQuerySerializer, BuildPartsSerializer, DroneOverviewSerializer,
+                                      DroneSerializer)
+from api.v1.pagination import KeysetPagination
+from builds.compatibility import DRONE_PARTS, compatibility_engine
+from builds.metrics import build_metrics
 from builds.models import Drone
+from builds.optimizer import build_optimizer
 
 
-class DroneAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
-                        viewsets.GenericViewSet):
+class DroneAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
     permission_classes = ()
     serializer_class = DroneSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Drone.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Drone.objects.all()
+    eager_loading = DRONE_EAGER_LOADING
     filterset_class = DroneFilter
     search_fields = ['model', 'manufacturer']
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return DroneOverviewSerializer
+        return super().get_serializer_class()
+
+    def get_eager_loading(self):
+        if self.action == 'list':
+            return DRONE_OVERVIEW_EAGER_LOADING
+        if self.action == 'retrieve':
+            return super().get_eager_loading()
+        return {}
+
+    def get_only_fields(self, model, fields):
+        only_fields = super().get_only_fields(model, fields)
+        if 'metrics' in fields:
+            only_fields.update(DRONE_PARTS)
+        return only_fields
+
+    @action(detail=True)
+    def compatibility(self, request, pk=None):
+        issues = compatibility_engine.check_drone(self.get_object())
+        return Response({
+            'compatible': not issues,
+            'issues': [{'rule': issue.rule, 'component_types': issue.component_types, 'message': issue.message}
+                       for issue in issues],
+        })
+
+    @action(detail=False)
+    def optimize(self, request):
+        """
+        Top builds by ``objective`` under ``max_weight`` grams, searched over
+        the whole catalog. See ``BuildOptimizerQuerySerializer`` for the
+        parameters.
+        """
+        query = BuildOptimizerQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = dict(query.validated_data)
+        options = {name: params.pop(name) for name in ('max_weight', 'objective', 'limit') if name in params}
+        return Response({'results': build_optimizer.optimize(parts=params, **options)})
+
+    @action(detail=False, methods=['post'])
+    def metrics(self, request):
+        """Metrics of an ad-hoc build, posted as part ids (see ``BuildPartsSerializer``)."""
+        parts = BuildPartsSerializer(data=request.data)
+        parts.is_valid(raise_exception=True)
+        return Response(build_metrics.get(parts.validated_data))
@@ -0,0 +1,197 @@
+from collections import defaultdict
+from types import SimpleNamespace
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import F
+from django.db.models.fields.related_descriptors import ManyToManyDescriptor, ReverseManyToOneDescriptor
+from rest_framework import serializers
+from rest_framework.fields import ModelField
+
+PARENT = '_compiled_parent'
+
+
+class NotCompilable(Exception):
+    """The serializer uses a field the compiled path cannot reproduce."""
+
+
+class Column:
+    """A model column mapped through the DRF field's own ``to_representation``."""
+
+    def __init__(self, field, model_field):
+        self.column = model_field.attname
+        if isinstance(field, ModelField):
+            self.represent_value = lambda value: field.to_representation(SimpleNamespace(**{self.column: value}))
+        elif isinstance(model_field, models.FileField):
+            self.represent_value = lambda value: field.to_representation(
+                model_field.attr_class(None, model_field, value))
+        else:
+            self.represent_value = lambda value: None if value is None else field.to_representation(value)
+
+    @property
+    def columns(self):
+        return [self.column]
+
+    def load(self, rows):
+        pass
+
+    def represent(self, row):
+        return self.represent_value(row[self.column])
+
+
+class PrimaryKey:
+    """A forward relation rendered as its primary key, read from the ``<name>_id`` column."""
+
+    def __init__(self, model_field):
+        self.column = model_field.attname
+
+    @property
+    def columns(self):
+        return [self.column]
+
+    def load(self, rows):
+        pass
+
+    def represent(self, row):
+        return row[self.column]
+
+
+class Related:
+    """
+    A nested serializer on a forward foreign key. Its columns are read through
+    the join in the parent's ``.values()`` query, like select_related().
+    """
+
+    def __init__(self, child, model_field):
+        self.child = child
+        self.column = model_field.attname
+        self.prefix = f'{model_field.name}__'
+
+    @property
+    def columns(self):
+        return [self.column, *(f'{self.prefix}{column}' for column in self.child.columns)]
+
+    def load(self, rows):
+        related_rows = {}
+        for row in rows:
+            key = row[self.column]
+            if key is not None and key not in related_rows:
+                related_rows[key] = {column: row[f'{self.prefix}{column}'] for column in self.child.columns}
+        self.data = dict(zip(related_rows, self.child.to_representation(list(related_rows.values()))))
+
+    def represent(self, row):
+        key = row[self.column]
+        return None if key is None else self.data[key]
+
+
+class ManyRelated:
+    """
+    A to-many relation (reverse foreign key or many-to-many), loaded with one
+    query filtered on the parent keys, the same query prefetch_related() runs.
+    """
+
+    def __init__(self, child, queryset, lookup):
+        self.child = child
+        self.queryset = queryset
+        self.lookup = lookup
+
+    @property
+    def columns(self):
+        return ['pk']
+
+    def load(self, rows):
+        queryset = self.queryset.filter(**{f'{self.lookup}__in': {row['pk'] for row in rows}})
+        self.data = defaultdict(list)
+        for row, data in self.child.fetch(queryset, **{PARENT: F(self.lookup)}):
+            self.data[row[PARENT]].append(data)
+
+    def represent(self, row):
+        return self.data.get(row['pk'], [])
+
+
+class PrimaryKeys:
+    """Stand-in child for a collapsed to-many relation: renders the related keys."""
+
+    def fetch(self, queryset, **expressions):
+        return [(row, row['pk']) for row in queryset.values('pk', **expressions)]
+
+
+class CompiledSerializer:
+    """
+    Read-only serialization straight from ``.values()`` rows.
+
+    The field mappers are compiled once from a bound serializer, so the output
+    has the same keys, order and values as ``serializer.data`` without
+    building model instances or walking DRF's field machinery per row. Every
+    relation costs a single query for the whole page, like prefetch_related().
+
+    Raises ``NotCompilable`` for fields that need a model instance, such as
+    ``SerializerMethodField``.
+    """
+
+    def __init__(self, serializer):
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+        self.model = serializer.Meta.model
+        self.fields = [(name, self.compile_field(field))
+                       for name, field in serializer.fields.items() if not field.write_only]
+
+    def compile_field(self, field):
+        source = field.source
+        if not source or source == '*' or '.' in source:
+            raise NotCompilable(f'{field.field_name}: unsupported source {source!r}')
+
+        if isinstance(field, serializers.ListSerializer):
+            return self.compile_many(source, CompiledSerializer(field.child))
+        if isinstance(field, serializers.ManyRelatedField):
+            if not isinstance(field.child_relation, serializers.PrimaryKeyRelatedField):
+                raise NotCompilable(f'{field.field_name}: unsupported relation')
+            return self.compile_many(source, PrimaryKeys())
+
+        try:
+            model_field = self.model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise NotCompilable(f'{field.field_name}: {source!r} is not a model field')
+        if not model_field.concrete:
+            raise NotCompilable(f'{field.field_name}: {source!r} is not a column')
+
+        if isinstance(field, serializers.BaseSerializer):
+            return Related(CompiledSerializer(field), model_field)
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+            return PrimaryKey(model_field)
+        if isinstance(field, (serializers.RelatedField, serializers.SerializerMethodField)) \
+                or model_field.is_relation:
+            raise NotCompilable(f'{field.field_name}: unsupported field {type(field).__name__}')
+        return Column(field, model_field)
+
+    def compile_many(self, source, child):
+        descriptor = getattr(self.model, source, None)
+        if isinstance(descriptor, ManyToManyDescriptor) and not descriptor.reverse:
+            related_model = descriptor.field.related_model
+            lookup = descriptor.field.related_query_name()
+        elif isinstance(descriptor, ReverseManyToOneDescriptor) and not isinstance(descriptor, ManyToManyDescriptor):
+            related_model = descriptor.field.model
+            lookup = descriptor.field.name
+        else:
+            raise NotCompilable(f'{source!r} is not a to-many relation')
+        return ManyRelated(child, related_model._default_manager.all(), lookup)
+
+    @property
+    def columns(self):
+        columns = {'pk'}
+        for _name, node in self.fields:
+            columns.update(node.columns)
+        return columns
+
+    def values(self, queryset, *columns):
+        """The ``.values()`` queryset the compiled fields read from, plus any extra ``columns``."""
+        return queryset.prefetch_related(None).values(*self.columns.union(columns))
+
+    def fetch(self, queryset, **expressions):
+        rows = list(queryset.values(*self.columns, **expressions))
+        return list(zip(rows, self.to_representation(rows)))
+
+    def to_representation(self, rows):
+        for _name, node in self.fields:
+            node.load(rows)
+        return [{name: node.represent(row) for name, node in self.fields} for row in rows]
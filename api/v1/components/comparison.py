@@ -0,0 +1,217 @@
+from django.db import models
+from django.db.models import Prefetch
+from django.utils.text import capfirst
+
+from api.v1.components.querysets import (ANTENNA_EAGER_LOADING, CAMERA_EAGER_LOADING, FRAME_EAGER_LOADING,
+                                         MOTOR_EAGER_LOADING, PROPELLER_EAGER_LOADING, RECEIVER_EAGER_LOADING,
+                                         SINGLE_FLIGHT_CONTROLLER_EAGER_LOADING,
+                                         SINGLE_SPEED_CONTROLLER_EAGER_LOADING, STACK_EAGER_LOADING,
+                                         TRANSMITTER_EAGER_LOADING)
+from api.v1.utils import eager_load
+from components.models import (Antenna, Camera, FlightController, Frame, Motor, Propeller, Receiver,
+                               SpeedController, Stack, Transmitter)
+
+MAX_PARTS = 50
+
+# Serializer fields of the eager-loading plans that the comparison does not show
+SKIPPED_RELATIONS = ('images', 'documents', 'stacks')
+
+# Component type -> (model, eager-loading plan of the relations compared)
+COMPARISONS = {
+    'antenna': (Antenna, ANTENNA_EAGER_LOADING),
+    'camera': (Camera, CAMERA_EAGER_LOADING),
+    'frame': (Frame, FRAME_EAGER_LOADING),
+    'motor': (Motor, MOTOR_EAGER_LOADING),
+    'propeller': (Propeller, PROPELLER_EAGER_LOADING),
+    'receiver': (Receiver, RECEIVER_EAGER_LOADING),
+    'stack': (Stack, STACK_EAGER_LOADING),
+    'flight_controller': (FlightController, SINGLE_FLIGHT_CONTROLLER_EAGER_LOADING),
+    'speed_controller': (SpeedController, SINGLE_SPEED_CONTROLLER_EAGER_LOADING),
+    'transmitter': (Transmitter, TRANSMITTER_EAGER_LOADING),
+}
+
+NUMERIC_FIELDS = (models.IntegerField, models.FloatField, models.DecimalField)
+SKIPPED_FIELDS = ('created_at', 'updated_at')
+
+
+def get_compared_plan(plan):
+    return {field: lookups for field, lookups in plan.items() if field not in SKIPPED_RELATIONS}
+
+
+def get_relation_name(lookup):
+    return lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+
+
+def get_display_properties(model):
+    """``get_*`` properties of the model, by name, e.g. ``get_kv_per_volt`` formatted as ``KV1900``."""
+    properties = {}
+    for klass in reversed(model.__mro__):
+        for name, attribute in vars(klass).items():
+            if name.startswith('get_') and isinstance(attribute, property):
+                properties[name] = attribute
+    return properties
+
+
+def get_label(name, prop=None):
+    description = getattr(prop.fget, 'short_description', None) if prop is not None else None
+    return str(description or capfirst(name.replace('_', ' ')))
+
+
+def is_compared_field(field, related=()):
+    """Concrete fields except keys, timestamps and long texts; foreign keys only when ``related`` are loaded."""
+    if not field.concrete or field.primary_key or field.name in SKIPPED_FIELDS:
+        return False
+    if field.is_relation:
+        return field.many_to_one and field.name in related
+    return field.get_internal_type() != 'TextField'
+
+
+class Column:
+    """How one field or ``get_*`` property of a model is read and formatted."""
+
+    def __init__(self, model, field=None, prop_name=None):
+        properties = get_display_properties(model)
+        self.field = field
+        if field is not None:
+            self.name = field.name
+            self.prop_name = f'get_{field.name}' if f'get_{field.name}' in properties else None
+            self.label = get_label(str(field.verbose_name))
+        else:
+            self.name = prop_name[len('get_'):]
+            self.prop_name = prop_name
+            self.label = get_label(self.name, properties[prop_name])
+        self.numeric = isinstance(field, NUMERIC_FIELDS) and not field.choices
+
+    def get_value(self, obj):
+        if self.field is None:
+            return None
+        return getattr(obj, self.field.attname)
+
+    def get_display(self, obj):
+        if self.field is not None and self.get_value(obj) is None:
+            return None
+        if self.prop_name is not None:
+            display = getattr(obj, self.prop_name)
+        elif self.field.is_relation:
+            display = getattr(obj, self.field.name)
+        elif self.field.choices:
+            display = obj._get_FIELD_display(self.field)
+        else:
+            display = getattr(obj, self.field.attname)
+        return None if display is None else str(display)
+
+
+def get_columns(model, related=()):
+    """
+    Compared fields of the model, then its ``get_*`` properties that are not
+    the display of one field. ``related`` names the foreign keys loaded with
+    the rows.
+    """
+    columns = [Column(model, field) for field in model._meta.get_fields() if is_compared_field(field, related)]
+    shown = {column.prop_name for column in columns}
+    columns.extend(Column(model, prop_name=name) for name in get_display_properties(model) if name not in shown)
+    return columns
+
+
+def get_highlights(part_ids, values):
+    """
+    Ids of the parts holding the lowest and the highest value. A part with
+    variants counts with its lowest value for the minimum and its highest for
+    the maximum. Nothing is highlighted when every part has the same value.
+    """
+    ranges = {}
+    for pk, value in zip(part_ids, values):
+        numbers = [number for number in (value if isinstance(value, list) else [value]) if number is not None]
+        if numbers:
+            ranges[pk] = (min(numbers), max(numbers))
+    if not ranges:
+        return [], []
+    lowest = min(low for low, _high in ranges.values())
+    highest = max(high for _low, high in ranges.values())
+    if lowest == highest:
+        return [], []
+    return ([pk for pk, (low, _high) in ranges.items() if low == lowest],
+            [pk for pk, (_low, high) in ranges.items() if high == highest])
+
+
+def get_row(column, part_ids, values, displays, prefix=''):
+    row = {
+        'field': f'{prefix}{column.name}',
+        'label': column.label,
+        'values': values,
+        'display': displays,
+    }
+    if column.numeric:
+        row['min'], row['max'] = get_highlights(part_ids, values)
+    return row
+
+
+class Comparison:
+    """
+    Side-by-side attribute table of parts of one component type.
+
+    Parts are loaded with one query, plus one per prefetched relation of the
+    type's eager-loading plan (details, many-to-many lookups), whatever the
+    number of parts. Every row holds one value per part, in the requested
+    order: the raw ``values``, ``display`` strings formatted by the model's
+    ``get_*`` properties where it has one, and for numeric fields the ids of
+    the parts with the ``min`` and ``max`` value. Variants (details) hold a
+    list per part.
+    """
+
+    def __init__(self, component_type):
+        self.component_type = component_type
+        self.model, plan = COMPARISONS[component_type]
+        self.plan = get_compared_plan(plan)
+
+    def get_parts(self, pks):
+        parts = eager_load(self.model.objects.filter(pk__in=pks), self.plan).in_bulk()
+        return [parts[pk] for pk in dict.fromkeys(pks) if pk in parts]
+
+    def get_relations(self):
+        """Relations of the plan, each with the queryset it is prefetched with (``None`` when joined)."""
+        relations = []
+        for lookups in self.plan.values():
+            lookup = lookups[0]
+            field = self.model._meta.get_field(get_relation_name(lookup))
+            relations.append((field, lookup.queryset if isinstance(lookup, Prefetch) else None))
+        return relations
+
+    def compare(self, pks):
+        parts = self.get_parts(pks)
+        part_ids = [part.pk for part in parts]
+        rows = [get_row(column, part_ids, [column.get_value(part) for part in parts],
+                        [column.get_display(part) for part in parts])
+                for column in get_columns(self.model)]
+
+        for field, queryset in self.get_relations():
+            label = get_label(str(getattr(field, 'verbose_name', field.name)))
+            if field.many_to_one or field.one_to_one:
+                related = [getattr(part, field.name) for part in parts]
+                rows.append({'field': field.name, 'label': label,
+                             'values': [obj.pk if obj is not None else None for obj in related],
+                             'display': [str(obj) if obj is not None else None for obj in related]})
+                continue
+
+            related = [list(getattr(part, field.name).all()) for part in parts]
+            if field.many_to_many:
+                rows.append({'field': field.name, 'label': label,
+                             'values': [[obj.pk for obj in objs] for objs in related],
+                             'display': [[str(obj) for obj in objs] for objs in related]})
+                continue
+
+            # Variants: one row per compared field of the detail model, with a list per part
+            joined = queryset.query.select_related if isinstance(queryset.query.select_related, dict) else {}
+            for column in get_columns(field.related_model, related=joined):
+                if column.field is not None and column.field.remote_field is field.remote_field:
+                    continue
+                rows.append(get_row(column, part_ids,
+                                    [[column.get_value(obj) for obj in objs] for objs in related],
+                                    [[column.get_display(obj) for obj in objs] for objs in related],
+                                    prefix=f'{field.name}.'))
+
+        return {
+            'type': self.component_type,
+            'parts': [{'id': part.pk, 'name': str(part)} for part in parts],
+            'rows': rows,
+        }
@@ -1,6 +1,8 @@
 from .antenna_filters import AntennaFilter
 from .camera_filters import CameraFilter
+from .frame_filters import FrameFilter
 from .motor_filters import MotorFilter
+from .propeller_filters import PropellerFilter
 from .receiver_filters import ReceiverFilter
 from .stack_filters import SpeedControllerFilter, FlightControllerFilter, StackFilter
 from .transmitter_filters import TransmitterFilter
\ No newline at end of file
@@ -1,15 +1,19 @@
 from django_filters import rest_framework as filters
 
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
 from components.models import Antenna, AntennaConnector
 
 
-class AntennaFilter(filters.FilterSet):
+class AntennaFilter(ExistsFilterSet):
     center_frequency = filters.RangeFilter(field_name='center_frequency')
     swr = filters.RangeFilter(field_name='swr',)
     gain = filters.RangeFilter(field_name='gain')
     radiation = filters.RangeFilter(field_name='radiation')
     weight = filters.RangeFilter(field_name='details__weight')
 
+    compatible_with_transmitter = CompatibleWithFilter('antenna', 'transmitter')
+    compatible_with_receiver = CompatibleWithFilter('antenna', 'receiver')
+
     class Meta:
         model = Antenna
         fields = ['manufacturer', 'center_frequency', 'bandwidth_min', 'bandwidth_max',
@@ -17,4 +21,6 @@ class AntennaFilter(filters.FilterSet):
                   'type__type', 'type__direction', 'type__polarization',
                   'details__connector_type__type', 'details__angle_type',
 
-                  'weight']
+                  'weight',
+
+                  'compatible_with_transmitter', 'compatible_with_receiver']
@@ -1,9 +1,10 @@
 from django_filters import rest_framework as filters
 
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
 from components.models import VideoFormat, Camera
 
 
-class CameraFilter(filters.FilterSet):
+class CameraFilter(ExistsFilterSet):
     fov = filters.RangeFilter(field_name='fov')
     weight = filters.RangeFilter(field_name='weight')
 
@@ -14,8 +15,12 @@ class CameraFilter(filters.FilterSet):
         conjoined=True,
     )
 
+    compatible_with_frame = CompatibleWithFilter('camera', 'frame')
+
     class Meta:
         model = Camera
         fields = ['manufacturer', 'voltage_min', 'voltage_max',
                   'ratio', 'output_type', 'formats', 'light_sens',
-                  'fov', 'weight']
+                  'fov', 'weight',
+
+                  'compatible_with_frame']
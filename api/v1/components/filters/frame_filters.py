@@ -0,0 +1,19 @@
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
+from components.models import Frame
+
+
+class FrameFilter(ExistsFilterSet):
+    compatible_with_motor = CompatibleWithFilter('frame', 'motor')
+    compatible_with_propeller = CompatibleWithFilter('frame', 'propeller')
+    compatible_with_camera = CompatibleWithFilter('frame', 'camera')
+    compatible_with_transmitter = CompatibleWithFilter('frame', 'transmitter')
+
+    class Meta:
+        model = Frame
+        fields = ['manufacturer', 'prop_size', 'material', 'configuration',
+                  'camera_details__camera_mount_height', 'camera_details__camera_mount_width',
+                  'motor_details__motor_mount_height', 'motor_details__motor_mount_width',
+                  'vtx_details__vtx_mount_height', 'vtx_details__vtx_mount_width',
+
+                  'compatible_with_motor', 'compatible_with_propeller',
+                  'compatible_with_camera', 'compatible_with_transmitter', ]
@@ -1,15 +1,19 @@
 from django_filters import rest_framework as filters
 
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
 from components.models import Motor
 
 
-class MotorFilter(filters.FilterSet):
+class MotorFilter(ExistsFilterSet):
     max_power = filters.RangeFilter(field_name='details__max_power')
     kv_per_volt = filters.RangeFilter(field_name='details__kv_per_volt')
     peak_current = filters.RangeFilter(field_name='details__peak_current')
     idle_current = filters.RangeFilter(field_name='details__idle_current')
     weight = filters.RangeFilter(field_name='details__weight')
 
+    compatible_with_frame = CompatibleWithFilter('motor', 'frame')
+    compatible_with_battery = CompatibleWithFilter('motor', 'battery')
+
     class Meta:
         model = Motor
         fields = ['manufacturer', 'stator_diameter', 'stator_height',
@@ -20,5 +24,6 @@ class MotorFilter(filters.FilterSet):
                   'details__voltage__min_cells', 'details__voltage__max_cells',
                   'details__voltage__type',
 
-                  'weight'
-                  ]
+                  'weight',
+
+                  'compatible_with_frame', 'compatible_with_battery']
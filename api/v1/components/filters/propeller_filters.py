@@ -0,0 +1,12 @@
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
+from components.models import Propeller
+
+
+class PropellerFilter(ExistsFilterSet):
+    compatible_with_frame = CompatibleWithFilter('propeller', 'frame')
+
+    class Meta:
+        model = Propeller
+        fields = ['manufacturer', 'blade_count',
+
+                  'compatible_with_frame']
@@ -1,9 +1,10 @@
 from django_filters import rest_framework as filters
 
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
 from components.models import Receiver, AntennaConnector, ReceiverProtocolType
 
 
-class ReceiverFilter(filters.FilterSet):
+class ReceiverFilter(ExistsFilterSet):
     frequency = filters.RangeFilter(field_name='details__frequency')
     telemetry_power = filters.RangeFilter(field_name='details__telemetry_power')
     weight = filters.RangeFilter(field_name='weight')
@@ -22,8 +23,12 @@ class ReceiverFilter(filters.FilterSet):
         conjoined=True,
     )
 
+    compatible_with_antenna = CompatibleWithFilter('receiver', 'antenna')
+
     class Meta:
         model = Receiver
         fields = ['manufacturer', 'processor',
                   'antenna_connectors', 'protocols',
-                  'frequency', 'telemetry_power', 'weight']
+                  'frequency', 'telemetry_power', 'weight',
+
+                  'compatible_with_antenna']
@@ -1,10 +1,11 @@
 from django_filters import rest_framework as filters
 
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
 from components.models import FlightController, Stack, SpeedController, SpeedControllerProtocol, \
     SpeedControllerFirmware, FlightControllerFirmware
 
 
-class StackFilter(filters.FilterSet):
+class StackFilter(ExistsFilterSet):
     gyro__max_freq = filters.RangeFilter(field_name='flight_controller__gyro__max_freq')
 
     cont_current = filters.RangeFilter(field_name='speed_controller__cont_current')
@@ -31,6 +32,8 @@ class StackFilter(filters.FilterSet):
         conjoined=True,
     )
 
+    compatible_with_battery = CompatibleWithFilter('stack', 'battery')
+
     class Meta:
         model = Stack
         fields = ['manufacturer', 'flight_controller__manufacturer', 'speed_controller__manufacturer',
@@ -50,10 +53,11 @@ class StackFilter(filters.FilterSet):
                   'cont_current', 'burst_current',
                   'speed_controller_firmwares', 'speed_controller_protocols',
                   'speed_controller__mount_length', 'speed_controller__mount_width',
-                  ]
+
+                  'compatible_with_battery']
 
 
-class FlightControllerFilter(filters.FilterSet):
+class FlightControllerFilter(ExistsFilterSet):
     gyro__max_freq = filters.RangeFilter(field_name='gyro__max_freq')
     in_stack = filters.BooleanFilter(field_name='stack', lookup_expr='isnull', exclude=True)
     weight = filters.RangeFilter(field_name='weight')
@@ -65,6 +69,8 @@ class FlightControllerFilter(filters.FilterSet):
         conjoined=True,
     )
 
+    compatible_with_battery = CompatibleWithFilter('flight_controller', 'battery')
+
     class Meta:
         model = FlightController
         fields = ['manufacturer',
@@ -78,11 +84,12 @@ class FlightControllerFilter(filters.FilterSet):
                   'voltage__min_cells', 'voltage__max_cells',
                   'firmwares',
 
-                  'in_stack', 'weight'
-                  ]
+                  'in_stack', 'weight',
 
+                  'compatible_with_battery']
 
-class SpeedControllerFilter(filters.FilterSet):
+
+class SpeedControllerFilter(ExistsFilterSet):
     cont_current = filters.RangeFilter(field_name='cont_current')
     burst_current = filters.RangeFilter(field_name='burst_current')
     in_stack = filters.BooleanFilter(field_name='stack', lookup_expr='isnull', exclude=True)
@@ -102,6 +109,8 @@ class SpeedControllerFilter(filters.FilterSet):
         conjoined=True,
     )
 
+    compatible_with_battery = CompatibleWithFilter('speed_controller', 'battery')
+
     class Meta:
         model = SpeedController
         fields = ['manufacturer',
@@ -113,5 +122,6 @@ class SpeedControllerFilter(filters.FilterSet):
 
                   'firmwares', 'protocols',
 
-                  'in_stack', 'weight'
-                  ]
+                  'in_stack', 'weight',
+
+                  'compatible_with_battery']
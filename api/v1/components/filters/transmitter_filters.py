@@ -1,9 +1,10 @@
 from django_filters import rest_framework as filters
 
+from api.v1.filters import CompatibleWithFilter, ExistsFilterSet
 from components.models import OutputPower, Transmitter, VideoFormat, AntennaConnector
 
 
-class TransmitterFilter(filters.FilterSet):
+class TransmitterFilter(ExistsFilterSet):
     output_voltage = filters.RangeFilter(field_name='output_voltage')
     channels_quantity = filters.RangeFilter(field_name='channels_quantity')
     max_power = filters.RangeFilter(field_name='max_power')
@@ -28,9 +29,14 @@ class TransmitterFilter(filters.FilterSet):
         conjoined=True,
     )
 
+    compatible_with_frame = CompatibleWithFilter('transmitter', 'frame')
+    compatible_with_antenna = CompatibleWithFilter('transmitter', 'antenna')
+
     class Meta:
         model = Transmitter
         fields = ['manufacturer', 'input_voltage_min', 'input_voltage_max', 'output_voltage',
                   'channels_quantity', 'output', 'max_power', 'microphone',
                   'output_powers', 'antenna_connectors', 'formats',
-                  'weight']
+                  'weight',
+
+                  'compatible_with_frame', 'compatible_with_antenna']
@@ -0,0 +1,101 @@
+from django.db.models import Prefetch
+
+from api.v1.utils import eager_load, nest_eager_loading
+from components.models import (AntennaDetail, CameraDetail, FrameCameraDetail, FrameMotorDetail, FrameVTXDetail,
+                               MotorDetail, ReceiverDetail, Stack, VideoFormat, ReceiverProtocolType,
+                               AntennaConnector, OutputPower, FlightControllerFirmware, SpeedControllerFirmware,
+                               SpeedControllerProtocol)
+from documents.models import (AntennaDocument, CameraDocument, FrameDocument, MotorDocument, PropellerDocument,
+                              ReceiverDocument, StackDocument, TransmitterDocument, FlightControllerDocument,
+                              SpeedControllerDocument)
+from galleries.models import (AntennaGallery, CameraGallery, FrameGallery, MotorGallery, PropellerGallery,
+                              ReceiverGallery, StackGallery, TransmitterGallery, FlightControllerGallery,
+                              SpeedControllerGallery)
+
+# Eager-loading plans for the component read serializers.
+# Each plan maps a serializer field to the lookups it needs: strings are joined
+# with select_related(), Prefetch objects are loaded with prefetch_related().
+
+ANTENNA_EAGER_LOADING = {
+    'type': ['type'],
+    'details': [Prefetch('details', queryset=AntennaDetail.objects.select_related('connector_type'))],
+    'images': [Prefetch('images', queryset=AntennaGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=AntennaDocument.objects.all())],
+}
+
+CAMERA_EAGER_LOADING = {
+    'video_formats': [Prefetch('video_formats', queryset=VideoFormat.objects.all())],
+    'details': [Prefetch('details', queryset=CameraDetail.objects.all())],
+    'images': [Prefetch('images', queryset=CameraGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=CameraDocument.objects.all())],
+}
+
+FRAME_EAGER_LOADING = {
+    'camera_details': [Prefetch('camera_details', queryset=FrameCameraDetail.objects.all())],
+    'motor_details': [Prefetch('motor_details', queryset=FrameMotorDetail.objects.all())],
+    'vtx_details': [Prefetch('vtx_details', queryset=FrameVTXDetail.objects.all())],
+    'images': [Prefetch('images', queryset=FrameGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=FrameDocument.objects.all())],
+}
+
+MOTOR_EAGER_LOADING = {
+    'details': [Prefetch('details', queryset=MotorDetail.objects.select_related('voltage'))],
+    'images': [Prefetch('images', queryset=MotorGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=MotorDocument.objects.all())],
+}
+
+PROPELLER_EAGER_LOADING = {
+    'images': [Prefetch('images', queryset=PropellerGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=PropellerDocument.objects.all())],
+}
+
+RECEIVER_EAGER_LOADING = {
+    'details': [Prefetch('details', queryset=ReceiverDetail.objects.all())],
+    'protocols': [Prefetch('protocols', queryset=ReceiverProtocolType.objects.all())],
+    'antenna_connectors': [Prefetch('antenna_connectors', queryset=AntennaConnector.objects.all())],
+    'images': [Prefetch('images', queryset=ReceiverGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=ReceiverDocument.objects.all())],
+}
+
+TRANSMITTER_EAGER_LOADING = {
+    'output_powers': [Prefetch('output_powers', queryset=OutputPower.objects.all())],
+    'video_formats': [Prefetch('video_formats', queryset=VideoFormat.objects.all())],
+    'antenna_connectors': [Prefetch('antenna_connectors', queryset=AntennaConnector.objects.all())],
+    'images': [Prefetch('images', queryset=TransmitterGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=TransmitterDocument.objects.all())],
+}
+
+SINGLE_FLIGHT_CONTROLLER_EAGER_LOADING = {
+    'gyro': ['gyro'],
+    'voltage': ['voltage'],
+    'firmwares': [Prefetch('firmwares', queryset=FlightControllerFirmware.objects.all())],
+    'images': [Prefetch('images', queryset=FlightControllerGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=FlightControllerDocument.objects.all())],
+}
+
+SINGLE_SPEED_CONTROLLER_EAGER_LOADING = {
+    'voltage': ['voltage'],
+    'firmwares': [Prefetch('firmwares', queryset=SpeedControllerFirmware.objects.all())],
+    'protocols': [Prefetch('protocols', queryset=SpeedControllerProtocol.objects.all())],
+    'images': [Prefetch('images', queryset=SpeedControllerGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=SpeedControllerDocument.objects.all())],
+}
+
+STACK_EAGER_LOADING = {
+    'flight_controller': ['flight_controller',
+                          *nest_eager_loading('flight_controller', SINGLE_FLIGHT_CONTROLLER_EAGER_LOADING)],
+    'speed_controller': ['speed_controller',
+                         *nest_eager_loading('speed_controller', SINGLE_SPEED_CONTROLLER_EAGER_LOADING)],
+    'images': [Prefetch('images', queryset=StackGallery.objects.all())],
+    'documents': [Prefetch('documents', queryset=StackDocument.objects.all())],
+}
+
+FLIGHT_CONTROLLER_EAGER_LOADING = {
+    **SINGLE_FLIGHT_CONTROLLER_EAGER_LOADING,
+    'stacks': [Prefetch('stack_set', queryset=eager_load(Stack.objects.all(), STACK_EAGER_LOADING))],
+}
+
+SPEED_CONTROLLER_EAGER_LOADING = {
+    **SINGLE_SPEED_CONTROLLER_EAGER_LOADING,
+    'stacks': [Prefetch('stack_set', queryset=eager_load(Stack.objects.all(), STACK_EAGER_LOADING))],
+}
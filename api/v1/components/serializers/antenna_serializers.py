@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from api.v1.documents.serializers import AntennaDocumentReadSerializer
 from api.v1.galleries.serializers import AntennaGalleryReadSerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import Antenna, AntennaDetail, AntennaType, AntennaConnector
 
 
@@ -25,7 +26,7 @@ class AntennaDetailSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class AntennaSerializer(serializers.ModelSerializer):
+class AntennaSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     type = AntennaTypeSerializer(read_only=True)
     images = AntennaGalleryReadSerializer(many=True)
     documents = AntennaDocumentReadSerializer(many=True)
@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from api.v1.documents.serializers import CameraDocumentReadSerializer
 from api.v1.galleries.serializers import CameraGalleryReadSerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import Camera, CameraDetail, VideoFormat
 
 
@@ -19,7 +20,7 @@ class CameraDetailSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class CameraSerializer(serializers.ModelSerializer):
+class CameraSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     video_formats = VideoFormatSerializer(many=True)
     details = CameraDetailSerializer(many=True)
     images = CameraGalleryReadSerializer(many=True)
@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from api.v1.documents.serializers import FrameDocumentReadSerializer
 from api.v1.galleries.serializers import FrameGalleryReadSerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import FrameCameraDetail, FrameMotorDetail, FrameVTXDetail, Frame
 
 
@@ -26,7 +27,7 @@ class FrameVTXDetailSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class FrameSerializer(serializers.ModelSerializer):
+class FrameSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     camera_details = FrameCameraDetailSerializer(many=True)
     motor_details = FrameMotorDetailSerializer(many=True)
     vtx_details = FrameVTXDetailSerializer(many=True)
@@ -35,4 +36,4 @@ class FrameSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Frame
-        fields = '__all__'
+        exclude = ('prop_size_min', 'prop_size_max')
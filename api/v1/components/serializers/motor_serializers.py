@@ -2,6 +2,7 @@ from rest_framework import serializers
 
 from api.v1.documents.serializers import MotorDocumentReadSerializer
 from api.v1.galleries.serializers import MotorGalleryReadSerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import RatedVoltage, MotorDetail, Motor
 
 
@@ -20,7 +21,7 @@ class MotorDetailSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class MotorSerializer(serializers.ModelSerializer):
+class MotorSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     details = MotorDetailSerializer(many=True)
     images = MotorGalleryReadSerializer(many=True)
     documents = MotorDocumentReadSerializer(many=True)
@@ -2,10 +2,11 @@ from rest_framework import serializers
 
 from api.v1.documents.serializers import PropellerDocumentReadSerializer
 from api.v1.galleries.serializers import PropellerGalleryReadSerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import Propeller
 
 
-class PropellerSerializer(serializers.ModelSerializer):
+class PropellerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     images = PropellerGalleryReadSerializer(many=True)
     documents = PropellerDocumentReadSerializer(many=True)
 
@@ -3,6 +3,7 @@ from rest_framework import serializers
 from api.v1.components.serializers import AntennaConnectorSerializer
 from api.v1.documents.serializers import ReceiverDocumentReadSerializer
 from api.v1.galleries.serializers import ReceiverGalleryReadSerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import Motor, ReceiverProtocolType, ReceiverDetail, Receiver
 
 
@@ -20,7 +21,7 @@ class ReceiverDetailSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class ReceiverSerializer(serializers.ModelSerializer):
+class ReceiverSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     details = ReceiverDetailSerializer(many=True)
     protocols = ReceiverProtocolTypeSerializer(many=True)
     antenna_connectors = AntennaConnectorSerializer(many=True)
@@ -5,6 +5,7 @@ from api.v1.documents.serializers import StackDocumentReadSerializer, FlightCont
     SpeedControllerReadDocumentSerializer
 from api.v1.galleries.serializers import StackGalleryReadSerializer, FlightControllerReadGallerySerializer, \
     SpeedControllerReadGallerySerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import (Stack,
                                SpeedController, SpeedControllerProtocol, SpeedControllerFirmware,
                                FlightController, FlightControllerFirmware, Gyro)
@@ -34,73 +35,65 @@ class SpeedControllerProtocolSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class FlightControllerSerializer(serializers.ModelSerializer):
+class SingleFlightControllerSerializer(serializers.ModelSerializer):
     gyro = GyroSerializer(read_only=True)
     voltage = RatedVoltageSerializer(read_only=True)
     firmwares = FlightControllerFirmwareSerializer(many=True, read_only=True)
-    stacks = serializers.SerializerMethodField()
 
     images = FlightControllerReadGallerySerializer(many=True)
     documents = FlightControllerReadDocumentSerializer(many=True)
 
-    def get_stacks(self, obj):
-        stacks = obj.stack_set.all()
-        return StackSerializer(stacks, many=True).data
-
     class Meta:
         model = FlightController
         fields = '__all__'
 
 
-class SingleFlightControllerSerializer(serializers.ModelSerializer):
-    gyro = GyroSerializer(read_only=True)
+class SingleSpeedControllerSerializer(serializers.ModelSerializer):
+    firmwares = SpeedControllerFirmwareSerializer(many=True, read_only=True)
+    protocols = SpeedControllerProtocolSerializer(many=True, read_only=True)
     voltage = RatedVoltageSerializer(read_only=True)
-    firmwares = FlightControllerFirmwareSerializer(many=True, read_only=True)
+    images = SpeedControllerReadGallerySerializer(many=True)
+    documents = SpeedControllerReadDocumentSerializer(many=True)
 
-    images = FlightControllerReadGallerySerializer(many=True)
-    documents = FlightControllerReadDocumentSerializer(many=True)
+    class Meta:
+        model = SpeedController
+        fields = '__all__'
+
+
+class StackSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    flight_controller = SingleFlightControllerSerializer(read_only=True)
+    speed_controller = SingleSpeedControllerSerializer(read_only=True)
+    images = StackGalleryReadSerializer(many=True)
+    documents = StackDocumentReadSerializer(many=True)
 
     class Meta:
-        model = FlightController
+        model = Stack
         fields = '__all__'
 
 
-class SpeedControllerSerializer(serializers.ModelSerializer):
-    firmwares = SpeedControllerFirmwareSerializer(many=True, read_only=True)
-    protocols = SpeedControllerProtocolSerializer(many=True, read_only=True)
+class FlightControllerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    gyro = GyroSerializer(read_only=True)
     voltage = RatedVoltageSerializer(read_only=True)
-    stacks = serializers.SerializerMethodField()
-
-    images = SpeedControllerReadGallerySerializer(many=True)
-    documents = SpeedControllerReadDocumentSerializer(many=True)
+    firmwares = FlightControllerFirmwareSerializer(many=True, read_only=True)
+    stacks = StackSerializer(source='stack_set', many=True, read_only=True)
 
-    def get_stacks(self, obj):
-        stacks = obj.stack_set.all()
-        return StackSerializer(stacks, many=True).data
+    images = FlightControllerReadGallerySerializer(many=True)
+    documents = FlightControllerReadDocumentSerializer(many=True)
 
     class Meta:
-        model = SpeedController
+        model = FlightController
         fields = '__all__'
 
 
-class SingleSpeedControllerSerializer(serializers.ModelSerializer):
+class SpeedControllerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     firmwares = SpeedControllerFirmwareSerializer(many=True, read_only=True)
     protocols = SpeedControllerProtocolSerializer(many=True, read_only=True)
     voltage = RatedVoltageSerializer(read_only=True)
+    stacks = StackSerializer(source='stack_set', many=True, read_only=True)
+
     images = SpeedControllerReadGallerySerializer(many=True)
     documents = SpeedControllerReadDocumentSerializer(many=True)
 
     class Meta:
         model = SpeedController
         fields = '__all__'
-
-
-class StackSerializer(serializers.ModelSerializer):
-    flight_controller = SingleFlightControllerSerializer(read_only=True)
-    speed_controller = SingleSpeedControllerSerializer(read_only=True)
-    images = StackGalleryReadSerializer(many=True)
-    documents = StackDocumentReadSerializer(many=True)
-
-    class Meta:
-        model = Stack
-        fields = '__all__'
@@ -4,6 +4,7 @@ from api.v1.components.serializers import AntennaConnectorSerializer
 from api.v1.components.serializers.camera_serializers import VideoFormatSerializer
 from api.v1.documents.serializers import TransmitterDocumentReadSerializer
 from api.v1.galleries.serializers import TransmitterGalleryReadSerializer
+from api.v1.utils import SparseFieldsetMixin
 from components.models import OutputPower, Transmitter
 
 
@@ -14,7 +15,7 @@ class OutputPowerSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class TransmitterSerializer(serializers.ModelSerializer):
+class TransmitterSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     output_powers = OutputPowerSerializer(many=True)
     video_formats = VideoFormatSerializer(many=True)
     antenna_connectors = AntennaConnectorSerializer(many=True)
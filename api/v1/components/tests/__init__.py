@@ -6,3 +6,5 @@ from .propeller_tests import TestPropellerAPIView
 from .receiver_tests import TestReceiverAPIView
 from .stack_tests import TestStackAPIViews, TestSpeedControllerAPIView, TestFlightControllerAPIView
 from .transmitter_tests import TestTransmitterAPIView
+from .autocomplete_tests import TestAutocompleteAPIView
+from .compare_tests import TestCompareAPIView
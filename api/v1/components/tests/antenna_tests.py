@@ -2,7 +2,7 @@ from mixer.backend.django import mixer
 from rest_framework.reverse import reverse
 
 from api.v1.tests import BaseAPITest
-from components.models import Antenna, AntennaDetail, AntennaType, AntennaConnector
+from components.models import Antenna, AntennaDetail, AntennaType, AntennaConnector, Transmitter
 
 
 class TestAntennaAPIView(BaseAPITest):
@@ -29,6 +29,27 @@ class TestAntennaAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Antenna.objects.all().count())
 
+    def test_filter_antenna_compatible(self):
+        connector = mixer.blend(AntennaConnector, type='SMA')
+        mixer.blend(AntennaDetail, antenna=self.antenna1, connector_type=connector)
+        transmitter = mixer.blend(Transmitter)
+        transmitter.antenna_connectors.add(connector)
+
+        url = reverse('api:v1:components:antenna-list')
+        response = self.client.get(url, {'compatible_with_transmitter': transmitter.id})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([antenna['id'] for antenna in response.data['results']], [self.antenna1.id])
+
+        response = self.client.get(reverse('api:v1:components:transmitter-list'),
+                                   {'compatible_with_antenna': self.antenna2.id})
+        self.assertEqual(response.data['count'], 0)
+
+    def test_list_antenna_num_queries(self):
+        url = reverse('api:v1:components:antenna-list')
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_antenna(self):
         url = reverse('api:v1:components:antenna-detail', args={self.antenna1.id})
         response = self.client.get(url)
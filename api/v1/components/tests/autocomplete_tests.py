@@ -0,0 +1,65 @@
+from mixer.backend.django import mixer
+from rest_framework.reverse import reverse
+
+from api.v1.tests import BaseAPITest
+from components.cache import bump_generation
+from components.models import Antenna, Motor
+from search.autocomplete import autocomplete_index
+
+
+class TestAutocompleteAPIView(BaseAPITest):
+
+    def setUp(self):
+        autocomplete_index.clear()
+        mixer.register(Motor, description='TestMotor')
+        self.motor = mixer.blend(Motor, manufacturer='T-Motor', model='Velox V2207', stator_diameter='22',
+                                 stator_height='07')
+        self.antenna = mixer.blend(Antenna, manufacturer='TrueRC', model='Singularity')
+        self.url = reverse('api:v1:components:autocomplete')
+
+    def get_labels(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [result['label'] for result in response.data['results']]
+
+    def test_autocomplete_across_types(self):
+        response = self.client.get(self.url, {'q': 't'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(result['component_type'], result['id']) for result in response.data['results']],
+                         [('antenna', self.antenna.id), ('motor', self.motor.id)])
+
+    def test_autocomplete_substring_and_stator_size(self):
+        self.assertEqual(self.get_labels({'q': 'elox'}), [str(self.motor)])
+        self.assertEqual(self.get_labels({'q': 'velox 2207'}), [str(self.motor)])
+        self.assertEqual(self.get_labels({'q': 'gular'}), [str(self.antenna)])
+        self.assertEqual(self.get_labels({'q': 'xyz'}), [])
+        self.assertEqual(self.get_labels({'q': ''}), [])
+
+    def test_autocomplete_limit_and_types(self):
+        self.assertEqual(len(self.get_labels({'q': 't', 'limit': 1})), 1)
+        self.assertEqual(self.get_labels({'q': 't', 'types': 'motor'}), [str(self.motor)])
+        response = self.client.get(self.url, {'q': 't', 'types': 'battery'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_autocomplete_without_queries(self):
+        self.get_labels({'q': 'velox'})
+        with self.assertNumQueries(0):
+            self.get_labels({'q': 'single'})
+
+    def test_autocomplete_updated_on_save(self):
+        self.get_labels({'q': 'velox'})
+        self.motor.model = 'Pacer P2306'
+        self.motor.save()
+        self.assertEqual(self.get_labels({'q': 'velox'}), [])
+        self.assertEqual(self.get_labels({'q': 'pacer'}), ['T-Motor Pacer P2306 2207'])
+
+        self.antenna.delete()
+        self.assertEqual(self.get_labels({'q': 'singularity'}), [])
+
+    def test_autocomplete_reloads_changed_types(self):
+        self.get_labels({'q': 'velox'})
+        # Saved by another process: no signal here, only the shared generation moves
+        Motor.objects.filter(pk=self.motor.pk).update(model='Pacer')
+        self.assertEqual(self.get_labels({'q': 'pacer'}), [])
+        bump_generation(Motor)
+        self.assertEqual(self.get_labels({'q': 'pacer'}), ['T-Motor Pacer 2207'])
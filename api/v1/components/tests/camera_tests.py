@@ -30,12 +30,37 @@ class TestCameraAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Camera.objects.all().count())
 
+    def test_list_camera_num_queries(self):
+        url = reverse('api:v1:components:camera-list')
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_camera(self):
         url = reverse('api:v1:components:camera-detail', args={self.camera1.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data['details']), CameraDetail.objects.filter(camera=self.camera1).count())
 
+    def test_camera_facets(self):
+        pal = mixer.blend(VideoFormat, format='PAL')
+        ntsc = mixer.blend(VideoFormat, format='NTSC')
+        self.camera1.video_formats.set([pal, ntsc])
+        self.camera2.video_formats.set([pal])
+
+        url = reverse('api:v1:components:camera-facets')
+        response = self.client.get(url, {'formats': ['NTSC']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['facets']['formats'],
+                         [{'value': 'NTSC', 'count': 1}, {'value': 'PAL', 'count': 1}])
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['facets']['formats'],
+                         [{'value': 'NTSC', 'count': 1}, {'value': 'PAL', 'count': 2}])
+        self.assertEqual(response.data['facets']['ratio'],
+                         [{'value': 'another', 'count': 1}, {'value': 'switch', 'count': 1}])
+
     def test_search_camera(self):
         url = reverse('api:v1:components:camera-list')
         response = self.client.get(url, {'search': 'Man'})
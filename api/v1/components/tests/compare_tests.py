@@ -0,0 +1,53 @@
+from mixer.backend.django import mixer
+from rest_framework.reverse import reverse
+
+from api.v1.tests import BaseAPITest
+from components.models import Motor, MotorDetail, RatedVoltage
+
+
+class TestCompareAPIView(BaseAPITest):
+
+    def setUp(self):
+        mixer.register(Motor, description='TestMotor', stator_diameter='22', stator_height='07')
+        self.voltage = mixer.blend(RatedVoltage, min_cells=4, max_cells=6)
+        self.motor1 = mixer.blend(Motor, manufacturer='Manufacturer1')
+        self.motor2 = mixer.blend(Motor, manufacturer='Manufacturer2')
+        mixer.blend(MotorDetail, motor=self.motor1, voltage=self.voltage, kv_per_volt=1900, max_power=700)
+        mixer.blend(MotorDetail, motor=self.motor1, voltage=self.voltage, kv_per_volt=2400, max_power=600)
+        mixer.blend(MotorDetail, motor=self.motor2, voltage=self.voltage, kv_per_volt=1700, max_power=900)
+        self.url = reverse('api:v1:components:compare')
+
+    def compare(self, ids, component_type='motor'):
+        return self.client.get(self.url, {'type': component_type, 'ids': ','.join(str(pk) for pk in ids)})
+
+    def get_rows(self, response):
+        return {row['field']: row for row in response.data['rows']}
+
+    def test_compare_motors(self):
+        response = self.compare([self.motor2.id, self.motor1.id])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([part['id'] for part in response.data['parts']], [self.motor2.id, self.motor1.id])
+
+        rows = self.get_rows(response)
+        self.assertEqual(rows['manufacturer']['values'], ['Manufacturer2', 'Manufacturer1'])
+        kv = rows['details.kv_per_volt']
+        self.assertEqual(kv['values'], [[1700], [1900, 2400]])
+        self.assertEqual(kv['display'], [['KV1700'], ['KV1900', 'KV2400']])
+        self.assertEqual((kv['min'], kv['max']), ([self.motor2.id], [self.motor1.id]))
+        self.assertEqual(rows['details.max_power']['max'], [self.motor2.id])
+        self.assertEqual(rows['details.voltage']['display'], [[str(self.voltage)], [str(self.voltage)] * 2])
+        self.assertNotIn('description', rows)
+
+    def test_compare_num_queries(self):
+        motors = [self.motor1, self.motor2, *mixer.cycle(5).blend(Motor)]
+        with self.assertNumQueries(2):
+            response = self.compare([self.motor1.id])
+        with self.assertNumQueries(2):
+            response = self.compare([motor.id for motor in motors])
+        self.assertEqual(len(response.data['parts']), len(motors))
+
+    def test_compare_invalid(self):
+        self.assertEqual(self.compare([self.motor1.id], component_type='battery').status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'type': 'motor', 'ids': '1,x'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'type': 'motor'}).status_code, 400)
+        self.assertEqual(self.compare(range(1, 52)).status_code, 400)
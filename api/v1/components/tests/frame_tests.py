@@ -2,7 +2,8 @@ from mixer.backend.django import mixer
 from rest_framework.reverse import reverse
 
 from api.v1.tests import BaseAPITest
-from components.models import Frame, FrameVTXDetail, FrameMotorDetail, FrameCameraDetail
+from components.models import (Camera, CameraDetail, Frame, FrameVTXDetail, FrameMotorDetail, FrameCameraDetail, Motor,
+                               Propeller, Transmitter)
 
 
 class TestFrameAPIView(BaseAPITest):
@@ -32,6 +33,37 @@ class TestFrameAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Frame.objects.all().count())
 
+    def test_filter_frame_compatible(self):
+        Frame.objects.filter(pk=self.frame1.pk).update(prop_size_min=None, prop_size_max=5)
+        FrameMotorDetail.objects.filter(pk=self.frame1_motor_detail.pk).update(motor_mount_height=16,
+                                                                               motor_mount_width=16)
+        FrameCameraDetail.objects.filter(pk=self.frame1_camera_detail.pk).update(camera_mount_height=19,
+                                                                                 camera_mount_width=19)
+        FrameVTXDetail.objects.filter(pk=self.frame1_vtx_detail.pk).update(vtx_mount_height=30.5,
+                                                                           vtx_mount_width=30.5)
+        motor = mixer.blend(Motor, mount_height=16, mount_width=16)
+        propeller = mixer.blend(Propeller, description='TestPropeller', size=5)
+        camera = mixer.blend(Camera)
+        mixer.blend(CameraDetail, camera=camera, height=19, width=19)
+        transmitter = mixer.blend(Transmitter, length=30, height=30)
+
+        url = reverse('api:v1:components:frame-list')
+        for other, other_type in ((motor, 'motor'), (propeller, 'propeller'),
+                                  (camera, 'camera'), (transmitter, 'transmitter')):
+            response = self.client.get(url, {f'compatible_with_{other_type}': other.id})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([frame['id'] for frame in response.data['results']], [self.frame1.id])
+
+        big_propeller = mixer.blend(Propeller, description='TestPropeller', size=7)
+        response = self.client.get(url, {'compatible_with_propeller': big_propeller.id})
+        self.assertEqual(response.data['count'], 0)
+
+    def test_list_frame_num_queries(self):
+        url = reverse('api:v1:components:frame-list')
+        with self.assertNumQueries(7):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_frame(self):
         url = reverse('api:v1:components:frame-detail', args={self.frame1.id})
         response = self.client.get(url)
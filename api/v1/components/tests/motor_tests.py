@@ -1,8 +1,13 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from mixer.backend.django import mixer
 from rest_framework.reverse import reverse
 
+from api.v1.components.views import MotorAPIViewSet
 from api.v1.tests import BaseAPITest
-from components.models import Motor, MotorDetail, RatedVoltage
+from components.models import Antenna, Battery, Frame, FrameMotorDetail, Motor, MotorDetail, RatedVoltage
+from components.similarity import similarity_index
 
 
 class TestMotorAPIView(BaseAPITest):
@@ -39,12 +44,70 @@ class TestMotorAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Motor.objects.all().count())
 
+    def test_list_motor_num_queries(self):
+        url = reverse('api:v1:components:motor-list')
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_motor(self):
         url = reverse('api:v1:components:motor-detail', args={self.motor1.id})
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data['details']), MotorDetail.objects.filter(motor=self.motor1).count())
 
+    def test_motor_alternatives(self):
+        motor3 = mixer.blend(Motor, stator_diameter='28')
+        mixer.blend(MotorDetail, motor=motor3, voltage=self.voltage1, peak_current=40)
+        MotorDetail.objects.exclude(pk=self.motor1_detail_2.pk).update(kv_per_volt=1900, max_power=700)
+        MotorDetail.objects.filter(pk=self.motor1_detail_2.pk).update(kv_per_volt=2000, max_power=700)
+        similarity_index.clear()
+
+        url = reverse('api:v1:components:motor-alternatives', args=[self.motor1.id])
+        response = self.client.get(url, {'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([part['id'] for part in response.data['results']], [self.motor2.id])
+        self.assertIn('details', response.data['results'][0])
+        self.assertIn('distance', response.data['results'][0])
+
+        response = self.client.get(url)
+        self.assertEqual([part['id'] for part in response.data['results']], [self.motor2.id, motor3.id])
+
+        response = self.client.get(url, {'limit': 0})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('limit', response.data)
+        response = self.client.get(reverse('api:v1:components:motor-alternatives', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_motor_facets(self):
+        voltage2 = mixer.blend(RatedVoltage, min_cells=4)
+        mixer.blend(MotorDetail, motor=self.motor2, voltage=voltage2, kv_per_volt=self.motor2_detail_1.kv_per_volt + 1)
+        url = reverse('api:v1:components:motor-facets')
+
+        # One query per facet for the options, one for all the counts
+        with self.assertNumQueries(len(MotorAPIViewSet.facet_fields) + 1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(response.data['facets']['manufacturer'],
+                         [{'value': 'Manufacturer1', 'count': 1}, {'value': 'Manufacturer2', 'count': 1}])
+        self.assertEqual(response.data['facets']['details__voltage__min_cells'],
+                         [{'value': 4, 'count': 1}, {'value': 6, 'count': 2}])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {'manufacturer': 'Manufacturer1'})
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['facets']['details__voltage__min_cells'],
+                         [{'value': 4, 'count': 0}, {'value': 6, 'count': 1}])
+
+        with self.assertNumQueries(0):
+            self.client.get(url, {'manufacturer': 'Manufacturer1'})
+
+        self.motor1.manufacturer = 'Manufacturer2'
+        self.motor1.save()
+        response = self.client.get(url)
+        self.assertEqual(response.data['facets']['manufacturer'], [{'value': 'Manufacturer2', 'count': 2}])
+
     def test_search_motor(self):
         url = reverse('api:v1:components:motor-list')
         response = self.client.get(url, {'search': 'Man'})
@@ -71,3 +134,99 @@ class TestMotorAPIView(BaseAPITest):
                                    )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), 1)
+
+    def test_filter_motor_compatible(self):
+        Motor.objects.filter(pk=self.motor1.pk).update(mount_height=16, mount_width=19)
+        Motor.objects.filter(pk=self.motor2.pk).update(mount_height=12, mount_width=12)
+        frame = mixer.blend(Frame, description='TestFrame')
+        mixer.blend(FrameMotorDetail, frame=frame, motor_mount_height=19, motor_mount_width=16)
+        mixer.blend(MotorDetail, motor=self.motor2, voltage=mixer.blend(RatedVoltage, min_cells=3, max_cells=6))
+        battery = mixer.blend(Battery, description='TestBattery', series=4, size='18650', voltage=14.8)
+
+        url = reverse('api:v1:components:motor-list')
+        response = self.client.get(url, {'compatible_with_frame': frame.id})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([motor['id'] for motor in response.data['results']], [self.motor1.id])
+
+        response = self.client.get(url, {'compatible_with_battery': battery.id})
+        self.assertEqual([motor['id'] for motor in response.data['results']], [self.motor2.id])
+
+        response = self.client.get(url, {'compatible_with_frame': frame.id, 'compatible_with_battery': battery.id})
+        self.assertEqual(response.data['count'], 0)
+
+    def test_filter_motor_multivalued_without_distinct(self):
+        url = reverse('api:v1:components:motor-list')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, {'details__voltage__min_cells': 6})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([motor['id'] for motor in response.data['results']].count(self.motor1.id), 1)
+        self.assertFalse(any('DISTINCT' in query['sql'] for query in context.captured_queries))
+
+    def test_list_motor_sparse_fieldset(self):
+        url = reverse('api:v1:components:motor-list')
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'fields': 'id,manufacturer,model,images', 'expand': 'images'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'manufacturer', 'model', 'images'})
+
+    def test_detail_motor_collapsed(self):
+        url = reverse('api:v1:components:motor-detail', args={self.motor1.id})
+        response = self.client.get(url, {'expand': ''})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['details'], [self.motor1_detail_1.id, self.motor1_detail_2.id])
+        self.assertIn('description', response.data)
+
+    def test_list_motor_cached(self):
+        url = reverse('api:v1:components:motor-list')
+        response = self.client.get(f'{url}?search=Man&peak_current_min=10')
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(f'{url}?peak_current_min=10&search=Man')
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response.data, response.data)
+
+    def test_list_motor_cache_invalidated(self):
+        mixer.blend(Antenna)
+        motor_url = reverse('api:v1:components:motor-list')
+        antenna_url = reverse('api:v1:components:antenna-list')
+        self.client.get(motor_url)
+        self.client.get(antenna_url)
+
+        self.motor1_detail_1.peak_current = 45
+        self.motor1_detail_1.save()
+
+        response = self.client.get(motor_url, {'peak_current_min': 45})
+        self.assertEqual(response.data.get('count'), 1)
+        response = self.client.get(motor_url)
+        self.assertIn(45, [detail['peak_current'] for motor in response.data['results'] for detail in motor['details']])
+        with self.assertNumQueries(0):
+            self.client.get(antenna_url)
+
+    @override_settings(API_CACHE_TIMEOUT=0)
+    def test_list_motor_not_modified(self):
+        url = reverse('api:v1:components:motor-list')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_motor_etag_changes(self):
+        url = reverse('api:v1:components:motor-detail', args={self.motor1.id})
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.motor1_detail_1.peak_current = 45
+        self.motor1_detail_1.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
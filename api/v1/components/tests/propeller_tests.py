@@ -27,6 +27,12 @@ class TestPropellerAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Propeller.objects.all().count())
 
+    def test_list_propeller_num_queries(self):
+        url = reverse('api:v1:components:propeller-list')
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_search_propeller(self):
         url = reverse('api:v1:components:propeller-list')
         response = self.client.get(url, {'search': 'Man'})
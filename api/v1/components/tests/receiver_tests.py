@@ -44,6 +44,12 @@ class TestReceiverAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Receiver.objects.all().count())
 
+    def test_list_receiver_num_queries(self):
+        url = reverse('api:v1:components:receiver-list')
+        with self.assertNumQueries(7):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_receiver(self):
         url = reverse('api:v1:components:receiver-detail', args={self.receiver1.id})
         response = self.client.get(url)
@@ -33,6 +33,12 @@ class TestStackAPIViews(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Stack.objects.all().count())
 
+    def test_list_stack_num_queries(self):
+        url = reverse('api:v1:components:stack-list')
+        with self.assertNumQueries(11):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_stack(self):
         url = reverse('api:v1:components:stack-detail', args={self.stack1.id})
         response = self.client.get(url)
@@ -93,6 +99,20 @@ class TestFlightControllerAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), FlightController.objects.all().count())
 
+    def test_list_flight_controller_num_queries(self):
+        url = reverse('api:v1:components:flight_controller-list')
+        with self.assertNumQueries(15):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_flight_controller_collapsed_stacks(self):
+        url = reverse('api:v1:components:flight_controller-list')
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'fields': 'id,model,stacks', 'expand': ''})
+        self.assertEqual(response.status_code, 200)
+        stacks = {result['id']: result['stacks'] for result in response.data['results']}
+        self.assertEqual(stacks[self.flight_controller1.id], [self.stack.id])
+
     def test_detail_flight_controller(self):
         url = reverse('api:v1:components:flight_controller-detail', args={self.flight_controller1.id})
         response = self.client.get(url)
@@ -147,6 +167,15 @@ class TestSpeedControllerAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), SpeedController.objects.all().count())
 
+    def test_list_speed_controller_num_queries(self):
+        mixer.blend(Stack, speed_controller=self.speed_controller1)
+        mixer.blend(Stack, speed_controller=self.speed_controller2)
+
+        url = reverse('api:v1:components:speed_controller-list')
+        with self.assertNumQueries(16):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_speed_controller(self):
         url = reverse('api:v1:components:speed_controller-detail', args={self.speed_controller1.id})
         response = self.client.get(url)
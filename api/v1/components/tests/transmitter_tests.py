@@ -26,6 +26,12 @@ class TestTransmitterAPIView(BaseAPITest):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('count'), Transmitter.objects.all().count())
 
+    def test_list_transmitter_num_queries(self):
+        url = reverse('api:v1:components:transmitter-list')
+        with self.assertNumQueries(7):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
     def test_detail_transmitter(self):
         url = reverse('api:v1:components:transmitter-detail', args={self.transmitter1.id})
         response = self.client.get(url)
@@ -3,7 +3,8 @@ from rest_framework.routers import DefaultRouter
 
 from api.v1.components.views import (AntennaAPIViewSet, CameraAPIViewSet, FrameAPIViewSet, MotorAPIViewSet,
                                      PropellerAPIViewSet, ReceiverAPIViewSet, StackAPIViewSet,
-                                     FlightControllerAPIViewSet, SpeedControllerAPIViewSet, TransmitterAPIViewSet)
+                                     FlightControllerAPIViewSet, SpeedControllerAPIViewSet, TransmitterAPIViewSet,
+                                     AutocompleteAPIView, CompareAPIView)
 
 app_name = 'api-v1-components'
 router = DefaultRouter(trailing_slash=True)
@@ -19,5 +20,6 @@ router.register(r'speed_controllers', SpeedControllerAPIViewSet, basename="speed
 router.register(r'transmitters', TransmitterAPIViewSet, basename="transmitter")
 
 urlpatterns = [
-
+    path('autocomplete/', AutocompleteAPIView.as_view(), name='autocomplete'),
+    path('compare/', CompareAPIView.as_view(), name='compare'),
 ] + router.urls
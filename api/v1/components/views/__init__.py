@@ -1,5 +1,7 @@
 from .antenna_views import AntennaAPIViewSet
+from .autocomplete_views import AutocompleteAPIView
 from .camera_views import CameraAPIViewSet
+from .compare_views import CompareAPIView
 from .frame_views import FrameAPIViewSet
 from .motor_views import MotorAPIViewSet
 from .propeller_views import PropellerAPIViewSet
@@ -1,17 +1,28 @@
 from django.db.models import Q
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 from django_filters.rest_framework import DjangoFilterBackend
 
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
 from api.v1.components.filters import AntennaFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import AntennaSerializer
+from api.v1.components.querysets import ANTENNA_EAGER_LOADING
+from api.v1.pagination import KeysetPagination
 from components.models import Antenna
 
 
-class AntennaAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class AntennaAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                        AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                         viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'antenna'
     serializer_class = AntennaSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Antenna.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Antenna.objects.all()
+    eager_loading = ANTENNA_EAGER_LOADING
     filterset_class = AntennaFilter
+    facet_fields = ['manufacturer', 'type__type', 'type__direction', 'type__polarization',
+                    'details__connector_type__type', 'details__angle_type']
     search_fields = ['model', 'manufacturer']
@@ -0,0 +1,39 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from search.autocomplete import DEFAULT_LIMIT, autocomplete_index, get_component_models
+
+
+class AutocompleteAPIView(APIView):
+    """
+    Top matches for ``?q=`` across every component type, by manufacturer and
+    model (and stator size for motors). ``?limit=`` caps the results and
+    ``?types=`` takes a comma separated list of component types.
+    """
+    permission_classes = ()
+    max_limit = 50
+
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get('q', '')
+        matches = autocomplete_index.search(query, limit=self.get_limit(request),
+                                            component_types=self.get_types(request))
+        return Response({'results': [{'component_type': entry.component_type, 'id': entry.id, 'label': entry.label}
+                                     for entry in matches]})
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError({'limit': _('A valid integer is required.')})
+        return max(1, min(limit, self.max_limit))
+
+    def get_types(self, request):
+        if not request.query_params.get('types'):
+            return None
+        component_types = request.query_params['types'].split(',')
+        unknown = set(component_types) - set(get_component_models())
+        if unknown:
+            raise ValidationError({'types': _('Unknown component types: %s') % ', '.join(sorted(unknown))})
+        return component_types
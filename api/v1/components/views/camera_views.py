@@ -1,16 +1,26 @@
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 from django_filters.rest_framework import DjangoFilterBackend
 
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
 from api.v1.components.filters import CameraFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import CameraSerializer
+from api.v1.components.querysets import CAMERA_EAGER_LOADING
+from api.v1.pagination import KeysetPagination
 from components.models import Camera
 
 
-class CameraAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class CameraAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                        AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                         viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'camera'
     serializer_class = CameraSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Camera.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Camera.objects.all()
+    eager_loading = CAMERA_EAGER_LOADING
     filterset_class = CameraFilter
+    facet_fields = ['manufacturer', 'ratio', 'output_type', 'light_sens', 'formats']
     search_fields = ['model', 'manufacturer']
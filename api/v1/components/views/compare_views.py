@@ -0,0 +1,34 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.v1.components.comparison import COMPARISONS, MAX_PARTS, Comparison
+
+
+class CompareAPIView(APIView):
+    """
+    Side-by-side attribute table of the parts ``?ids=`` (comma separated, up
+    to ``MAX_PARTS``) of the component type ``?type=``.
+    """
+    permission_classes = ()
+
+    def get(self, request, *args, **kwargs):
+        return Response(Comparison(self.get_type(request)).compare(self.get_ids(request)))
+
+    def get_type(self, request):
+        component_type = request.query_params.get('type', '')
+        if component_type not in COMPARISONS:
+            raise ValidationError({'type': _('Unknown component type: %s') % component_type})
+        return component_type
+
+    def get_ids(self, request):
+        try:
+            ids = [int(pk) for pk in request.query_params.get('ids', '').split(',') if pk.strip()]
+        except ValueError:
+            raise ValidationError({'ids': _('A comma separated list of integers is required.')})
+        if not ids:
+            raise ValidationError({'ids': _('This field is required.')})
+        if len(ids) > MAX_PARTS:
+            raise ValidationError({'ids': _('At most %d parts can be compared.') % MAX_PARTS})
+        return ids
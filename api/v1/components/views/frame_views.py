@@ -1,17 +1,25 @@
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 from django_filters.rest_framework import DjangoFilterBackend
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
+from api.v1.components.filters import FrameFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import FrameSerializer
+from api.v1.components.querysets import FRAME_EAGER_LOADING
+from api.v1.pagination import KeysetPagination
 from components.models import Frame
 
 
-class FrameAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class FrameAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                        AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                         viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'frame'
     serializer_class = FrameSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Frame.objects.all().distinct()
-    filterset_fields = ['manufacturer', 'prop_size', 'material', 'configuration',
-                        'camera_details__camera_mount_height', 'camera_details__camera_mount_width',
-                        'motor_details__motor_mount_height', 'motor_details__motor_mount_width',
-                        'vtx_details__vtx_mount_height', 'vtx_details__vtx_mount_width',]
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Frame.objects.all()
+    eager_loading = FRAME_EAGER_LOADING
+    filterset_class = FrameFilter
+    facet_fields = ['manufacturer', 'prop_size', 'material', 'configuration']
     search_fields = ['model', 'manufacturer']
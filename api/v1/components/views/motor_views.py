@@ -1,16 +1,27 @@
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 from django_filters.rest_framework import DjangoFilterBackend
 
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
 from api.v1.components.filters import MotorFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import MotorSerializer
+from api.v1.components.querysets import MOTOR_EAGER_LOADING
+from api.v1.pagination import KeysetPagination
 from components.models import Motor
 
 
-class MotorAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class MotorAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                        AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                         viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'motor'
     serializer_class = MotorSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Motor.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Motor.objects.all()
+    eager_loading = MOTOR_EAGER_LOADING
     filterset_class = MotorFilter
+    facet_fields = ['manufacturer', 'stator_diameter', 'stator_height',
+                    'details__voltage__min_cells', 'details__voltage__max_cells', 'details__voltage__type']
     search_fields = ['model', 'manufacturer']
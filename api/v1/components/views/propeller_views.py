@@ -1,14 +1,25 @@
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 from django_filters.rest_framework import DjangoFilterBackend
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
+from api.v1.components.filters import PropellerFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import PropellerSerializer
+from api.v1.components.querysets import PROPELLER_EAGER_LOADING
+from api.v1.pagination import KeysetPagination
 from components.models import Propeller
 
 
-class PropellerAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class PropellerAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                        AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                         viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'propeller'
     serializer_class = PropellerSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Propeller.objects.all().distinct()
-    filterset_fields = ['manufacturer', 'blade_count']
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Propeller.objects.all()
+    eager_loading = PROPELLER_EAGER_LOADING
+    filterset_class = PropellerFilter
+    facet_fields = ['manufacturer', 'blade_count']
     search_fields = ['model', 'manufacturer']
@@ -1,16 +1,26 @@
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
 from api.v1.components.filters import ReceiverFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import ReceiverSerializer
+from api.v1.components.querysets import RECEIVER_EAGER_LOADING
+from api.v1.pagination import KeysetPagination
 from components.models import Receiver
 
 
-class ReceiverAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class ReceiverAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                         AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                          viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'receiver'
     serializer_class = ReceiverSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Receiver.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Receiver.objects.all()
+    eager_loading = RECEIVER_EAGER_LOADING
     filterset_class = ReceiverFilter
+    facet_fields = ['manufacturer', 'processor', 'antenna_connectors', 'protocols']
     search_fields = ['model', 'manufacturer', 'processor', 'details__rf_chip']
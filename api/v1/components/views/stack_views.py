@@ -1,38 +1,61 @@
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
 from api.v1.components.filters import FlightControllerFilter, SpeedControllerFilter, StackFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import StackSerializer, FlightControllerSerializer, SpeedControllerSerializer
+from api.v1.components.querysets import (STACK_EAGER_LOADING, FLIGHT_CONTROLLER_EAGER_LOADING,
+                                         SPEED_CONTROLLER_EAGER_LOADING)
+from api.v1.pagination import KeysetPagination
 from components.models import Receiver, Stack, FlightController, SpeedController
 
 
-class StackAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class StackAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                      AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                       viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'stack'
     serializer_class = StackSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Stack.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Stack.objects.all()
+    eager_loading = STACK_EAGER_LOADING
     filterset_class = StackFilter
+    facet_fields = ['manufacturer', 'flight_controller__manufacturer', 'speed_controller__manufacturer',
+                    'speed_controller__esc_type', 'flight_controller_firmwares', 'speed_controller_protocols']
     search_fields = ['model', 'manufacturer',
                      'flight_controller__model', 'flight_controller__manufacturer',
                      'speed_controller__model', 'speed_controller__manufacturer', ]
 
 
-class FlightControllerAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class FlightControllerAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                                 AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                                  viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'flight_controller'
     serializer_class = FlightControllerSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = FlightController.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = FlightController.objects.all()
+    eager_loading = FLIGHT_CONTROLLER_EAGER_LOADING
     filterset_class = FlightControllerFilter
+    facet_fields = ['manufacturer', 'connector_type', 'gyro__imu', 'voltage__min_cells', 'voltage__max_cells',
+                    'firmwares']
     search_fields = ['model', 'manufacturer', ]
 
 
-class SpeedControllerAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class SpeedControllerAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                                AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                                 viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'speed_controller'
     serializer_class = SpeedControllerSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = SpeedController.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = SpeedController.objects.all()
+    eager_loading = SPEED_CONTROLLER_EAGER_LOADING
     filterset_class = SpeedControllerFilter
+    facet_fields = ['manufacturer', 'esc_type', 'voltage__min_cells', 'voltage__max_cells', 'firmwares', 'protocols']
     search_fields = ['model', 'manufacturer', ]
@@ -1,16 +1,26 @@
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import mixins, viewsets, filters
+from rest_framework import mixins, viewsets
 
+from api.mixins import (AlternativesMixin, CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin,
+                        CompiledListMixin, FacetsMixin)
 from api.v1.components.filters import TransmitterFilter
+from api.v1.filters import RankedSearchFilter
 from api.v1.components.serializers import TransmitterSerializer
+from api.v1.components.querysets import TRANSMITTER_EAGER_LOADING
+from api.v1.pagination import KeysetPagination
 from components.models import Transmitter
 
 
-class TransmitterAPIViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
+class TransmitterAPIViewSet(CachedResponseMixin, ConditionalGetMixin, EagerLoadingMixin, CompiledListMixin,
+                        AlternativesMixin, FacetsMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
                         viewsets.GenericViewSet):
     permission_classes = ()
+    component_type = 'transmitter'
     serializer_class = TransmitterSerializer
-    filter_backends = (DjangoFilterBackend, filters.SearchFilter)
-    queryset = Transmitter.objects.all().distinct()
+    filter_backends = (DjangoFilterBackend, RankedSearchFilter)
+    pagination_class = KeysetPagination
+    queryset = Transmitter.objects.all()
+    eager_loading = TRANSMITTER_EAGER_LOADING
     filterset_class = TransmitterFilter
+    facet_fields = ['manufacturer', 'output', 'output_powers', 'formats', 'antenna_connectors']
     search_fields = ['model', 'manufacturer']
@@ -0,0 +1,83 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.db.models import Count, Exists, OuterRef, Q
+
+from api.v1.filters import spans_multivalued_relation
+from api.v1.utils import get_lookup_models
+from components.cache import get_cache, get_generations
+
+# Conditional aggregates per query; more options are counted in several queries
+MAX_AGGREGATES = 500
+
+OPTIONS_CACHE_KEY_PREFIX = 'api:facet-options'
+
+
+def get_facet_models(model, facets):
+    """Models the options and counts of the facets are read from."""
+    models = {model}
+    for lookup in facets.values():
+        models |= get_lookup_models(model, lookup)
+    return models
+
+
+def get_facet_options(model, facets):
+    """
+    Distinct non-null values of every facet across all objects of the model,
+    in value order, by facet name; one query per facet, cached until one of
+    the models they are read from changes.
+    """
+    cache = get_cache()
+    key = json.dumps([model._meta.label_lower, facets, get_generations(get_facet_models(model, facets))])
+    key = f'{OPTIONS_CACHE_KEY_PREFIX}:{hashlib.sha256(key.encode()).hexdigest()}'
+    options = cache.get(key)
+    if options is None:
+        options = {name: list(model._default_manager.exclude(**{f'{lookup}__isnull': True}).order_by(lookup)
+                              .values_list(lookup, flat=True).distinct())
+                   for name, lookup in facets.items()}
+        cache.set(key, options, settings.API_CACHE_TIMEOUT)
+    return options
+
+
+def get_facet_condition(model, lookup, value):
+    """
+    Condition of the objects having ``value`` for the facet. Lookups through
+    multi-valued relations are matched with ``EXISTS``, so an object counts
+    once however many of its related rows match.
+    """
+    if spans_multivalued_relation(model, lookup):
+        return Q(Exists(model._default_manager.filter(pk=OuterRef('pk'), **{lookup: value})))
+    return Q(**{lookup: value})
+
+
+def count_facets(queryset, facets):
+    """
+    Number of objects of the queryset having each option of every facet
+    (``{name: lookup}``), as ``{name: [{'value': ..., 'count': ...}]}``, plus
+    the total ``count``.
+
+    All counts are conditional aggregates (``COUNT(...) FILTER (WHERE ...)``)
+    of one query over the queryset, instead of one filtered query per option.
+    """
+    model = queryset.model
+    options = get_facet_options(model, facets)
+    aggregates = {'count': Count('pk')}
+    for name, values in options.items():
+        for index, value in enumerate(values):
+            aggregates[f'{name}:{index}'] = Count('pk', filter=get_facet_condition(model, facets[name], value))
+
+    queryset = queryset.order_by()
+    names = list(aggregates)
+    counts = {}
+    for start in range(0, len(names), MAX_AGGREGATES):
+        aliases = {f'facet_{index}': name for index, name in enumerate(names[start:start + MAX_AGGREGATES])}
+        row = queryset.aggregate(**{alias: aggregates[name] for alias, name in aliases.items()})
+        counts.update({name: row[alias] for alias, name in aliases.items()})
+
+    return {
+        'count': counts['count'],
+        'facets': {name: [{'value': value, 'count': counts[f'{name}:{index}']}
+                          for index, value in enumerate(values)]
+                   for name, values in options.items()},
+    }
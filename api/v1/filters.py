@@ -0,0 +1,208 @@
+import copy
+
+from django import forms
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Exists, OuterRef, Q
+from django.db.models.constants import LOOKUP_SEP
+from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from rest_framework.filters import SearchFilter
+
+from builds.compatibility import get_compatible_filter, get_filter_models
+from builds.summary import encode_value
+from search.backends import get_search_backend
+from search.registry import SearchRegistry
+
+
+def spans_multivalued_relation(model, field_name):
+    """
+    Whether the ``field_name`` lookup path goes through a relation that can
+    match several rows per object (reverse foreign keys and many-to-many).
+    """
+    for name in field_name.split(LOOKUP_SEP):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        if field.one_to_many or field.many_to_many:
+            return True
+        if not field.is_relation:
+            return False
+        model = field.related_model
+    return False
+
+
+class ExistsFilterSet(filters.FilterSet):
+    """
+    FilterSet that applies filters on multi-valued relations (``details__``,
+    ``video_formats__``, ``firmwares__``, ...) as ``EXISTS`` subqueries.
+
+    Joining those relations would return one row per matching related object,
+    so the filtered queryset never needs ``.distinct()``. Each filter gets its
+    own subquery, the same as each filter getting its own join before.
+    """
+
+    def filter_queryset(self, queryset):
+        for name, value in self.form.cleaned_data.items():
+            queryset = self.apply_filter(queryset, self.filters[name], value)
+        return queryset
+
+    def apply_filter(self, queryset, filter_, value):
+        if not spans_multivalued_relation(queryset.model, filter_.field_name):
+            return filter_.filter(queryset, value)
+
+        base = queryset.model._default_manager.all()
+        subquery = filter_.filter(base, value)
+        if subquery is not base:
+            queryset = queryset.filter(Exists(subquery.filter(pk=OuterRef('pk'))))
+        return queryset
+
+
+def split_relation(model, field_name):
+    """
+    Splits ``field_name`` into the single-valued relation it starts with and
+    the rest of the lookup, e.g. ``camera__fov`` into the ``camera`` field and
+    ``fov``. Returns ``None`` when it starts with a column or a multi-valued
+    relation, or names the relation itself.
+    """
+    name, _sep, rest = field_name.partition(LOOKUP_SEP)
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    if not rest or not field.is_relation or field.one_to_many or field.many_to_many:
+        return None
+    return field, rest
+
+
+def get_relation_condition(field, subquery):
+    """
+    Rows whose ``field`` relation is among the ``subquery`` rows, as an
+    ``IN`` semi-join on the indexed key column: the foreign key of the
+    filtered table (``camera_id IN (SELECT id ...)``), or its primary key
+    for reverse relations (``id IN (SELECT drone_id ...)``).
+    """
+    if field.concrete:
+        return Q(**{f'{field.attname}__in': subquery.values('pk')})
+    return Q(pk__in=subquery.values(field.field.attname))
+
+
+class RelatedExistsFilterSet(ExistsFilterSet):
+    """
+    ``ExistsFilterSet`` that also moves filters through single-valued
+    relations (``camera__fov``, ``summary__weight``, ...) into subqueries on
+    the related table, one per relation, instead of joining every filtered
+    part.
+
+    Each subquery is matched with ``IN`` on the filtered table's foreign key
+    or primary key (see ``get_relation_condition``), so the planner can
+    start from the related rows that match and look the filtered rows up
+    through that key's index, instead of scanning every row and probing a
+    correlated ``EXISTS`` for each.
+
+    Filters of one relation share its subquery, which matches joining the
+    relation once. Lookups that go on through the related table are split
+    the same way, so ``flight_controller__gyro__spi_support`` nests a gyro
+    subquery in the flight controller one.
+    """
+
+    def filter_queryset(self, queryset):
+        items = [(self.filters[name], self.filters[name].field_name, value)
+                 for name, value in self.form.cleaned_data.items()]
+        return self.apply_filters(queryset, items)
+
+    def apply_filters(self, queryset, items):
+        relations = {}
+        for filter_, field_name, value in items:
+            relation = split_relation(queryset.model, field_name)
+            if relation is None:
+                queryset = self.apply_filter(queryset, with_field_name(filter_, field_name), value)
+            else:
+                field, rest = relation
+                relations.setdefault(field, []).append((filter_, rest, value))
+
+        for field, related_items in relations.items():
+            base = field.related_model._default_manager.all()
+            subquery = self.apply_filters(base, related_items)
+            if subquery is not base:
+                queryset = queryset.filter(get_relation_condition(field, subquery.order_by()))
+        return queryset
+
+
+def with_field_name(filter_, field_name):
+    """The filter itself, or a copy of it that filters on ``field_name``."""
+    if filter_.field_name == field_name:
+        return filter_
+    filter_ = copy.copy(filter_)
+    filter_.field_name = field_name
+    return filter_
+
+
+class CompatibleWithFilter(filters.Filter):
+    """
+    Keeps the parts that fit the ``other_type`` part whose id is passed, e.g.
+    ``?compatible_with_frame=12`` on motors. The check runs in SQL (see
+    ``builds.compatibility.FILTERS``).
+    """
+    field_class = forms.IntegerField
+
+    def __init__(self, component_type, other_type, **kwargs):
+        kwargs.setdefault('label', f'Compatible with {other_type.replace("_", " ")}')
+        super().__init__(**kwargs)
+        self.component_type = component_type
+        self.other_type = other_type
+
+    @property
+    def models(self):
+        """Models the filtered result depends on, for response caching."""
+        return get_filter_models(self.component_type, self.other_type)
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        return qs.filter(get_compatible_filter(self.component_type, self.other_type, value))
+
+
+class SummaryValuesFilter(filters.ModelMultipleChoiceFilter):
+    """
+    Multiple choice filter on a denormalized value set column (see
+    ``builds.summary.encode_values``), matched on the ``to_field_name`` of
+    the chosen objects.
+    """
+
+    def filter(self, qs, value):
+        if not value:
+            return qs
+        to_field_name = self.extra.get('to_field_name', 'pk')
+        conditions = [Q(**{f'{self.field_name}__contains': encode_value(getattr(obj, to_field_name))})
+                      for obj in value]
+        if self.conjoined:
+            return qs.filter(*conditions)
+        return qs.filter(Q.create(conditions, connector=Q.OR))
+
+
+class SummaryValueFilter(filters.ChoiceFilter):
+    """Single choice filter on a denormalized value set column (see ``SummaryValuesFilter``)."""
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        return qs.filter(**{f'{self.field_name}__contains': encode_value(value)})
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    ``SearchFilter`` served by the search index (see ``search.backends``):
+    every term has to occur in the object's indexed text, and results are
+    ordered by relevance instead of scanning ``search_fields`` with
+    ``icontains`` across joins. Models without an index fall back to
+    ``SearchFilter``.
+
+    Keyset pages (``?cursor=``) keep the model ordering, not relevance.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms or not SearchRegistry.is_registered(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+        return get_search_backend(queryset.db).search(queryset, terms)
@@ -1,6 +1,10 @@
+from collections import defaultdict
+
+from django.db.models import Prefetch, prefetch_related_objects
 from rest_framework import serializers
 from django.utils.translation import gettext_lazy as _
 
+from api.v1.pagination import ListItemsPagination
 from api.v1.users.serializers import UserSerializer
 from lists.models import List
 from lists.registry import ComponentRegistry
@@ -10,6 +14,10 @@ from components.models import (
 )
 
 
+# Items one bulk_add request takes at most
+MAX_BULK_ITEMS = 500
+
+
 class ListOverviewSerializer(serializers.ModelSerializer):
     """
     Serializer for list overview - used in list listings.
@@ -24,6 +32,23 @@ class ListOverviewSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at', 'owner']
 
 
+class ComponentItemListSerializer(serializers.ListSerializer):
+    """Loads the accepted images of the components on the page, one query per component type, before serializing."""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, 'all') else data)
+        components = defaultdict(list)
+        for item in items:
+            component = getattr(item, 'component', None)
+            if component is not None and hasattr(component, 'images'):
+                components[type(component)].append(component)
+        for model, objs in components.items():
+            gallery = model._meta.get_field('images').related_model
+            prefetch_related_objects(objs, Prefetch('images', queryset=gallery.objects.filter(accepted=True),
+                                                    to_attr='accepted_images'))
+        return super().to_representation(items)
+
+
 class ComponentItemSerializer(serializers.Serializer):
     """
     Serializer for any component item in a list.
@@ -37,6 +62,9 @@ class ComponentItemSerializer(serializers.Serializer):
     image_url = serializers.SerializerMethodField(read_only=True)
     added_at = serializers.DateTimeField(read_only=True)
 
+    class Meta:
+        list_serializer_class = ComponentItemListSerializer
+
     def get_display_name(self, obj):
         """Return the string representation of the component"""
         if hasattr(obj, 'component'):
@@ -44,24 +72,15 @@ class ComponentItemSerializer(serializers.Serializer):
         return "Unknown Component"
 
     def get_image_url(self, obj):
-        """Return the image with lowest order or order=0 if available"""
-        if hasattr(obj, 'component') and hasattr(obj.component, 'images'):
-            images = obj.component.images.filter(accepted=True)
-
-            if not images.exists():
-                return None
-
-            # Try to get the image with order=0 first
-            zero_ordered = images.filter(order=0).first()
-            if zero_ordered:
-                return zero_ordered.image.url
-
-            # Otherwise get the image with the lowest order value
-            lowest_ordered = images.order_by('order').first()
-            if lowest_ordered:
-                return lowest_ordered.image.url
-
-        return None
+        """Return the accepted image with the lowest order (order=0 first), newest first among equals"""
+        component = getattr(obj, 'component', None)
+        if hasattr(component, 'accepted_images'):
+            image = component.accepted_images[0] if component.accepted_images else None
+        elif hasattr(component, 'images'):
+            image = component.images.filter(accepted=True).first()
+        else:
+            return None
+        return image.image.url if image is not None else None
 
 
 class ListDetailSerializer(ListOverviewSerializer):
@@ -70,36 +89,29 @@ class ListDetailSerializer(ListOverviewSerializer):
     Used for the detail view of a list.
     """
     items = serializers.SerializerMethodField()
+    items_next = serializers.SerializerMethodField()
     parts_count_by_type = serializers.SerializerMethodField()
 
     class Meta(ListOverviewSerializer.Meta):
-        fields = ListOverviewSerializer.Meta.fields + ['items', 'parts_count_by_type']
+        fields = ListOverviewSerializer.Meta.fields + ['items', 'items_next', 'parts_count_by_type']
 
-    def get_items(self, obj):
-        """Get all items in the list with their component details"""
-        # Get items with component type information
-        all_items = []
-
-        for component_type in ComponentRegistry.get_all_types():
-            related_name = f"{component_type}_items"
-            if not hasattr(obj, related_name):
-                continue
-
-            component_items = getattr(obj, related_name).select_related('component').prefetch_related(
-                'component__images'
-            ).all()
+    def get_items_pagination(self, obj):
+        """Page of the list's items for the request's ``items_*`` parameters (see ``ListItemsPagination``)"""
+        if getattr(self, '_items_pagination', (None,))[0] != obj.pk:
+            pagination = ListItemsPagination()
+            page = pagination.paginate_list(obj, self.context.get('request'))
+            self._items_pagination = (obj.pk, pagination, page)
+        return self._items_pagination[1:]
 
-            for item in component_items:
-                # Add component type information
-                item.component_type = component_type
-                item.component_id = item.component.id
-                all_items.append(item)
-
-        # Sort by added_at (newest first)
-        sorted_items = sorted(all_items, key=lambda x: x.added_at, reverse=True)
+    def get_items(self, obj):
+        """Get one page of the items in the list with their component details"""
+        _pagination, page = self.get_items_pagination(obj)
+        return ComponentItemSerializer(page, many=True).data
 
-        # Apply pagination if requested in query params
-        return ComponentItemSerializer(sorted_items, many=True).data
+    def get_items_next(self, obj):
+        """Link to the next page of items, if any"""
+        pagination, _page = self.get_items_pagination(obj)
+        return pagination.get_next_link()
 
     def get_parts_count_by_type(self, obj):
         """Get count of parts by component type"""
@@ -164,6 +176,20 @@ class AddComponentSerializer(serializers.Serializer):
         return data
 
 
+class ComponentReferenceSerializer(serializers.Serializer):
+    """A component type and id, checked against the database by the list (see ``List.add_items_bulk``)."""
+    component_type = serializers.CharField()
+    component_id = serializers.IntegerField(min_value=1)
+
+
+class BulkAddComponentSerializer(serializers.Serializer):
+    """
+    Serializer for adding many components of any types to a list at once.
+    Unknown types and missing components are reported per item, not rejected.
+    """
+    items = ComponentReferenceSerializer(many=True, allow_empty=False, max_length=MAX_BULK_ITEMS)
+
+
 class RemoveComponentSerializer(serializers.Serializer):
     """
     Serializer for removing components from a list.
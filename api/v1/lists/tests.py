@@ -1,9 +1,12 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from mixer.backend.django import mixer
 from rest_framework import status
 
 from api.v1.tests import BaseAPITest
 from components.models import Antenna, Camera
+from galleries.models import AntennaGallery, CameraGallery
 from lists.models import List, AntennaListItem, CameraListItem
 
 
@@ -56,6 +59,20 @@ class ListAPITest(BaseAPITest):
         list_data = next(l for l in response.data['results'] if l['name'] == "My Test List")
         self.assertEqual(list_data['parts_count'], 1)
 
+    def test_list_lists_num_queries(self):
+        """Test that the overview page reads lists, owners and item counts in one query."""
+        for index in range(3):
+            other_list = mixer.blend(List, owner=self.user, name=f"List {index}")
+            mixer.blend(CameraListItem, list=other_list, component=self.camera)
+
+        url = reverse("api:v1:lists:list-list")
+        # The user, then the validators and count, then the page
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({item['name']: item['parts_count'] for item in response.data['results']},
+                         {"My Test List": 1, "List 0": 1, "List 1": 1, "List 2": 1})
+
     def test_create_list(self):
         """Test creating a new list."""
         url = reverse("api:v1:lists:list-list")
@@ -95,6 +112,67 @@ class ListAPITest(BaseAPITest):
         if 'camera' in response.data['parts_count_by_type']:
             self.assertEqual(response.data['parts_count_by_type']['camera'], 0)
 
+    def test_list_detail_items_pages(self):
+        """Test that list items come in cursor pages, newest first, and can be filtered by type."""
+        camera2 = mixer.blend(Camera, fov=120, voltage_min=5.0, voltage_max=12.0)
+        camera_item = mixer.blend(CameraListItem, list=self.user_list, component=self.camera)
+        camera_item2 = mixer.blend(CameraListItem, list=self.user_list, component=camera2)
+        # Items added at the same time are told apart by type, then id
+        added_at = self.antenna_item.added_at
+        CameraListItem.objects.update(added_at=added_at)
+
+        url = reverse("api:v1:lists:list-detail", args=[self.user_list.id])
+        response = self.client.get(url, {"items_page_size": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(item['component_type'], item['id']) for item in response.data['items']],
+                         [("antenna", self.antenna_item.id), ("camera", camera_item2.id)])
+
+        response = self.client.get(response.data['items_next'])
+        self.assertEqual([(item['component_type'], item['id']) for item in response.data['items']],
+                         [("camera", camera_item.id)])
+        self.assertIsNone(response.data['items_next'])
+
+        response = self.client.get(url, {"items_type": "camera,motor"})
+        self.assertEqual([item['id'] for item in response.data['items']], [camera_item2.id, camera_item.id])
+
+        self.assertEqual(self.client.get(url, {"items_type": "battery"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"items_cursor": "invalid"}).status_code, 404)
+
+    def test_list_detail_item_images(self):
+        """Test that item images are read once per component type, whatever the number of items."""
+        AntennaGallery.objects.create(object=self.antenna, order=1, image='one.webp')
+        primary = AntennaGallery.objects.create(object=self.antenna, order=0, image='zero.webp')
+        cameras = [mixer.blend(Camera, fov=120, voltage_min=5.0, voltage_max=12.0) for _index in range(3)]
+        for camera in cameras:
+            mixer.blend(CameraListItem, list=self.user_list, component=camera)
+            CameraGallery.objects.create(object=camera, order=0, image='camera.webp')
+
+        url = reverse("api:v1:lists:list-detail", args=[self.user_list.id])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        image_queries = [query for query in queries if 'galleries_' in query['sql']]
+        self.assertEqual(len(image_queries), 2)
+
+        images = {item['component_id']: item['image_url'] for item in response.data['items']
+                  if item['component_type'] == 'antenna'}
+        self.assertEqual(images, {self.antenna.id: primary.image.url})
+
+    def test_list_detail_not_modified(self):
+        """Test that an unchanged list answers If-None-Match with 304, and a changed one doesn't."""
+        url = reverse("api:v1:lists:list-detail", args=[self.user_list.id])
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        add_url = reverse("api:v1:lists:list-add-component", args=[self.user_list.id])
+        self.client.post(add_url, {"component_type": "camera", "component_id": self.camera.id})
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['items']), 2)
+
     def test_cannot_access_other_user_list(self):
         """Test that a user cannot access another user's list."""
         url = reverse("api:v1:lists:list-detail", args=[self.other_list.id])
@@ -197,6 +275,40 @@ class ListAPITest(BaseAPITest):
         self.assertEqual(response.status_code, 400)
         self.assertIn("already in the list", str(response.data['detail']))
 
+    def test_bulk_add_components(self):
+        """Test adding components of mixed types at once, with an outcome per item."""
+        camera2 = mixer.blend(Camera, fov=120, voltage_min=5.0, voltage_max=12.0)
+        detail_url = reverse("api:v1:lists:list-detail", args=[self.user_list.id])
+        etag = self.client.get(detail_url)['ETag']
+
+        url = reverse("api:v1:lists:list-bulk-add", args=[self.user_list.id])
+        items = [
+            {"component_type": "camera", "component_id": self.camera.id},
+            {"component_type": "antenna", "component_id": self.antenna.id},
+            {"component_type": "camera", "component_id": camera2.id},
+            {"component_type": "camera", "component_id": self.camera.id},
+            {"component_type": "motor", "component_id": 999999},
+            {"component_type": "battery", "component_id": 1},
+        ]
+        response = self.client.post(url, {"items": items}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([result['status'] for result in response.data['results']],
+                         ['added', 'exists', 'added', 'duplicate', 'not_found', 'invalid_type'])
+        self.assertEqual(self.user_list.count_by_type()['camera'], 2)
+        self.assertEqual(self.user_list.count_by_type()['antenna'], 1)
+
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['items']), 3)
+
+        response = self.client.post(url, {"items": items[:1]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['status'], 'exists')
+
+        response = self.client.post(url, {"items": []}, format='json')
+        self.assertEqual(response.status_code, 400)
+
     def test_remove_component(self):
         """Test removing a single component from a list."""
         url = reverse("api:v1:lists:list-remove-components", args=[self.user_list.id])
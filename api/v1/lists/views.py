@@ -5,27 +5,31 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils.translation import gettext_lazy as _
 
+from api.mixins import ConditionalGetMixin
 from api.v1.lists.serializers import (
     ListOverviewSerializer, ListDetailSerializer,
-    AddComponentSerializer, RemoveComponentSerializer,
+    AddComponentSerializer, BulkAddComponentSerializer, RemoveComponentSerializer,
     ComponentItemSerializer
 )
 from lists.models import List
+from api.v1.pagination import KeysetPagination
+from api.v1.utils import get_lookup_models
 from lists.registry import ComponentRegistry
 
 
-class ListViewSet(viewsets.ModelViewSet):
+class ListViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing user's lists of components.
     Provides CRUD operations and custom actions for managing list items.
     """
     permission_classes = (IsAuthenticated,)
+    pagination_class = KeysetPagination
     filter_backends = (DjangoFilterBackend, filters.SearchFilter)
     search_fields = ['name', 'description']
 
     def get_queryset(self):
-        """Return only lists owned by the current user."""
-        return List.objects.filter(owner=self.request.user)
+        """Return only lists owned by the current user, with their owner and item counts."""
+        return List.objects.filter(owner=self.request.user).select_related('owner__profile').with_item_counts()
 
     def get_serializer_class(self):
         """Return the appropriate serializer based on the action."""
@@ -33,6 +37,13 @@ class ListViewSet(viewsets.ModelViewSet):
             return ListDetailSerializer
         return ListOverviewSerializer
 
+    def get_response_models(self):
+        """Items, their components and images are read by method fields, so they are added here."""
+        models = super().get_response_models()
+        for item_model in ComponentRegistry.get_all_models():
+            models |= {item_model, *get_lookup_models(item_model, 'component__images')}
+        return models
+
     def perform_create(self, serializer):
         """Create a new list with the current user as owner."""
         serializer.save(owner=self.request.user)
@@ -75,6 +86,22 @@ class ListViewSet(viewsets.ModelViewSet):
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=True, methods=['post'])
+    def bulk_add(self, request, pk=None):
+        """Add many components, of any types, to the list in one transaction."""
+        list_obj = self.get_object()
+        serializer = BulkAddComponentSerializer(data=request.data)
+
+        if serializer.is_valid():
+            results = list_obj.add_items_bulk(serializer.validated_data['items'])
+            added = sum(result['status'] == 'added' for result in results)
+            return Response(
+                {"detail": _("Added {0} components to the list.").format(added), "results": results},
+                status=status.HTTP_201_CREATED if added else status.HTTP_200_OK
+            )
+
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
     @action(detail=True, methods=['post'])
     def remove_components(self, request, pk=None):
         """Remove one or more components from the list."""
@@ -136,15 +163,8 @@ class ListViewSet(viewsets.ModelViewSet):
         if not hasattr(list_obj, related_name):
             return Response([])
 
-        items = getattr(list_obj, related_name).select_related('component').all()
-
-        # Add component type info to items for serializer
-        for item in items:
-            item.component_type = component_type
-            item.component_id = item.component.id
-
-        # Sort by added_at
-        items = sorted(items, key=lambda x: x.added_at, reverse=True)
+        # Sorted by added_at in SQL, with component type info set for the serializer
+        items = list_obj.get_items(component_types=[component_type])
 
         serializer = ComponentItemSerializer(items, many=True)
         return Response(serializer.data)
\ No newline at end of file
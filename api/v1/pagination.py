@@ -0,0 +1,248 @@
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from collections import OrderedDict
+
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from lists.registry import ComponentRegistry
+
+
+class CountedPaginator(DjangoPaginator):
+    """Paginator that takes the row count when the view has already computed it."""
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            self.__dict__['count'] = count
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Page number pagination with opt-in keyset (cursor) pagination.
+
+    Passing ``?cursor=`` (empty for the first page) switches to keyset mode:
+    rows are ordered by the model's ``Meta.ordering`` plus ``id`` and every
+    page is fetched with a ``WHERE (ordering) > (last row)`` condition instead
+    of an ``OFFSET``, so each page costs the same however deep it is. The
+    total count is skipped in keyset mode unless ``?count=true`` is passed.
+
+    A view that already counted the filtered queryset can set ``known_count``
+    to save the ``COUNT`` query.
+    """
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    invalid_cursor_message = _('Invalid cursor')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        self.known_count = getattr(view, 'known_count', None)
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        self.count = self.get_count(queryset) if self.get_with_count(request) else None
+
+        position, reverse = self.decode_cursor(request)
+        queryset = queryset.order_by(*self.get_order_by(queryset, reverse))
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(queryset, position, reverse))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, position is not None
+        self.next_position = self.get_position(results[-1]) if results and has_next else None
+        self.previous_position = self.get_position(results[0]) if results and has_previous else None
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['previous'] = self.get_previous_link()
+        response['results'] = data
+        return Response(response)
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, reverse=True)
+
+    def django_paginator_class(self, object_list, per_page):
+        return CountedPaginator(object_list, per_page, count=self.known_count)
+
+    def get_count(self, queryset):
+        return queryset.count() if self.known_count is None else self.known_count
+
+    def get_with_count(self, request):
+        return request.query_params.get(self.count_query_param, '').lower() in ('1', 'true')
+
+    def get_ordering(self, queryset):
+        ordering = [field for field in queryset.model._meta.ordering if field.lstrip('-') not in ('id', 'pk')]
+        return [*ordering, 'id']
+
+    def get_order_by(self, queryset, reverse):
+        """
+        Ascending fields sort NULLs last and descending ones first, on every
+        database, so the position filter below matches the row order.
+        """
+        order_by = []
+        for field in self.ordering:
+            descending = field.startswith('-') != reverse
+            expression = F(field.lstrip('-'))
+            order_by.append(expression.desc(nulls_first=True) if descending else expression.asc(nulls_last=True))
+        return order_by
+
+    def get_position_filter(self, queryset, position, reverse):
+        """
+        Builds ``(a > x) OR (a = x AND b > y) OR (a = x AND b = y AND id > z)``
+        for the ordering fields, with NULLs sorted after every value.
+        """
+        position_filter = Q(pk__in=[])
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            nullable = queryset.model._meta.get_field(name).null
+
+            if value is None:
+                after = Q(**{f'{name}__isnull': False}) if descending else None
+            else:
+                after = Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+                if nullable and not descending:
+                    after |= Q(**{f'{name}__isnull': True})
+
+            if after is not None:
+                position_filter |= equal & after
+            equal &= Q(**{f'{name}__isnull': True}) if value is None else Q(**{name: value})
+        return position_filter
+
+    def get_position(self, obj):
+        if isinstance(obj, dict):
+            return [obj[field.lstrip('-')] for field in self.ordering]
+        return [obj.serializable_value(field.lstrip('-')) for field in self.ordering]
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            cursor = json.loads(b64decode(encoded.encode('ascii')))
+            position, reverse = cursor['p'], bool(cursor.get('r'))
+        except (BinasciiError, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        cursor = {'p': position}
+        if reverse:
+            cursor['r'] = 1
+        cursor = json.dumps(cursor, cls=DjangoJSONEncoder, separators=(',', ':'))
+        encoded = b64encode(cursor.encode('utf-8')).decode('ascii')
+
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+
+class ListItemsPagination:
+    """
+    Keyset pagination of the items of a list (see ``List.get_items``), newest
+    first, for the ``items`` of a list detail response.
+
+    ``?items_cursor=`` takes the ``items_next`` cursor of the previous page,
+    ``?items_page_size=`` the number of items per page and ``?items_type=`` a
+    comma separated list of component types to keep.
+    """
+    cursor_query_param = 'items_cursor'
+    page_size_query_param = 'items_page_size'
+    type_query_param = 'items_type'
+    page_size = 100
+    max_page_size = 500
+    invalid_cursor_message = _('Invalid cursor')
+
+    def paginate_list(self, list_obj, request):
+        self.request = request
+        params = request.query_params if request is not None else {}
+        page_size = self.get_page_size(params)
+        items = list_obj.get_items(limit=page_size + 1, component_types=self.get_component_types(params),
+                                   after=self.decode_cursor(params))
+        has_next = len(items) > page_size
+        items = items[:page_size]
+        self.next_position = self.get_position(items[-1]) if items and has_next else None
+        return items
+
+    def get_page_size(self, params):
+        try:
+            page_size = int(params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_component_types(self, params):
+        if not params.get(self.type_query_param):
+            return None
+        component_types = params[self.type_query_param].split(',')
+        unknown = set(component_types) - set(ComponentRegistry.get_all_types())
+        if unknown:
+            raise ValidationError({self.type_query_param: _('Unknown component types: %s')
+                                   % ', '.join(sorted(unknown))})
+        return component_types
+
+    def get_position(self, item):
+        # isoformat() keeps the microseconds DjangoJSONEncoder would cut
+        return [item.added_at.isoformat(), item.component_type, item.pk]
+
+    def decode_cursor(self, params):
+        encoded = params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            added_at, component_type, pk = json.loads(b64decode(encoded.encode('ascii')))['p']
+            added_at = parse_datetime(added_at)
+        except (BinasciiError, UnicodeError, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if added_at is None or not isinstance(component_type, str) or not isinstance(pk, int):
+            raise NotFound(self.invalid_cursor_message)
+        return added_at, component_type, pk
+
+    def get_next_link(self):
+        if self.next_position is None or self.request is None:
+            return None
+        cursor = json.dumps({'p': self.next_position}, separators=(',', ':'))
+        encoded = b64encode(cursor.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, encoded)
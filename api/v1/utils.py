@@ -1,3 +1,7 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields.related_descriptors import ManyToManyDescriptor
 from rest_framework import serializers
 
 
@@ -7,3 +11,150 @@ class ReadOnlyModelSerializer(serializers.ModelSerializer):
         for field in fields:
             fields[field].read_only = True
         return fields
+
+
+def get_sparse_fieldset(request):
+    """
+    Parse the ``?fields=`` and ``?expand=`` query parameters into sets of
+    field names. A parameter that was not passed is returned as ``None``.
+    """
+    def parse(param):
+        if request is None or param not in request.query_params:
+            return None
+        return {name.strip() for name in request.query_params[param].split(',') if name.strip()}
+
+    return parse('fields'), parse('expand')
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin for ``?fields=`` and ``?expand=``.
+
+    ``fields`` limits the root serializer to the listed fields. When ``expand``
+    is passed, nested serializers missing from it are collapsed to primary
+    keys. Serializers nested in another serializer are left untouched.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.is_root_serializer():
+            return fields
+
+        requested, expand = get_sparse_fieldset(self.context.get('request'))
+        if requested is not None:
+            fields = {name: field for name, field in fields.items() if name in requested}
+        if expand is not None:
+            for name, field in fields.items():
+                if isinstance(field, serializers.BaseSerializer) and name not in expand:
+                    fields[name] = self.build_collapsed_field(field)
+        return fields
+
+    def is_root_serializer(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def build_collapsed_field(self, field):
+        kwargs = {'read_only': True, 'many': isinstance(field, serializers.ListSerializer)}
+        if field.source:
+            kwargs['source'] = field.source
+        return serializers.PrimaryKeyRelatedField(**kwargs)
+
+
+def eager_load(queryset, plan, fields=None, expand=None):
+    """
+    Apply an eager-loading plan to the queryset.
+
+    The plan maps serializer fields to lookups: strings go to select_related(),
+    Prefetch objects go to prefetch_related(). If ``fields`` is given, only the
+    lookups of those serializer fields are applied. Fields missing from
+    ``expand`` are serialized as primary keys and only prefetch those.
+    """
+    select_related, prefetch_related = [], []
+    for field, lookups in plan.items():
+        if fields is not None and field not in fields:
+            continue
+        if expand is not None and field not in expand:
+            prefetch_related.extend(pk_only_prefetch(queryset.model, lookup) for lookup in lookups
+                                    if isinstance(lookup, Prefetch) and LOOKUP_SEP not in lookup.prefetch_through)
+            continue
+        for lookup in lookups:
+            if isinstance(lookup, Prefetch):
+                prefetch_related.append(lookup)
+            else:
+                select_related.append(lookup)
+
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+def pk_only_prefetch(model, lookup):
+    """Rebuild a single-level Prefetch to load only the keys of the related rows."""
+    descriptor = getattr(model, lookup.prefetch_through)
+    if isinstance(descriptor, ManyToManyDescriptor):
+        only = ['pk']
+    else:
+        only = ['pk', descriptor.field.name]
+    return Prefetch(lookup.prefetch_through, queryset=lookup.queryset.model.objects.only(*only),
+                    to_attr=lookup.to_attr)
+
+
+def nest_eager_loading(prefix, plan):
+    """Return all lookups of the plan, rooted at the ``prefix`` relation."""
+    lookups = []
+    for field_lookups in plan.values():
+        for lookup in field_lookups:
+            if isinstance(lookup, Prefetch):
+                lookups.append(Prefetch(f'{prefix}__{lookup.prefetch_through}',
+                                        queryset=lookup.queryset, to_attr=lookup.to_attr))
+            else:
+                lookups.append(f'{prefix}__{lookup}')
+    return lookups
+
+
+def get_relations(model):
+    """Map every relation of the model, by the attribute serializers read it from, to the related model."""
+    relations = {}
+    for field in model._meta.get_fields():
+        if field.is_relation and field.related_model is not None:
+            name = field.name if field.concrete else field.get_accessor_name()
+            relations[name] = field.related_model
+    return relations
+
+
+def get_serializer_models(serializer):
+    """
+    The models a serializer reads: its own model and every related model,
+    nested ones included, and the models fields declare (``models``).
+    """
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    model = serializer.Meta.model
+    relations = get_relations(model)
+    models = {model}
+    for field in serializer.fields.values():
+        if field.source in relations:
+            models.add(relations[field.source])
+        if isinstance(getattr(field, 'child', field), serializers.ModelSerializer):
+            models |= get_serializer_models(field)
+        models |= set(getattr(field, 'models', ()))
+    return models
+
+
+def get_lookup_models(model, lookup):
+    """The related models a ``__`` lookup path goes through."""
+    models = set()
+    for name in lookup.split(LOOKUP_SEP):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation:
+            break
+        model = field.related_model
+        models.add(model)
+    return models
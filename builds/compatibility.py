@@ -0,0 +1,438 @@
+import threading
+from collections import namedtuple
+
+from django.db.models import Exists, OuterRef, Q, Subquery
+from django.utils.translation import gettext_lazy as _
+
+from components.cache import get_generation_key, get_generations
+from components.models import (
+    Antenna, AntennaDetail, Battery, Camera, CameraDetail, FlightController, Frame, FrameCameraDetail,
+    FrameMotorDetail, FrameVTXDetail, Motor, MotorDetail, Propeller, RatedVoltage, Receiver, SpeedController,
+    Stack, Transmitter
+)
+
+# Drone parts, by the name of their foreign key on BaseDroneMixin
+DRONE_PARTS = ('antenna', 'battery', 'camera', 'frame', 'motor', 'propeller', 'receiver', 'transmitter',
+               'flight_controller', 'speed_controller')
+
+Incompatibility = namedtuple('Incompatibility', 'rule component_types message')
+
+
+def get_footprint(height, width):
+    """Mount or board size as a (short side, long side) pair, so it compares the same either way round."""
+    if height is None or width is None:
+        return None
+    return tuple(sorted((height, width)))
+
+
+def load_antennas():
+    antennas = {pk: {'connectors': set()} for pk in Antenna.objects.values_list('pk', flat=True)}
+    for antenna_id, connector_id in AntennaDetail.objects.values_list('antenna_id', 'connector_type_id'):
+        antennas[antenna_id]['connectors'].add(connector_id)
+    return antennas
+
+
+def load_batteries():
+    return {pk: {'series': series} for pk, series in Battery.objects.values_list('pk', 'series')}
+
+
+def load_cameras():
+    cameras = {pk: {'sizes': set()} for pk in Camera.objects.values_list('pk', flat=True)}
+    for camera_id, height, width in CameraDetail.objects.values_list('camera_id', 'height', 'width'):
+        cameras[camera_id]['sizes'].add(get_footprint(height, width))
+    return cameras
+
+
+def load_frames():
+    frames = {pk: {'prop_sizes': prop_sizes, 'motor_mounts': set(), 'camera_mounts': set(), 'vtx_mounts': set()}
+              for pk, *prop_sizes in Frame.objects.values_list('pk', 'prop_size_min', 'prop_size_max')}
+    mounts = (
+        ('motor_mounts', FrameMotorDetail, 'motor_mount_height', 'motor_mount_width'),
+        ('camera_mounts', FrameCameraDetail, 'camera_mount_height', 'camera_mount_width'),
+        ('vtx_mounts', FrameVTXDetail, 'vtx_mount_height', 'vtx_mount_width'),
+    )
+    for attribute, model, height, width in mounts:
+        for frame_id, *size in model.objects.values_list('frame_id', height, width):
+            frames[frame_id][attribute].add(get_footprint(*size))
+    return frames
+
+
+def load_motors():
+    motors = {pk: {'mount': get_footprint(height, width), 'cells': set()}
+              for pk, height, width in Motor.objects.values_list('pk', 'mount_height', 'mount_width')}
+    for motor_id, *cells in MotorDetail.objects.values_list('motor_id', 'voltage__min_cells', 'voltage__max_cells'):
+        motors[motor_id]['cells'].add(tuple(cells))
+    return motors
+
+
+def load_propellers():
+    return {pk: {'size': size} for pk, size in Propeller.objects.values_list('pk', 'size')}
+
+
+def load_receivers():
+    receivers = {pk: {'connectors': set()} for pk in Receiver.objects.values_list('pk', flat=True)}
+    through = Receiver.antenna_connectors.through
+    for receiver_id, connector_id in through.objects.values_list('receiver_id', 'antennaconnector_id'):
+        receivers[receiver_id]['connectors'].add(connector_id)
+    return receivers
+
+
+def load_transmitters():
+    transmitters = {pk: {'footprint': get_footprint(length, height), 'connectors': set()}
+                    for pk, length, height in Transmitter.objects.values_list('pk', 'length', 'height')}
+    through = Transmitter.antenna_connectors.through
+    for transmitter_id, connector_id in through.objects.values_list('transmitter_id', 'antennaconnector_id'):
+        transmitters[transmitter_id]['connectors'].add(connector_id)
+    return transmitters
+
+
+def load_power_inputs(model):
+    def load():
+        return {pk: {'cells': {tuple(cells)}}
+                for pk, *cells in model.objects.values_list('pk', 'voltage__min_cells', 'voltage__max_cells')}
+    return load
+
+
+def load_stacks():
+    # A stack runs on the cell counts both its boards accept
+    stacks = {}
+    for pk, *cells in Stack.objects.values_list('pk', 'flight_controller__voltage__min_cells',
+                                                'flight_controller__voltage__max_cells',
+                                                'speed_controller__voltage__min_cells',
+                                                'speed_controller__voltage__max_cells'):
+        fc_min, fc_max, esc_min, esc_max = cells
+        stacks[pk] = {'cells': {(max(fc_min, esc_min), min(fc_max, esc_max))}}
+    return stacks
+
+
+# Attribute table loaders by component type, with the models each table is read from
+TABLES = {
+    'antenna': (load_antennas, (Antenna, AntennaDetail)),
+    'battery': (load_batteries, (Battery,)),
+    'camera': (load_cameras, (Camera, CameraDetail)),
+    'frame': (load_frames, (Frame, FrameMotorDetail, FrameCameraDetail, FrameVTXDetail)),
+    'motor': (load_motors, (Motor, MotorDetail, RatedVoltage)),
+    'propeller': (load_propellers, (Propeller,)),
+    'receiver': (load_receivers, (Receiver,)),
+    'transmitter': (load_transmitters, (Transmitter,)),
+    'flight_controller': (load_power_inputs(FlightController), (FlightController, RatedVoltage)),
+    'speed_controller': (load_power_inputs(SpeedController), (SpeedController, RatedVoltage)),
+    'stack': (load_stacks, (Stack, FlightController, SpeedController, RatedVoltage)),
+}
+
+
+def check_motor_mount(frame, motor):
+    if not frame['motor_mounts'] or motor['mount'] is None:
+        return None
+    return motor['mount'] in frame['motor_mounts']
+
+
+def check_prop_size(frame, propeller):
+    low, high = frame['prop_sizes']
+    if high is None:
+        return None
+    return (low is None or low <= propeller['size']) and propeller['size'] <= high
+
+
+def check_cells(battery, part):
+    if not part['cells']:
+        return None
+    return any(low <= battery['series'] <= high for low, high in part['cells'])
+
+
+def fits_mount(sizes, mounts):
+    sizes = [size for size in sizes if size is not None]
+    if not sizes or not mounts:
+        return None
+    return any(size[0] <= mount[0] and size[1] <= mount[1] for size in sizes for mount in mounts)
+
+
+def check_camera_mount(frame, camera):
+    return fits_mount(camera['sizes'], frame['camera_mounts'])
+
+
+def check_vtx_mount(frame, transmitter):
+    return fits_mount([transmitter['footprint']], frame['vtx_mounts'])
+
+
+def check_connectors(antenna, radio):
+    if not antenna['connectors'] or not radio['connectors']:
+        return None
+    return not antenna['connectors'].isdisjoint(radio['connectors'])
+
+
+class Rule:
+    """
+    A check between two component types. ``check`` gets both parts'
+    attribute rows and returns ``False`` when they do not fit, or ``None``
+    when the data needed to tell is missing.
+    """
+
+    def __init__(self, name, component_types, check, message):
+        self.name = name
+        self.component_types = component_types
+        self.check = check
+        self.message = message
+
+
+# Rules sharing a name are alternatives: a build passes when any one that applies does,
+# e.g. the antenna has to fit the transmitter or the receiver, not both.
+RULES = (
+    Rule('motor_mount', ('frame', 'motor'), check_motor_mount,
+         _('The motor mount does not match any motor mount of the frame.')),
+    Rule('prop_size', ('frame', 'propeller'), check_prop_size,
+         _('The propeller size is outside the propeller sizes the frame takes.')),
+    Rule('motor_cells', ('battery', 'motor'), check_cells,
+         _('The battery cell count is outside the rated voltages of the motor.')),
+    Rule('flight_controller_cells', ('battery', 'flight_controller'), check_cells,
+         _('The battery cell count is outside the power input of the flight controller.')),
+    Rule('speed_controller_cells', ('battery', 'speed_controller'), check_cells,
+         _('The battery cell count is outside the power input of the speed controller.')),
+    Rule('stack_cells', ('battery', 'stack'), check_cells,
+         _('The battery cell count is outside the power input of the stack.')),
+    Rule('camera_mount', ('frame', 'camera'), check_camera_mount,
+         _('The camera does not fit any camera mount of the frame.')),
+    Rule('vtx_mount', ('frame', 'transmitter'), check_vtx_mount,
+         _('The transmitter does not fit any VTX mount of the frame.')),
+    Rule('antenna_connector', ('antenna', 'transmitter'), check_connectors,
+         _('The antenna connector does not match the transmitter or the receiver.')),
+    Rule('antenna_connector', ('antenna', 'receiver'), check_connectors,
+         _('The antenna connector does not match the transmitter or the receiver.')),
+)
+
+
+def same_size(height, width, other_height, other_width):
+    """``height`` x ``width`` equals the other size, either way round."""
+    return (Q(**{height: other_height, width: other_width})
+            | Q(**{height: other_width, width: other_height}))
+
+
+def fits_within(height, width, mount_height, mount_width):
+    """The ``height`` x ``width`` size fits within the mount size, either way round."""
+    return (Q(**{f'{height}__lte': mount_height, f'{width}__lte': mount_width})
+            | Q(**{f'{height}__lte': mount_width, f'{width}__lte': mount_height}))
+
+
+def takes_size(mount_height, mount_width, height, width):
+    """The ``mount_height`` x ``mount_width`` mount takes the other size, either way round."""
+    return (Q(**{f'{mount_height}__gte': height, f'{mount_width}__gte': width})
+            | Q(**{f'{mount_height}__gte': width, f'{mount_width}__gte': height}))
+
+
+def takes_prop_size(size):
+    return Q(prop_size_max__gte=size) & (Q(prop_size_min__isnull=True) | Q(prop_size_min__lte=size))
+
+
+def get_battery_series(battery):
+    return Subquery(Battery.objects.filter(pk=battery).values('series')[:1])
+
+
+def takes_series(voltage, series):
+    return Q(**{f'{voltage}__min_cells__lte': series, f'{voltage}__max_cells__gte': series})
+
+
+def motors_for_frame(frame):
+    mounts = FrameMotorDetail.objects.filter(frame=frame)
+    return Exists(mounts.filter(same_size('motor_mount_height', 'motor_mount_width',
+                                          OuterRef('mount_height'), OuterRef('mount_width'))))
+
+
+def frames_for_motor(motor):
+    motors = Motor.objects.filter(pk=motor)
+    mounts = FrameMotorDetail.objects.filter(frame=OuterRef('pk'))
+    return Exists(mounts.filter(Exists(motors.filter(same_size('mount_height', 'mount_width',
+                                                               OuterRef('motor_mount_height'),
+                                                               OuterRef('motor_mount_width'))))))
+
+
+def propellers_for_frame(frame):
+    return Exists(Frame.objects.filter(takes_prop_size(OuterRef('size')), pk=frame))
+
+
+def frames_for_propeller(propeller):
+    return takes_prop_size(Subquery(Propeller.objects.filter(pk=propeller).values('size')[:1]))
+
+
+def cameras_for_frame(frame):
+    mounts = FrameCameraDetail.objects.filter(frame=frame)
+    sizes = CameraDetail.objects.filter(camera=OuterRef('pk'))
+    return Exists(sizes.filter(Exists(mounts.filter(takes_size('camera_mount_height', 'camera_mount_width',
+                                                               OuterRef('height'), OuterRef('width'))))))
+
+
+def frames_for_camera(camera):
+    sizes = CameraDetail.objects.filter(camera=camera)
+    mounts = FrameCameraDetail.objects.filter(frame=OuterRef('pk'))
+    return Exists(mounts.filter(Exists(sizes.filter(fits_within('height', 'width',
+                                                                OuterRef('camera_mount_height'),
+                                                                OuterRef('camera_mount_width'))))))
+
+
+def transmitters_for_frame(frame):
+    mounts = FrameVTXDetail.objects.filter(frame=frame)
+    return Exists(mounts.filter(takes_size('vtx_mount_height', 'vtx_mount_width',
+                                           OuterRef('length'), OuterRef('height'))))
+
+
+def frames_for_transmitter(transmitter):
+    transmitters = Transmitter.objects.filter(pk=transmitter)
+    mounts = FrameVTXDetail.objects.filter(frame=OuterRef('pk'))
+    return Exists(mounts.filter(Exists(transmitters.filter(fits_within('length', 'height',
+                                                                       OuterRef('vtx_mount_height'),
+                                                                       OuterRef('vtx_mount_width'))))))
+
+
+def motors_for_battery(battery):
+    details = MotorDetail.objects.filter(motor=OuterRef('pk'))
+    return Exists(details.filter(takes_series('voltage', get_battery_series(battery))))
+
+
+def power_inputs_for_battery(*voltages):
+    def predicate(battery):
+        series = get_battery_series(battery)
+        return Q(*(takes_series(voltage, series) for voltage in voltages))
+    return predicate
+
+
+def antennas_for_radio(radio_model):
+    through = radio_model.antenna_connectors.through
+    radio_field = radio_model._meta.model_name
+
+    def predicate(radio):
+        connectors = through.objects.filter(**{f'{radio_field}_id': radio}).values('antennaconnector_id')
+        return Exists(AntennaDetail.objects.filter(antenna=OuterRef('pk'), connector_type__in=connectors))
+    return predicate
+
+
+def radios_for_antenna(radio_model):
+    through = radio_model.antenna_connectors.through
+    radio_field = radio_model._meta.model_name
+
+    def predicate(antenna):
+        connectors = AntennaDetail.objects.filter(antenna=antenna).values('connector_type')
+        return Exists(through.objects.filter(antennaconnector_id__in=connectors,
+                                             **{f'{radio_field}_id': OuterRef('pk')}))
+    return predicate
+
+
+# The rules above as SQL, by (listed component type, type of the part it has to fit). Each
+# predicate takes the other part's id and returns an expression to filter the listed parts by.
+FILTERS = {
+    ('motor', 'frame'): motors_for_frame,
+    ('frame', 'motor'): frames_for_motor,
+    ('propeller', 'frame'): propellers_for_frame,
+    ('frame', 'propeller'): frames_for_propeller,
+    ('camera', 'frame'): cameras_for_frame,
+    ('frame', 'camera'): frames_for_camera,
+    ('transmitter', 'frame'): transmitters_for_frame,
+    ('frame', 'transmitter'): frames_for_transmitter,
+    ('motor', 'battery'): motors_for_battery,
+    ('flight_controller', 'battery'): power_inputs_for_battery('voltage'),
+    ('speed_controller', 'battery'): power_inputs_for_battery('voltage'),
+    ('stack', 'battery'): power_inputs_for_battery('flight_controller__voltage', 'speed_controller__voltage'),
+    ('antenna', 'transmitter'): antennas_for_radio(Transmitter),
+    ('transmitter', 'antenna'): radios_for_antenna(Transmitter),
+    ('antenna', 'receiver'): antennas_for_radio(Receiver),
+    ('receiver', 'antenna'): radios_for_antenna(Receiver),
+}
+
+
+def get_compatible_filter(component_type, other_type, pk):
+    """
+    Filter expression keeping the ``component_type`` parts that fit the
+    ``other_type`` part ``pk``. Unlike ``CompatibilityEngine``, parts without
+    the data to tell are left out.
+    """
+    return FILTERS[(component_type, other_type)](pk)
+
+
+def get_filter_models(component_type, other_type):
+    """Models the result of ``get_compatible_filter`` is read from."""
+    return {*TABLES[component_type][1], *TABLES[other_type][1]}
+
+
+class AttributeTables:
+    """
+    In-memory attribute tables: one row of precomputed attributes per
+    component, keyed by component type and id. ``tables`` maps a component
+    type to its loader and the models the loader reads from.
+
+    Each table is loaded with a few ``.values()`` queries on first use and
+    reloaded when the generation of any model it is read from moves (see
+    ``components.cache``), so edits made by any process are picked up on the
+    next lookup.
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.rows = {}
+            self.generations = {}
+
+    def get_rows(self, parts):
+        """Attribute rows of the parts that exist, by component type."""
+        tables = self.get_tables(parts)
+        return {component_type: tables[component_type][pk] for component_type, pk in parts.items()
+                if pk in tables.get(component_type, {})}
+
+    def get_tables(self, component_types):
+        component_types = [component_type for component_type in component_types if component_type in self.tables]
+        models = {model for component_type in component_types for model in self.tables[component_type][1]}
+        generations = dict(get_generations(models))
+
+        tables = {}
+        for component_type in component_types:
+            load, table_models = self.tables[component_type]
+            generation = [generations[get_generation_key(model)] for model in table_models]
+            with self.lock:
+                if self.generations.get(component_type) != generation:
+                    self.rows[component_type] = load()
+                    self.generations[component_type] = generation
+                tables[component_type] = self.rows[component_type]
+        return tables
+
+
+class CompatibilityEngine(AttributeTables):
+    """
+    Checks whether parts fit together against attribute tables of mount
+    sizes, cell ranges, prop sizes and connector ids. A check is a few
+    dictionary lookups and comparisons.
+    """
+
+    def __init__(self, rules=RULES, tables=TABLES):
+        super().__init__(tables)
+        self.rules = rules
+
+    def check(self, parts):
+        """
+        Incompatibilities between ``parts``, a mapping of component type to
+        id; parts set to ``None`` are skipped.
+        """
+        parts = {component_type: pk for component_type, pk in parts.items() if pk is not None}
+        rows = self.get_rows(parts)
+
+        results = {}
+        for rule in self.rules:
+            if not all(component_type in rows for component_type in rule.component_types):
+                continue
+            result = rule.check(*(rows[component_type] for component_type in rule.component_types))
+            if result is not None:
+                results.setdefault(rule.name, []).append((rule, result))
+
+        return [Incompatibility(name, list(dict.fromkeys(component_type for rule, _result in checked
+                                                         for component_type in rule.component_types)),
+                                checked[0][0].message)
+                for name, checked in results.items() if not any(result for _rule, result in checked)]
+
+    def check_drone(self, drone):
+        return self.check({name: getattr(drone, f'{name}_id') for name in DRONE_PARTS})
+
+    def is_compatible(self, parts):
+        return not self.check(parts)
+
+
+compatibility_engine = CompatibilityEngine()
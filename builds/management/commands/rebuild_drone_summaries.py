@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from builds.summary import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = "Rebuild the summary of every drone, e.g. after bulk imports that skip signals."
+
+    def handle(self, *args, **options):
+        rebuild_summaries()
+        self.stdout.write("Rebuilt drone summaries")
@@ -0,0 +1,181 @@
+from django.db.models import Max, Min
+
+from builds.compatibility import DRONE_PARTS, AttributeTables
+from components.models import (
+    Antenna, AntennaDetail, Battery, Camera, FlightController, Frame, Motor, MotorDetail, Propeller, Receiver,
+    ReceiverDetail, SpeedController, Transmitter
+)
+
+# Motors and propellers per frame configuration; every configuration offered so far is a quad
+ROTORS_BY_CONFIGURATION = {
+    Frame.ConfigurationChoice.H_FRAME: 4,
+    Frame.ConfigurationChoice.X: 4,
+    Frame.ConfigurationChoice.HYBRID: 4,
+    Frame.ConfigurationChoice.BOX: 4,
+}
+DEFAULT_ROTORS = 4
+
+# Parts whose weight counts once per rotor
+PER_ROTOR_PARTS = ('motor', 'propeller')
+
+# Static thrust per watt of motor power at full throttle, typical of FPV motor and propeller pairs, in g/W
+THRUST_PER_WATT = 2.5
+# Share of the battery capacity used before landing
+USABLE_CAPACITY = 0.8
+
+
+def load_weights(model):
+    def load():
+        return {pk: {'weight': weight} for pk, weight in model.objects.values_list('pk', 'weight')}
+    return load
+
+
+def load_detail_weights(model):
+    """Weight of the lightest variant, for parts whose weight is on their detail rows."""
+    def load():
+        return {pk: {'weight': weight} for pk, weight in model.objects.values_list('pk').annotate(
+            weight=Min('details__weight'))}
+    return load
+
+
+def load_frames():
+    return {pk: {'weight': weight, 'rotors': ROTORS_BY_CONFIGURATION.get(configuration, DEFAULT_ROTORS)}
+            for pk, weight, configuration in Frame.objects.values_list('pk', 'weight', 'configuration')}
+
+
+def load_motors():
+    """The lightest variant's weight, and the highest peak current and power of any variant."""
+    motors = Motor.objects.values_list('pk').annotate(
+        weight=Min('details__weight'), peak_current=Max('details__peak_current'), max_power=Max('details__max_power'))
+    return {pk: {'weight': weight, 'peak_current': peak_current, 'max_power': max_power}
+            for pk, weight, peak_current, max_power in motors}
+
+
+def load_batteries():
+    fields = ('weight', 'capacity', 'discharge_current')
+    return {pk: dict(zip(fields, values)) for pk, *values in Battery.objects.values_list('pk', *fields)}
+
+
+def load_speed_controllers():
+    fields = ('weight', 'cont_current', 'burst_current')
+    return {pk: dict(zip(fields, values)) for pk, *values in SpeedController.objects.values_list('pk', *fields)}
+
+
+# Component type -> (loader, models the loader reads from)
+TABLES = {
+    'antenna': (load_detail_weights(Antenna), (Antenna, AntennaDetail)),
+    'battery': (load_batteries, (Battery,)),
+    'camera': (load_weights(Camera), (Camera,)),
+    'frame': (load_frames, (Frame,)),
+    'motor': (load_motors, (Motor, MotorDetail)),
+    'propeller': (load_weights(Propeller), (Propeller,)),
+    'receiver': (load_detail_weights(Receiver), (Receiver, ReceiverDetail)),
+    'transmitter': (load_weights(Transmitter), (Transmitter,)),
+    'flight_controller': (load_weights(FlightController), (FlightController,)),
+    'speed_controller': (load_speed_controllers, (SpeedController,)),
+}
+
+
+def get_build_key(parts):
+    """Part ids of a build as a tuple in ``DRONE_PARTS`` order, ``None`` for missing parts."""
+    return tuple(parts.get(name) for name in DRONE_PARTS)
+
+
+def get_drone_parts(drone):
+    return {name: getattr(drone, f'{name}_id') for name in DRONE_PARTS}
+
+
+def at_most(current, limit):
+    if current is None or limit is None:
+        return None
+    return current <= limit
+
+
+def get_metrics(rows):
+    """
+    Metrics of a build from the attribute rows of its parts. Values that need
+    missing parts or data are ``None``.
+
+    Thrust is estimated from the motors' max power (``THRUST_PER_WATT``).
+    Hover power follows momentum theory, growing with thrust to the power
+    of 1.5, so the hover current is the peak current times
+    ``(1 / thrust_to_weight) ** 1.5``.
+    """
+    rotors = rows['frame']['rotors'] if 'frame' in rows else DEFAULT_ROTORS
+    weights = {name: rows[name]['weight'] if name in rows else None for name in DRONE_PARTS}
+    missing_weights = [name for name, weight in weights.items() if weight is None]
+    weight = sum((weight * rotors if name in PER_ROTOR_PARTS else weight)
+                 for name, weight in weights.items() if weight is not None)
+    weight = weight if len(missing_weights) < len(DRONE_PARTS) else None
+
+    motor = rows.get('motor', {})
+    motor_current = motor.get('peak_current')
+    peak_current = motor_current * rotors if motor_current is not None else None
+    thrust_to_weight = None
+    if motor.get('max_power') is not None and weight:
+        thrust_to_weight = round(rotors * motor['max_power'] * THRUST_PER_WATT / weight, 2)
+
+    speed_controller = rows.get('speed_controller', {})
+    battery = rows.get('battery', {})
+    hover_time = None
+    if peak_current and thrust_to_weight and thrust_to_weight > 1 and battery.get('capacity') is not None:
+        hover_current = peak_current * (1 / thrust_to_weight) ** 1.5
+        hover_time = round(battery['capacity'] / 1000 * USABLE_CAPACITY / hover_current * 60, 1)
+
+    return {
+        'weight': round(weight, 2) if weight is not None else None,
+        'missing_weights': missing_weights,
+        'thrust_to_weight': thrust_to_weight,
+        'peak_current': round(peak_current, 2) if peak_current is not None else None,
+        'current_limits': {
+            'speed_controller_continuous': at_most(motor_current, speed_controller.get('cont_current')),
+            'speed_controller_burst': at_most(motor_current, speed_controller.get('burst_current')),
+            'battery': at_most(peak_current, battery.get('discharge_current')),
+        },
+        'hover_time': hover_time,
+    }
+
+
+class BuildMetrics(AttributeTables):
+    """
+    Weight, thrust-to-weight, current and hover time estimates of builds,
+    computed from attribute tables of part weights, currents and battery
+    capacities.
+
+    Results are memoized per part id tuple until a table is reloaded, so
+    listing many builds that share parts computes each combination once.
+    """
+    max_memoized = 10000
+
+    def __init__(self, tables=TABLES):
+        super().__init__(tables)
+
+    def clear(self):
+        super().clear()
+        self.metrics = {}
+        self.metrics_generations = None
+
+    def get(self, parts):
+        """Metrics of ``parts``, a mapping of component type to id."""
+        return self.get_many([parts])[0]
+
+    def get_drone(self, drone):
+        return self.get(get_drone_parts(drone))
+
+    def get_many(self, builds):
+        """Metrics of every build in ``builds``, in order."""
+        keys = [get_build_key(parts) for parts in builds]
+        tables = self.get_tables(self.tables)
+        with self.lock:
+            if self.metrics_generations != self.generations or len(self.metrics) > self.max_memoized:
+                self.metrics = {}
+                self.metrics_generations = {**self.generations}
+            for key in keys:
+                if key not in self.metrics:
+                    rows = {name: tables[name][pk] for name, pk in zip(DRONE_PARTS, key)
+                            if pk in tables.get(name, {})}
+                    self.metrics[key] = get_metrics(rows)
+            return [self.metrics[key] for key in keys]
+
+
+build_metrics = BuildMetrics()
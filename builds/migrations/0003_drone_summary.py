@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('builds', '0002_drone_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DroneSummary',
+            fields=[
+                ('drone', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='builds.drone')),
+                ('motor_kv_per_volt_min', models.FloatField(blank=True, null=True)),
+                ('motor_kv_per_volt_max', models.FloatField(blank=True, null=True)),
+                ('motor_max_power_min', models.FloatField(blank=True, null=True)),
+                ('motor_max_power_max', models.FloatField(blank=True, null=True)),
+                ('receiver_frequency_min', models.FloatField(blank=True, null=True)),
+                ('receiver_frequency_max', models.FloatField(blank=True, null=True)),
+                ('receiver_telemetry_power_min', models.FloatField(blank=True, null=True)),
+                ('receiver_telemetry_power_max', models.FloatField(blank=True, null=True)),
+                ('antenna_angle_types', models.TextField(blank=True, default='')),
+                ('camera_video_formats', models.TextField(blank=True, default='')),
+                ('receiver_protocols', models.TextField(blank=True, default='')),
+                ('transmitter_video_formats', models.TextField(blank=True, default='')),
+                ('weight', models.FloatField(blank=True, help_text='Total weight of the parts in grams', null=True)),
+            ],
+            options={
+                'verbose_name': 'Drone summary',
+                'verbose_name_plural': 'Drone summaries',
+                'db_table': 'builds_drone_summary',
+            },
+        ),
+    ]
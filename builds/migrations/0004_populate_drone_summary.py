@@ -0,0 +1,97 @@
+from collections import defaultdict
+
+from django.db import migrations
+from django.db.models import Max, Min
+
+# Copies of the builds.summary and builds.metrics lookups as of this migration, so later changes to the
+# summary fields do not change what it writes.
+RANGES = {
+    'motor_kv_per_volt': 'motor__details__kv_per_volt',
+    'motor_max_power': 'motor__details__max_power',
+    'receiver_frequency': 'receiver__details__frequency',
+    'receiver_telemetry_power': 'receiver__details__telemetry_power',
+}
+
+VALUE_SETS = {
+    'antenna_angle_types': 'antenna__details__angle_type',
+    'camera_video_formats': 'camera__video_formats__format',
+    'receiver_protocols': 'receiver__protocols__type',
+    'transmitter_video_formats': 'transmitter__video_formats__format',
+}
+VALUE_SEPARATOR = '|'
+
+WEIGHTS = {
+    'antenna': 'antenna__details__weight',
+    'battery': 'battery__weight',
+    'camera': 'camera__weight',
+    'frame': 'frame__weight',
+    'motor': 'motor__details__weight',
+    'propeller': 'propeller__weight',
+    'receiver': 'receiver__details__weight',
+    'transmitter': 'transmitter__weight',
+    'flight_controller': 'flight_controller__weight',
+    'speed_controller': 'speed_controller__weight',
+}
+
+ROTORS_BY_CONFIGURATION = {'h': 4, 'x': 4, 'hybrid': 4, 'box': 4}
+DEFAULT_ROTORS = 4
+PER_ROTOR_PARTS = ('motor', 'propeller')
+
+BATCH_SIZE = 1000
+
+
+def encode_values(values):
+    values = sorted({str(value) for value in values if value not in (None, '')})
+    return f'{VALUE_SEPARATOR}{VALUE_SEPARATOR.join(values)}{VALUE_SEPARATOR}' if values else ''
+
+
+def get_weight(row):
+    weights = {name: row[name] for name in WEIGHTS if row[name] is not None}
+    if not weights:
+        return None
+    rotors = ROTORS_BY_CONFIGURATION.get(row['frame__configuration'], DEFAULT_ROTORS)
+    return round(sum(weight * rotors if name in PER_ROTOR_PARTS else weight for name, weight in weights.items()), 2)
+
+
+def get_summaries(queryset):
+    queryset = queryset.order_by()
+    aggregates = {}
+    for name, lookup in RANGES.items():
+        aggregates[f'{name}_min'] = Min(lookup)
+        aggregates[f'{name}_max'] = Max(lookup)
+    for name, lookup in WEIGHTS.items():
+        aggregates[name] = Min(lookup)
+
+    summaries = {}
+    for row in queryset.values('pk', 'frame__configuration').annotate(**aggregates):
+        summaries[row['pk']] = {**{field: row[field] for field in aggregates if field not in WEIGHTS},
+                                'weight': get_weight(row)}
+
+    for name, lookup in VALUE_SETS.items():
+        values = defaultdict(list)
+        for pk, value in queryset.values_list('pk', lookup):
+            values[pk].append(value)
+        for pk, summary in summaries.items():
+            summary[name] = encode_values(values[pk])
+    return summaries
+
+
+def populate(apps, schema_editor):
+    Drone = apps.get_model('builds', 'Drone')
+    DroneSummary = apps.get_model('builds', 'DroneSummary')
+    DroneSummary.objects.bulk_create(
+        [DroneSummary(drone_id=pk, **fields) for pk, fields in get_summaries(Drone.objects.all()).items()],
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('builds', '0003_drone_summary'),
+        ('components', '0002_frame_prop_size_bounds'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('builds', '0004_populate_drone_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dronesummary',
+            index=models.Index(fields=['weight'], name='builds_summary_weight_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dronesummary',
+            index=models.Index(fields=['motor_kv_per_volt_max', 'motor_kv_per_volt_min'], name='builds_summary_motor_kv_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dronesummary',
+            index=models.Index(fields=['motor_max_power_max', 'motor_max_power_min'], name='builds_summary_motor_power_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dronesummary',
+            index=models.Index(fields=['receiver_frequency_max', 'receiver_frequency_min'], name='builds_summary_rx_freq_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dronesummary',
+            index=models.Index(fields=['receiver_telemetry_power_max', 'receiver_telemetry_power_min'], name='builds_summary_rx_power_idx'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:09
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('builds', '0005_drone_summary_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='dronesummary',
+            name='builds_summary_motor_kv_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='dronesummary',
+            name='builds_summary_motor_power_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='dronesummary',
+            name='builds_summary_rx_freq_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='dronesummary',
+            name='builds_summary_rx_power_idx',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='motor_kv_per_volt_max',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='motor_kv_per_volt_min',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='motor_max_power_max',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='motor_max_power_min',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='receiver_frequency_max',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='receiver_frequency_min',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='receiver_telemetry_power_max',
+        ),
+        migrations.RemoveField(
+            model_name='dronesummary',
+            name='receiver_telemetry_power_min',
+        ),
+    ]
@@ -1,3 +1,5 @@
+from django.db import models
+
 from builds.mixins import BaseDroneMixin
 from django.utils.translation import gettext_lazy as _
 
@@ -12,3 +14,40 @@ class Drone(BaseDroneMixin):
         verbose_name_plural = _('Drones')
         ordering = ('manufacturer', 'model')
         unique_together = (('manufacturer', 'model',),)
+        indexes = [
+            # Keyset pagination tie-breaks on id: manufacturer is nullable, so (manufacturer, model) is not unique.
+            models.Index(fields=['manufacturer', 'model', 'id'], name='builds_drone_keyset_idx'),
+        ]
+
+
+class DroneSummary(models.Model):
+    """
+    Denormalized filter columns of a drone: the distinct values of its parts'
+    many-to-many and detail fields, and its total weight. Kept up to date by
+    ``builds.signals`` (see ``builds.summary``), so ``DroneFilter`` reads one
+    row per drone instead of joining through every part.
+
+    Variant ranges (motor power, receiver frequency, ...) are not stored: a
+    min/max pair cannot tell whether one variant falls inside a requested
+    range, so those filters look the variants up themselves.
+    """
+    drone = models.OneToOneField(Drone, on_delete=models.CASCADE, primary_key=True, related_name='summary')
+
+    # Distinct values between separators, e.g. "|NTSC|PAL|"
+    antenna_angle_types = models.TextField(blank=True, default='')
+    camera_video_formats = models.TextField(blank=True, default='')
+    receiver_protocols = models.TextField(blank=True, default='')
+    transmitter_video_formats = models.TextField(blank=True, default='')
+
+    weight = models.FloatField(null=True, blank=True, help_text=_('Total weight of the parts in grams'))
+
+    class Meta:
+        app_label = 'builds'
+        db_table = 'builds_drone_summary'
+
+        verbose_name = _('Drone summary')
+        verbose_name_plural = _('Drone summaries')
+        indexes = [
+            # DroneFilter's weight filter starts from the summaries in range (see RelatedExistsFilterSet).
+            models.Index(fields=['weight'], name='builds_summary_weight_idx'),
+        ]
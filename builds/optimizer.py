@@ -0,0 +1,458 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from components.cache import get_generations
+from components.models import (
+    Battery, Camera, CameraDetail, FlightController, Frame, FrameCameraDetail, FrameMotorDetail, FrameVTXDetail,
+    Motor, MotorDetail, Propeller, RatedVoltage, SpeedController, Transmitter
+)
+
+ROTORS = 4
+
+OBJECTIVES = ('power_to_weight', 'energy_to_weight')
+ACCESSORIES = ('flight_controller', 'camera', 'transmitter')
+
+# Models the column arrays are read from
+SOURCE_MODELS = (Frame, FrameMotorDetail, FrameCameraDetail, FrameVTXDetail, Motor, MotorDetail, RatedVoltage,
+                 Propeller, Battery, SpeedController, FlightController, Camera, CameraDetail, Transmitter)
+
+
+def get_columns(queryset, *fields):
+    """``.values_list()`` rows as one float array per field, ``NaN`` for ``NULL``."""
+    rows = list(queryset.values_list(*fields))
+    if not rows:
+        return [np.empty(0) for _field in fields]
+    return [np.array(column, dtype=float) for column in zip(*rows)]
+
+
+def get_footprints(height, width):
+    """(short side, long side) rows, so sizes compare the same either way round."""
+    return np.sort(np.stack([height, width], axis=1), axis=1)
+
+
+def get_weights(weight, allowed=None):
+    """Part weights with unknown or excluded parts at ``inf``, so they are never picked."""
+    weight = np.where(np.isnan(weight), np.inf, weight)
+    if allowed is not None:
+        weight = np.where(allowed, weight, np.inf)
+    return weight
+
+
+def group_min(groups, values, size):
+    """Smallest value and its index per group, ``inf`` and -1 for empty groups."""
+    order = np.lexsort((values, groups))
+    groups, values_sorted = groups[order], values[order]
+    first = np.ones(len(groups), dtype=bool)
+    first[1:] = groups[1:] != groups[:-1]
+    minimum = np.full(size, np.inf)
+    index = np.full(size, -1)
+    minimum[groups[first]] = values_sorted[first]
+    index[groups[first]] = order[first]
+    return minimum, index
+
+
+def get_lightest_fit(mount_rows, mounts, size_rows, sizes, weights, frame_count):
+    """
+    Lightest part per frame among those with a size that fits within one of
+    the frame's mounts. Sizes and mounts are deduplicated first, so the fit
+    matrix is only (distinct mounts x distinct sizes).
+    """
+    unique_mounts, mount_class = np.unique(mounts, axis=0, return_inverse=True)
+    unique_sizes, size_class = np.unique(sizes, axis=0, return_inverse=True)
+    if not len(unique_mounts) or not len(unique_sizes):
+        return np.full(frame_count, np.inf), np.full(frame_count, -1)
+
+    size_weight, size_part = group_min(size_class.ravel(), weights[size_rows], len(unique_sizes))
+    size_part = np.where(size_part >= 0, size_rows[np.maximum(size_part, 0)], -1)
+    fits = np.all(unique_sizes[None, :, :] <= unique_mounts[:, None, :], axis=2)
+    fit_weight = np.where(fits, size_weight[None, :], np.inf)
+    best = fit_weight.argmin(axis=1)
+    mount_weight, mount_part = fit_weight[np.arange(len(unique_mounts)), best], size_part[best]
+
+    row_weight = mount_weight[mount_class.ravel()]
+    frame_weight, row = group_min(mount_rows, row_weight, frame_count)
+    frame_part = np.where(row >= 0, mount_part[mount_class.ravel()][np.maximum(row, 0)], -1)
+    return frame_weight, np.where(np.isfinite(frame_weight), frame_part, -1)
+
+
+def get_frontier(groups, columns, depth, batch_size=256):
+    """
+    Rows that fewer than ``depth`` rows of the same group dominate, where a
+    row dominates another when it is at least as low on every column (ties go
+    to the earlier row). A dominated row is never better than any of the rows
+    dominating it, so only the ``depth`` best of anything can be among them.
+
+    Rows are visited in lexicographic order, so dominating rows come first,
+    and each batch is only compared with the rows kept so far: a row with
+    ``depth`` dominators always has ``depth`` kept ones.
+    """
+    columns = np.stack(columns, axis=1)
+    _groups, group = np.unique(groups, axis=0, return_inverse=True)
+    order = np.lexsort((np.arange(len(columns)), *columns.T[::-1], group.ravel()))
+    boundaries = np.flatnonzero(np.diff(group.ravel()[order])) + 1
+    keep = np.zeros(len(columns), dtype=bool)
+    for rows in np.split(order, boundaries):
+        kept = np.empty((0, columns.shape[1]))
+        for start in range(0, len(rows), batch_size):
+            batch = columns[rows[start:start + batch_size]]
+            # Earlier rows of the batch come before it in the order, so they can only dominate later ones
+            candidates = np.concatenate([kept, batch])
+            not_worse = np.all(candidates[None, :, :] <= batch[:, None, :], axis=2)
+            ahead = np.arange(len(candidates))[None, :] < (len(kept) + np.arange(len(batch)))[:, None]
+            batch_keep = (not_worse & ahead).sum(axis=1) < depth
+            keep[rows[start:start + batch_size]] = batch_keep
+            kept = np.concatenate([kept, batch[batch_keep]])
+    return keep
+
+
+class OptimizerCatalog:
+    """Numeric column arrays of every part the optimizer picks from."""
+
+    def __init__(self):
+        self.frame_id, self.frame_weight, self.frame_prop_min, self.frame_prop_max = get_columns(
+            Frame.objects.all(), 'pk', 'weight', 'prop_size_min', 'prop_size_max')
+        frame_index = self.get_index(self.frame_id)
+
+        self.motor_mount_frame, *motor_mount = get_columns(
+            FrameMotorDetail.objects.all(), 'frame_id', 'motor_mount_height', 'motor_mount_width')
+        self.motor_mount_frame = frame_index(self.motor_mount_frame)
+        self.motor_mounts = get_footprints(*motor_mount)
+        self.camera_mount_frame, *camera_mount = get_columns(
+            FrameCameraDetail.objects.all(), 'frame_id', 'camera_mount_height', 'camera_mount_width')
+        self.camera_mount_frame = frame_index(self.camera_mount_frame)
+        self.camera_mounts = get_footprints(*camera_mount)
+        self.vtx_mount_frame, *vtx_mount = get_columns(
+            FrameVTXDetail.objects.all(), 'frame_id', 'vtx_mount_height', 'vtx_mount_width')
+        self.vtx_mount_frame = frame_index(self.vtx_mount_frame)
+        self.vtx_mounts = get_footprints(*vtx_mount)
+
+        # One row per motor detail: a motor is picked together with its KV / voltage variant
+        (self.motor_detail_id, self.motor_id, self.motor_weight, self.motor_max_power, self.motor_kv,
+         self.motor_peak_current, self.motor_min_cells, self.motor_max_cells, *motor_size) = get_columns(
+            MotorDetail.objects.all(), 'pk', 'motor_id', 'weight', 'max_power', 'kv_per_volt', 'peak_current',
+            'voltage__min_cells', 'voltage__max_cells', 'motor__mount_height', 'motor__mount_width')
+        self.motor_sizes = get_footprints(*motor_size)
+
+        self.propeller_id, self.propeller_weight, self.propeller_size = get_columns(
+            Propeller.objects.all(), 'pk', 'weight', 'size')
+
+        (self.battery_id, self.battery_weight, self.battery_series, self.battery_capacity, self.battery_voltage,
+         self.battery_discharge_current) = get_columns(
+            Battery.objects.all(), 'pk', 'weight', 'series', 'capacity', 'voltage', 'discharge_current')
+
+        (self.speed_controller_id, self.speed_controller_weight, self.speed_controller_cont_current,
+         self.speed_controller_min_cells, self.speed_controller_max_cells) = get_columns(
+            SpeedController.objects.all(), 'pk', 'weight', 'cont_current', 'voltage__min_cells',
+            'voltage__max_cells')
+
+        (self.flight_controller_id, self.flight_controller_weight, self.flight_controller_min_cells,
+         self.flight_controller_max_cells) = get_columns(
+            FlightController.objects.all(), 'pk', 'weight', 'voltage__min_cells', 'voltage__max_cells')
+
+        self.camera_id, self.camera_weight = get_columns(Camera.objects.all(), 'pk', 'weight')
+        self.camera_size_camera, *camera_size = get_columns(CameraDetail.objects.all(), 'camera_id', 'height', 'width')
+        self.camera_size_camera = self.get_index(self.camera_id)(self.camera_size_camera)
+        self.camera_sizes = get_footprints(*camera_size)
+
+        self.transmitter_id, self.transmitter_weight, *transmitter_size = get_columns(
+            Transmitter.objects.all(), 'pk', 'weight', 'length', 'height')
+        self.transmitter_sizes = get_footprints(*transmitter_size)
+
+    def get_index(self, ids):
+        """Maps ids to their row in ``ids``."""
+        order = np.argsort(ids)
+
+        def index(values):
+            return order[np.searchsorted(ids, values, sorter=order)].astype(int)
+        return index
+
+
+class BuildOptimizer:
+    """
+    Finds the best full builds under a weight limit.
+
+    The objective depends on the motor (``power_to_weight``: total max power
+    per gram) or the battery (``energy_to_weight``: Wh per gram), so every
+    other part is only weight and constraints. The search runs on column
+    arrays:
+
+    - propellers, cameras, VTXs, ESCs and flight controllers collapse to the
+      lightest compatible choice per frame, per battery cell count or per
+      (cell count, motor current), computed with broadcast masks;
+    - frames collapse to the ``limit`` lightest per motor mount size;
+    - (motor, battery) pairs are scored with their lightest frame, in batches
+      of motors broadcast against all batteries, keeping a running top
+      ``limit``; no build of a pair scores better than that, so only the top
+      pairs are then expanded with every frame.
+
+    Only the frame, motor, battery and ESC vary between the returned builds;
+    the other parts are the lightest ones that fit. The arrays are loaded on
+    first use and reloaded when a source model's cache generation moves.
+    """
+    batch_elements = 2 ** 22
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.catalog = None
+        self.generations = None
+
+    def get_catalog(self):
+        generations = get_generations(SOURCE_MODELS)
+        with self.lock:
+            if self.generations != generations:
+                self.catalog = OptimizerCatalog()
+                self.generations = generations
+            return self.catalog
+
+    def optimize(self, max_weight=None, objective='power_to_weight', limit=10, accessories=ACCESSORIES, parts=None):
+        """
+        Top ``limit`` builds by ``objective``, at most ``max_weight`` grams
+        all-up. ``parts`` restricts component types to the given ids, e.g.
+        ``{'frame': [12]}``.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f'Unknown objective {objective!r}')
+        catalog = self.get_catalog()
+        parts = parts or {}
+        max_weight = np.inf if max_weight is None else max_weight
+
+        def allowed(component_type, ids):
+            if component_type not in parts:
+                return None
+            return np.isin(ids, list(parts[component_type]))
+
+        motor_weight = get_weights(catalog.motor_weight, allowed('motor', catalog.motor_id))
+        battery_weight = get_weights(catalog.battery_weight, allowed('battery', catalog.battery_id))
+        airframe = self.get_airframes(catalog, accessories, allowed)
+        frames = self.get_lightest_frames(catalog, airframe.weight, limit)
+        speed_controllers = self.get_speed_controllers(catalog, allowed)
+        flight_controllers = self.get_flight_controllers(catalog, accessories, allowed)
+
+        # Motors whose mount size no frame has, or unknown weights, cannot be part of a build
+        motor_class = self.get_mount_class(frames.mounts, catalog.motor_sizes)
+        motor_rows = np.flatnonzero(np.isfinite(motor_weight) & (motor_class >= 0))
+        battery_rows = np.flatnonzero(np.isfinite(battery_weight))
+        if not len(motor_rows) or not len(battery_rows):
+            return []
+
+        motor_rows, battery_rows = self.get_candidates(catalog, objective, limit, motor_rows, battery_rows,
+                                                       motor_class, motor_weight, battery_weight)
+
+        series_index = np.searchsorted(speed_controllers.series, catalog.battery_series[battery_rows])
+        flight_controller_weight = flight_controllers.weight[series_index]
+        battery_total = battery_weight[battery_rows] + flight_controller_weight
+        energy = catalog.battery_capacity[battery_rows] * catalog.battery_voltage[battery_rows] / 1000
+        peak_current = np.nan_to_num(catalog.motor_peak_current)
+
+        # (motor, battery) pairs scored with their lightest frame bound every build they are part of, so the
+        # top builds are all among the top pairs: rank pairs first, then expand only those with every frame
+        pair_scores, pairs = np.empty(0), np.empty((0, 2), dtype=int)
+        pair_weights = np.empty(0)
+        series = catalog.battery_series[battery_rows][None, :]
+        lightest_frame = frames.weight[:, 0]
+        batch = max(1, self.batch_elements // len(battery_rows))
+        for start in range(0, len(motor_rows), batch):
+            rows = motor_rows[start:start + batch]
+            fits = ((catalog.motor_min_cells[rows][:, None] <= series)
+                    & (series <= catalog.motor_max_cells[rows][:, None])
+                    & (catalog.battery_discharge_current[battery_rows][None, :]
+                       >= ROTORS * peak_current[rows][:, None]))
+            esc_weight, _esc = speed_controllers.lookup(series_index, peak_current[rows])
+            weight = np.where(fits, ROTORS * motor_weight[rows][:, None] + battery_total[None, :] + esc_weight, np.inf)
+            score = self.get_scores(objective, catalog.motor_max_power[rows][:, None], energy[None, :],
+                                    weight + lightest_frame[motor_class[rows]][:, None], max_weight).ravel()
+
+            top = self.get_top(score, limit)
+            motor, battery = np.unravel_index(top, weight.shape)
+            pair_scores = np.concatenate([pair_scores, score[top]])
+            pairs = np.concatenate([pairs, np.stack([rows[motor], battery], 1)])
+            pair_weights = np.concatenate([pair_weights, weight[motor, battery]])
+            keep = np.argsort(-pair_scores, kind='stable')[:limit]
+            pair_scores, pairs, pair_weights = pair_scores[keep], pairs[keep], pair_weights[keep]
+
+        motor, battery = pairs[:, 0], pairs[:, 1]
+        weight = pair_weights[:, None] + frames.weight[motor_class[motor]]
+        score = self.get_scores(objective, catalog.motor_max_power[motor][:, None], energy[battery][:, None],
+                                weight, max_weight).ravel()
+        top = self.get_top(score, limit)
+        top = top[np.argsort(-score[top], kind='stable')]
+        pair, frame = np.unravel_index(top, weight.shape)
+        best_scores = score[top]
+        best_builds = np.stack([motor[pair], battery_rows[battery[pair]], frame], 1)
+
+        return [self.get_build(catalog, score, motor, battery, frames.index[motor_class[motor], frame], airframe,
+                               speed_controllers, flight_controllers, peak_current, motor_weight, battery_weight)
+                for score, (motor, battery, frame) in zip(best_scores, best_builds)]
+
+    def get_candidates(self, catalog, objective, limit, motor_rows, battery_rows, motor_class, motor_weight,
+                       battery_weight):
+        """
+        Drops the motors and batteries that cannot be in the top ``limit``:
+        motors that ``limit`` others with the same mount and cell range beat
+        on weight, peak current (so they take the same batteries and ESCs)
+        and, for ``power_to_weight``, max power; batteries that ``limit``
+        others with the same cell count beat on weight, discharge current
+        and, for ``energy_to_weight``, energy.
+        """
+        motor_columns = [motor_weight[motor_rows], np.nan_to_num(catalog.motor_peak_current[motor_rows])]
+        if objective == 'power_to_weight':
+            motor_columns.append(-np.nan_to_num(catalog.motor_max_power[motor_rows]))
+        motor_groups = np.stack([motor_class[motor_rows], catalog.motor_min_cells[motor_rows],
+                                 catalog.motor_max_cells[motor_rows]], axis=1)
+        motor_rows = motor_rows[get_frontier(motor_groups, motor_columns, limit)]
+
+        battery_columns = [battery_weight[battery_rows],
+                           -np.nan_to_num(catalog.battery_discharge_current[battery_rows])]
+        if objective == 'energy_to_weight':
+            battery_columns.append(-np.nan_to_num(catalog.battery_capacity[battery_rows]
+                                                  * catalog.battery_voltage[battery_rows]))
+        battery_groups = catalog.battery_series[battery_rows][:, None]
+        battery_rows = battery_rows[get_frontier(battery_groups, battery_columns, limit)]
+        return motor_rows, battery_rows
+
+    def get_scores(self, objective, max_power, energy, weight, max_weight):
+        """Objective per gram, ``-inf`` for builds that do not fit or are over ``max_weight``."""
+        value = np.nan_to_num(ROTORS * max_power if objective == 'power_to_weight' else energy)
+        with np.errstate(invalid='ignore'):
+            return np.where(np.isfinite(weight) & (weight <= max_weight), value / weight, -np.inf)
+
+    def get_top(self, score, limit):
+        """Indices of the ``limit`` best finite scores, unordered."""
+        if len(score) > limit:
+            score_top = np.argpartition(-score, limit - 1)[:limit]
+        else:
+            score_top = np.arange(len(score))
+        return score_top[np.isfinite(score[score_top])]
+
+    def get_airframes(self, catalog, accessories, allowed):
+        """Frame weight plus the lightest fitting propellers, camera and VTX, per frame."""
+        frame_count = len(catalog.frame_id)
+        propeller_weight = get_weights(catalog.propeller_weight, allowed('propeller', catalog.propeller_id))
+        sizes, size_class = np.unique(catalog.propeller_size, return_inverse=True)
+        size_weight, size_part = group_min(size_class, propeller_weight, len(sizes))
+        low = np.nan_to_num(catalog.frame_prop_min, nan=0)[:, None]
+        fits = (low <= sizes[None, :]) & (sizes[None, :] <= catalog.frame_prop_max[:, None])
+        fit_weight = np.where(fits, size_weight[None, :], np.inf)
+        best = fit_weight.argmin(axis=1) if len(sizes) else np.zeros(frame_count, dtype=int)
+        propeller_weight = fit_weight[np.arange(frame_count), best] if len(sizes) else np.full(frame_count, np.inf)
+
+        weight = get_weights(catalog.frame_weight, allowed('frame', catalog.frame_id)) + ROTORS * propeller_weight
+        airframe = SimpleNamespace(propeller=np.where(np.isfinite(propeller_weight), size_part[best], -1))
+        if 'camera' in accessories:
+            camera_weight, airframe.camera = get_lightest_fit(
+                catalog.camera_mount_frame, catalog.camera_mounts, catalog.camera_size_camera, catalog.camera_sizes,
+                get_weights(catalog.camera_weight, allowed('camera', catalog.camera_id)), frame_count)
+            weight = weight + camera_weight
+        if 'transmitter' in accessories:
+            vtx_weight, airframe.transmitter = get_lightest_fit(
+                catalog.vtx_mount_frame, catalog.vtx_mounts, np.arange(len(catalog.transmitter_id)),
+                catalog.transmitter_sizes,
+                get_weights(catalog.transmitter_weight, allowed('transmitter', catalog.transmitter_id)), frame_count)
+            weight = weight + vtx_weight
+        airframe.weight = weight
+        return airframe
+
+    def get_lightest_frames(self, catalog, airframe_weight, limit):
+        """
+        The ``limit`` lightest airframes per motor mount size, as
+        (mount sizes x limit) weight and frame index arrays.
+        """
+        mounts, mount_class = np.unique(catalog.motor_mounts, axis=0, return_inverse=True)
+        mount_class = mount_class.ravel()
+        weight = np.full((len(mounts), limit), np.inf)
+        index = np.zeros((len(mounts), limit), dtype=int)
+        for mount in range(len(mounts)):
+            frames = np.unique(catalog.motor_mount_frame[mount_class == mount])
+            frames = frames[np.argsort(airframe_weight[frames], kind='stable')[:limit]]
+            weight[mount, :len(frames)] = airframe_weight[frames]
+            index[mount, :len(frames)] = frames
+        return SimpleNamespace(mounts=mounts, weight=weight, index=index)
+
+    def get_mount_class(self, mounts, sizes):
+        """Row of each size in ``mounts``, -1 when no frame has that mount."""
+        if not len(mounts):
+            return np.full(len(sizes), -1)
+        matches = np.all(sizes[:, None, :] == mounts[None, :, :], axis=2)
+        return np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+
+    def get_speed_controllers(self, catalog, allowed):
+        """
+        Lightest ESC per battery cell count and motor current: for each cell
+        count, the ESCs that take it are sorted by continuous current, and a
+        suffix minimum over their weight ranks gives the lightest one rated
+        for at least any current with one ``searchsorted``.
+        """
+        series = np.unique(catalog.battery_series)
+        weight = get_weights(catalog.speed_controller_weight, allowed('speed_controller',
+                                                                      catalog.speed_controller_id))
+        order = np.argsort(catalog.speed_controller_cont_current, kind='stable')
+        current = catalog.speed_controller_cont_current[order]
+        takes = ((catalog.speed_controller_min_cells[order][None, :] <= series[:, None])
+                 & (series[:, None] <= catalog.speed_controller_max_cells[order][None, :]))
+
+        # Rank by weight (ties by id order); ESCs that do not take the cell count rank after all others
+        by_weight = np.argsort(weight[order], kind='stable')
+        rank = np.empty(len(order), dtype=int)
+        rank[by_weight] = np.arange(len(order))
+        rank = np.where(takes & np.isfinite(weight[order])[None, :], rank[None, :], len(order))
+        best_rank = np.minimum.accumulate(rank[:, ::-1], axis=1)[:, ::-1]
+        best = np.append(order[by_weight], -1)[best_rank]
+
+        def lookup(series_index, peak_current):
+            """(motors x batteries) weight and row of the lightest ESC, ``inf`` and -1 where none fits."""
+            position = np.searchsorted(current, peak_current, side='left')
+            found = position < len(current)
+            if not len(current):
+                return np.full((len(peak_current), len(series_index)), np.inf), \
+                    np.full((len(peak_current), len(series_index)), -1)
+            position = np.minimum(position, len(current) - 1)
+            index = np.where(found[:, None], best[series_index[None, :], position[:, None]], -1)
+            return np.where(index >= 0, weight[index], np.inf), index
+
+        return SimpleNamespace(series=series, lookup=lookup)
+
+    def get_flight_controllers(self, catalog, accessories, allowed):
+        """Lightest flight controller per battery cell count (no weight when not part of the builds)."""
+        series = np.unique(catalog.battery_series)
+        if 'flight_controller' not in accessories:
+            return SimpleNamespace(weight=np.zeros(len(series)), index=np.full(len(series), -1))
+        weight = get_weights(catalog.flight_controller_weight, allowed('flight_controller',
+                                                                       catalog.flight_controller_id))
+        takes = ((catalog.flight_controller_min_cells[None, :] <= series[:, None])
+                 & (series[:, None] <= catalog.flight_controller_max_cells[None, :]))
+        weight = np.where(takes, weight[None, :], np.inf)
+        if not weight.shape[1]:
+            return SimpleNamespace(weight=np.full(len(series), np.inf), index=np.full(len(series), -1))
+        index = weight.argmin(axis=1)
+        return SimpleNamespace(weight=weight[np.arange(len(series)), index], index=index)
+
+    def get_build(self, catalog, score, motor, battery, frame, airframe, speed_controllers, flight_controllers,
+                  peak_current, motor_weight, battery_weight):
+        series_index = np.searchsorted(speed_controllers.series, catalog.battery_series[[battery]])
+        esc_weight, esc = speed_controllers.lookup(series_index, peak_current[[motor]])
+        flight_controller = flight_controllers.index[series_index[0]]
+        propeller = airframe.propeller[frame]
+
+        def get_id(ids, row):
+            return int(ids[row]) if row >= 0 else None
+
+        build = {
+            'frame': get_id(catalog.frame_id, frame),
+            'motor': get_id(catalog.motor_id, motor),
+            'motor_detail': get_id(catalog.motor_detail_id, motor),
+            'propeller': get_id(catalog.propeller_id, propeller),
+            'battery': get_id(catalog.battery_id, battery),
+            'speed_controller': get_id(catalog.speed_controller_id, esc[0, 0]),
+            'flight_controller': get_id(catalog.flight_controller_id, flight_controller),
+            'camera': get_id(catalog.camera_id, getattr(airframe, 'camera', np.full(frame + 1, -1))[frame]),
+            'transmitter': get_id(catalog.transmitter_id,
+                                  getattr(airframe, 'transmitter', np.full(frame + 1, -1))[frame]),
+        }
+        weight = (airframe.weight[frame] + ROTORS * motor_weight[motor] + battery_weight[battery]
+                  + esc_weight[0, 0] + flight_controllers.weight[series_index[0]])
+        return {'score': round(float(score), 6), 'weight': round(float(weight), 2), 'parts': build}
+
+
+build_optimizer = BuildOptimizer()
@@ -0,0 +1,41 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from builds.models import Drone
+from builds.summary import get_dependent_drones, get_dependent_relations, get_dependents, update_summaries
+
+
+@receiver(post_save)
+def summary_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if sender is Drone:
+        update_summaries([instance.pk])
+    elif sender in get_dependents():
+        update_summaries(get_dependent_drones(sender, [instance.pk]))
+
+
+@receiver(pre_delete)
+def collect_summary_drones(sender, instance, **kwargs):
+    # After the delete the drones can no longer be looked up by this instance.
+    if sender in get_dependents():
+        instance._summary_drones = get_dependent_drones(sender, [instance.pk])
+
+
+@receiver(post_delete)
+def summary_deleted(sender, instance, **kwargs):
+    update_summaries(getattr(instance, '_summary_drones', ()))
+
+
+@receiver(m2m_changed)
+def summary_relation_changed(sender, instance, action, model, pk_set, **kwargs):
+    if sender not in get_dependent_relations():
+        return
+    drones = get_dependent_drones(type(instance), [instance.pk])
+    if pk_set:
+        drones |= get_dependent_drones(model, pk_set)
+    if action.startswith('pre_'):
+        # Removed and cleared rows can only be followed before the change.
+        instance._summary_drones = drones
+    else:
+        update_summaries(drones | getattr(instance, '_summary_drones', set()))
@@ -0,0 +1,139 @@
+from collections import defaultdict
+from functools import cache
+
+from django.db.models import Min
+from django.db.models.constants import LOOKUP_SEP
+
+from builds.metrics import DEFAULT_ROTORS, PER_ROTOR_PARTS, ROTORS_BY_CONFIGURATION
+from builds.models import Drone, DroneSummary
+
+BATCH_SIZE = 1000
+
+# Summary field -> lookup from Drone; stored as the distinct values between separators
+VALUE_SETS = {
+    'antenna_angle_types': 'antenna__details__angle_type',
+    'camera_video_formats': 'camera__video_formats__format',
+    'receiver_protocols': 'receiver__protocols__type',
+    'transmitter_video_formats': 'transmitter__video_formats__format',
+}
+VALUE_SEPARATOR = '|'
+
+# Part -> lookup from Drone of its weight; parts with variants weigh as much as their lightest one
+WEIGHTS = {
+    'antenna': 'antenna__details__weight',
+    'battery': 'battery__weight',
+    'camera': 'camera__weight',
+    'frame': 'frame__weight',
+    'motor': 'motor__details__weight',
+    'propeller': 'propeller__weight',
+    'receiver': 'receiver__details__weight',
+    'transmitter': 'transmitter__weight',
+    'flight_controller': 'flight_controller__weight',
+    'speed_controller': 'speed_controller__weight',
+}
+
+SUMMARY_FIELDS = (*VALUE_SETS, 'weight')
+
+
+def encode_values(values):
+    """Distinct values as ``|a|b|``, so a value is matched with ``contains='|a|'``."""
+    values = sorted({str(value) for value in values if value not in (None, '')})
+    return f'{VALUE_SEPARATOR}{VALUE_SEPARATOR.join(values)}{VALUE_SEPARATOR}' if values else ''
+
+
+def encode_value(value):
+    return f'{VALUE_SEPARATOR}{value}{VALUE_SEPARATOR}'
+
+
+def get_weight(row):
+    weights = {name: row[name] for name in WEIGHTS if row[name] is not None}
+    if not weights:
+        return None
+    rotors = ROTORS_BY_CONFIGURATION.get(row['frame__configuration'], DEFAULT_ROTORS)
+    return round(sum(weight * rotors if name in PER_ROTOR_PARTS else weight for name, weight in weights.items()), 2)
+
+
+def get_summaries(queryset):
+    """
+    Summary fields of every drone in the queryset. Weights take one
+    aggregate query, every value set one more.
+    """
+    queryset = queryset.order_by()
+    aggregates = {name: Min(lookup) for name, lookup in WEIGHTS.items()}
+
+    summaries = {}
+    for row in queryset.values('pk', 'frame__configuration').annotate(**aggregates):
+        summaries[row['pk']] = {'weight': get_weight(row)}
+
+    for name, lookup in VALUE_SETS.items():
+        values = defaultdict(list)
+        for pk, value in queryset.values_list('pk', lookup):
+            values[pk].append(value)
+        for pk, summary in summaries.items():
+            summary[name] = encode_values(values[pk])
+    return summaries
+
+
+def save_summaries(summary_model, summaries):
+    summary_model.objects.bulk_create(
+        [summary_model(drone_id=pk, **fields) for pk, fields in summaries.items()],
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['drone'],
+        update_fields=SUMMARY_FIELDS,
+    )
+
+
+def update_summaries(pks):
+    """Recompute the summaries of the given drones; deleted drones lose theirs with them."""
+    pks = set(pks)
+    if pks:
+        save_summaries(DroneSummary, get_summaries(Drone.objects.filter(pk__in=pks)))
+
+
+def rebuild_summaries():
+    DroneSummary.objects.all().delete()
+    save_summaries(DroneSummary, get_summaries(Drone.objects.all()))
+
+
+@cache
+def get_dependents():
+    """
+    Map every model a summary field is read from to its lookups from
+    Drone, e.g. MotorDetail to ``motor__details``.
+    """
+    return get_summary_relations()[0]
+
+
+@cache
+def get_dependent_relations():
+    """Through models of the many-to-many relations summary fields are read through."""
+    return get_summary_relations()[1]
+
+
+def get_summary_relations():
+    dependents = {}
+    relations = set()
+    for field_name in (*VALUE_SETS.values(), *WEIGHTS.values(), 'frame__configuration'):
+        model = Drone
+        path = []
+        for name in field_name.split(LOOKUP_SEP):
+            field = model._meta.get_field(name)
+            if not field.is_relation:
+                break
+            if field.many_to_many:
+                relations.add(field.remote_field.through)
+            path.append(name)
+            model = field.related_model
+            lookup = LOOKUP_SEP.join(path)
+            if lookup not in dependents.setdefault(model, []):
+                dependents[model].append(lookup)
+    return dependents, relations
+
+
+def get_dependent_drones(model, pks):
+    """Ids of the drones whose summary reads from the given objects."""
+    drones = set()
+    for lookup in get_dependents().get(model, ()):
+        drones.update(Drone.objects.filter(**{f'{lookup}__in': pks}).values_list('pk', flat=True))
+    return drones
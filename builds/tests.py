@@ -1 +1,357 @@
-# Create your tests here.
+from mixer.backend.django import mixer
+from rest_framework.reverse import reverse
+
+from api.v1.tests import BaseAPITest
+from builds.compatibility import CompatibilityEngine
+from builds.metrics import BuildMetrics
+from builds.models import Drone, DroneSummary
+from builds.summary import rebuild_summaries
+from builds.optimizer import BuildOptimizer
+from components.models import (
+    Antenna, AntennaConnector, AntennaDetail, Battery, Camera, CameraDetail, FlightController, Frame,
+    FrameCameraDetail, FrameMotorDetail, FrameVTXDetail, Motor, MotorDetail, Propeller, RatedVoltage, Receiver,
+    ReceiverDetail, ReceiverProtocolType, SpeedController, Transmitter, VideoFormat
+)
+
+
+class TestCompatibilityEngine(BaseAPITest):
+
+    def setUp(self):
+        mixer.register(Propeller, description='TestPropeller')
+        mixer.register(Battery, description='TestBattery', size='18650', voltage=22.2)
+        self.engine = CompatibilityEngine()
+
+        self.frame = mixer.blend(Frame, prop_size='5')
+        mixer.blend(FrameMotorDetail, frame=self.frame, motor_mount_height=16, motor_mount_width=16)
+        mixer.blend(FrameCameraDetail, frame=self.frame, camera_mount_height=19, camera_mount_width=19)
+        mixer.blend(FrameVTXDetail, frame=self.frame, vtx_mount_height=30.5, vtx_mount_width=30.5)
+
+        self.four_to_six = mixer.blend(RatedVoltage, min_cells=4, max_cells=6)
+        self.motor = mixer.blend(Motor, mount_height=16, mount_width=16)
+        mixer.blend(MotorDetail, motor=self.motor, voltage=self.four_to_six)
+        self.propeller = mixer.blend(Propeller, size=5)
+        self.battery = mixer.blend(Battery, series=6)
+
+        self.sma = mixer.blend(AntennaConnector, type='SMA')
+        self.ipex = mixer.blend(AntennaConnector, type='IPEX')
+        self.antenna = mixer.blend(Antenna)
+        mixer.blend(AntennaDetail, antenna=self.antenna, connector_type=self.sma)
+        self.transmitter = mixer.blend(Transmitter, length=30, height=30, input_voltage_min=7, input_voltage_max=26)
+        self.transmitter.antenna_connectors.add(self.sma)
+
+        self.camera = mixer.blend(Camera)
+        mixer.blend(CameraDetail, camera=self.camera, height=19, width=19)
+
+    def get_parts(self, **parts):
+        return {'frame': self.frame.pk, 'motor': self.motor.pk, 'propeller': self.propeller.pk,
+                'battery': self.battery.pk, 'antenna': self.antenna.pk, 'transmitter': self.transmitter.pk,
+                'camera': self.camera.pk, **parts}
+
+    def get_rules(self, **parts):
+        return [issue.rule for issue in self.engine.check(self.get_parts(**parts))]
+
+    def test_compatible_build(self):
+        self.assertEqual(self.engine.check(self.get_parts()), [])
+
+    def test_motor_mount(self):
+        motor = mixer.blend(Motor, mount_height=19, mount_width=19)
+        self.assertEqual(self.get_rules(motor=motor.pk), ['motor_mount'])
+
+    def test_prop_size(self):
+        propeller = mixer.blend(Propeller, size=7)
+        self.assertEqual(self.get_rules(propeller=propeller.pk), ['prop_size'])
+
+        self.frame.prop_size = '6-7'
+        self.frame.save()
+        self.assertEqual((self.frame.prop_size_min, self.frame.prop_size_max), (6, 7))
+        self.assertEqual(self.get_rules(), ['prop_size'])
+
+    def test_battery_cells(self):
+        battery = mixer.blend(Battery, series=8)
+        flight_controller = mixer.blend(FlightController, voltage=self.four_to_six)
+        speed_controller = mixer.blend(SpeedController, voltage=mixer.blend(RatedVoltage, min_cells=3, max_cells=8))
+        self.assertEqual(self.get_rules(battery=battery.pk, flight_controller=flight_controller.pk,
+                                        speed_controller=speed_controller.pk),
+                         ['motor_cells', 'flight_controller_cells'])
+
+    def test_mounts(self):
+        camera = mixer.blend(Camera)
+        mixer.blend(CameraDetail, camera=camera, height=22, width=22)
+        transmitter = mixer.blend(Transmitter, length=36, height=36, input_voltage_min=7, input_voltage_max=26)
+        transmitter.antenna_connectors.add(self.sma)
+        self.assertEqual(self.get_rules(camera=camera.pk, transmitter=transmitter.pk), ['camera_mount', 'vtx_mount'])
+
+    def test_antenna_connector(self):
+        receiver = mixer.blend(Receiver)
+        receiver.antenna_connectors.add(self.ipex)
+        # Fitting either radio is enough
+        self.assertEqual(self.get_rules(receiver=receiver.pk), [])
+
+        antenna = mixer.blend(Antenna)
+        mixer.blend(AntennaDetail, antenna=antenna, connector_type=self.ipex)
+        self.assertEqual(self.get_rules(receiver=None, antenna=antenna.pk), ['antenna_connector'])
+        self.assertEqual(self.get_rules(receiver=receiver.pk, antenna=antenna.pk), [])
+
+    def test_check_without_queries(self):
+        self.engine.check(self.get_parts())
+        with self.assertNumQueries(0):
+            self.engine.check(self.get_parts())
+
+    def test_reloaded_on_change(self):
+        self.assertEqual(self.get_rules(), [])
+        self.frame.prop_size = '3'
+        self.frame.save()
+        self.assertEqual(self.get_rules(), ['prop_size'])
+
+    def test_check_drone(self):
+        drone = mixer.blend(Drone, frame=self.frame, motor=mixer.blend(Motor, mount_height=12, mount_width=12))
+        self.assertEqual([issue.rule for issue in self.engine.check_drone(drone)], ['motor_mount'])
+
+        url = reverse('api:v1:builds:drone-compatibility', args=[drone.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data['compatible'])
+        self.assertEqual(response.data['issues'][0]['component_types'], ['frame', 'motor'])
+
+
+class TestBuildOptimizer(BaseAPITest):
+
+    def setUp(self):
+        mixer.register(Propeller, description='TestPropeller')
+        mixer.register(Battery, description='TestBattery', size='18650', voltage=22.2)
+        self.optimizer = BuildOptimizer()
+        self.engine = CompatibilityEngine()
+
+        self.light_frame = self.blend_frame(weight=100)
+        self.heavy_frame = self.blend_frame(weight=150)
+        self.propeller = mixer.blend(Propeller, size=5, weight=4)
+        mixer.blend(Propeller, size=7, weight=1)
+
+        four_to_six = mixer.blend(RatedVoltage, min_cells=4, max_cells=6)
+        self.motor = self.blend_motor(16, four_to_six, weight=30, max_power=800)
+        self.strong_motor = self.blend_motor(16, four_to_six, weight=35, max_power=1000)
+        # No frame takes its mount
+        self.blend_motor(19, four_to_six, weight=30, max_power=5000)
+
+        self.battery = mixer.blend(Battery, series=6, weight=200, capacity=1300, voltage=22.2, discharge_current=200)
+        # Above the motors' rated voltages
+        mixer.blend(Battery, series=7, weight=100, capacity=5000, voltage=25.9, discharge_current=200)
+        self.speed_controller = mixer.blend(SpeedController, voltage=four_to_six, cont_current=50, weight=10)
+        self.flight_controller = mixer.blend(FlightController, voltage=four_to_six, weight=8)
+        self.camera = mixer.blend(Camera, weight=6)
+        mixer.blend(CameraDetail, camera=self.camera, height=19, width=19)
+        self.transmitter = mixer.blend(Transmitter, length=30, height=30, weight=5)
+
+    def blend_frame(self, weight):
+        frame = mixer.blend(Frame, prop_size='5', weight=weight)
+        mixer.blend(FrameMotorDetail, frame=frame, motor_mount_height=16, motor_mount_width=16)
+        mixer.blend(FrameCameraDetail, frame=frame, camera_mount_height=19, camera_mount_width=19)
+        mixer.blend(FrameVTXDetail, frame=frame, vtx_mount_height=30.5, vtx_mount_width=30.5)
+        return frame
+
+    def blend_motor(self, mount, voltage, **detail):
+        motor = mixer.blend(Motor, mount_height=mount, mount_width=mount)
+        mixer.blend(MotorDetail, motor=motor, voltage=voltage, peak_current=30, **detail)
+        return motor
+
+    def test_best_build(self):
+        build, *_builds = self.optimizer.optimize()
+        self.assertEqual(build['parts'], {
+            'frame': self.light_frame.pk, 'motor': self.strong_motor.pk,
+            'motor_detail': self.strong_motor.details.get().pk, 'propeller': self.propeller.pk,
+            'battery': self.battery.pk, 'speed_controller': self.speed_controller.pk,
+            'flight_controller': self.flight_controller.pk, 'camera': self.camera.pk,
+            'transmitter': self.transmitter.pk,
+        })
+        weight = 100 + 4 * 4 + 4 * 35 + 200 + 10 + 8 + 6 + 5
+        self.assertEqual(build['weight'], weight)
+        self.assertEqual(build['score'], round(4 * 1000 / weight, 6))
+
+        parts = {component_type: pk for component_type, pk in build['parts'].items()
+                 if component_type != 'motor_detail'}
+        self.assertEqual(self.engine.check(parts), [])
+
+    def test_ranking(self):
+        builds = self.optimizer.optimize()
+        self.assertEqual([(build['parts']['motor'], build['parts']['frame']) for build in builds], [
+            (self.strong_motor.pk, self.light_frame.pk), (self.strong_motor.pk, self.heavy_frame.pk),
+            (self.motor.pk, self.light_frame.pk), (self.motor.pk, self.heavy_frame.pk),
+        ])
+        self.assertEqual(len(self.optimizer.optimize(limit=1)), 1)
+
+    def test_max_weight(self):
+        builds = self.optimizer.optimize(max_weight=480)
+        self.assertEqual([build['parts']['motor'] for build in builds], [self.motor.pk])
+        self.assertEqual(self.optimizer.optimize(max_weight=100), [])
+
+    def test_fixed_parts(self):
+        builds = self.optimizer.optimize(parts={'frame': [self.heavy_frame.pk], 'motor': [self.motor.pk]})
+        self.assertEqual([(build['parts']['motor'], build['parts']['frame']) for build in builds],
+                         [(self.motor.pk, self.heavy_frame.pk)])
+
+    def test_accessories(self):
+        build, *_builds = self.optimizer.optimize(accessories=())
+        self.assertEqual(build['weight'], 100 + 4 * 4 + 4 * 35 + 200 + 10)
+        self.assertIsNone(build['parts']['camera'])
+
+    def test_energy_to_weight(self):
+        build, *_builds = self.optimizer.optimize(objective='energy_to_weight')
+        self.assertEqual(build['parts']['motor'], self.motor.pk)
+        with self.assertRaises(ValueError):
+            self.optimizer.optimize(objective='price')
+
+    def test_reloaded_on_change(self):
+        self.optimizer.optimize()
+        self.light_frame.weight = 200
+        self.light_frame.save()
+        build, *_builds = self.optimizer.optimize()
+        self.assertEqual(build['parts']['frame'], self.heavy_frame.pk)
+
+    def test_optimize_endpoint(self):
+        url = reverse('api:v1:builds:drone-optimize')
+        response = self.client.get(url, {'max_weight': 600, 'frame': [self.heavy_frame.pk], 'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([build['parts']['frame'] for build in response.data['results']], [self.heavy_frame.pk])
+
+        response = self.client.get(url, {'objective': 'price'})
+        self.assertEqual(response.status_code, 400)
+
+
+class TestBuildMetrics(BaseAPITest):
+
+    def setUp(self):
+        mixer.register(Propeller, description='TestPropeller')
+        mixer.register(Battery, description='TestBattery', size='18650', voltage=22.2)
+        self.metrics = BuildMetrics()
+
+        self.frame = mixer.blend(Frame, weight=100, configuration=Frame.ConfigurationChoice.X)
+        self.motor = mixer.blend(Motor)
+        mixer.blend(MotorDetail, motor=self.motor, weight=30, peak_current=30, max_power=800)
+        mixer.blend(MotorDetail, motor=self.motor, weight=32, peak_current=35, max_power=900)
+        self.propeller = mixer.blend(Propeller, weight=4)
+        self.battery = mixer.blend(Battery, weight=200, capacity=1300, discharge_current=100)
+        self.speed_controller = mixer.blend(SpeedController, weight=10, cont_current=40, burst_current=50)
+        self.antenna = mixer.blend(Antenna)
+        mixer.blend(AntennaDetail, antenna=self.antenna, weight=2)
+        self.receiver = mixer.blend(Receiver)
+        mixer.blend(ReceiverDetail, receiver=self.receiver, weight=1, frequency=2400, telemetry_power=20)
+
+    def get_parts(self, **parts):
+        return {'frame': self.frame.pk, 'motor': self.motor.pk, 'propeller': self.propeller.pk,
+                'battery': self.battery.pk, 'speed_controller': self.speed_controller.pk,
+                'antenna': self.antenna.pk, 'receiver': self.receiver.pk, **parts}
+
+    def test_metrics(self):
+        metrics = self.metrics.get(self.get_parts())
+        weight = 100 + 4 * 30 + 4 * 4 + 200 + 10 + 2 + 1
+        thrust_to_weight = round(4 * 900 * 2.5 / weight, 2)
+        self.assertEqual(metrics['weight'], weight)
+        self.assertEqual(metrics['missing_weights'], ['camera', 'transmitter', 'flight_controller'])
+        self.assertEqual(metrics['thrust_to_weight'], thrust_to_weight)
+        self.assertEqual(metrics['peak_current'], 4 * 35)
+        self.assertEqual(metrics['current_limits'], {
+            'speed_controller_continuous': True, 'speed_controller_burst': True, 'battery': False,
+        })
+        hover_current = 4 * 35 * (1 / thrust_to_weight) ** 1.5
+        self.assertEqual(metrics['hover_time'], round(1.3 * 0.8 / hover_current * 60, 1))
+
+    def test_missing_parts(self):
+        metrics = self.metrics.get({'frame': self.frame.pk, 'motor': self.motor.pk})
+        self.assertEqual(metrics['weight'], 100 + 4 * 30)
+        self.assertEqual(metrics['current_limits'], {
+            'speed_controller_continuous': None, 'speed_controller_burst': None, 'battery': None,
+        })
+        self.assertIsNone(metrics['hover_time'])
+        self.assertIsNone(self.metrics.get({})['weight'])
+
+    def test_memoized(self):
+        first = self.metrics.get(self.get_parts())
+        with self.assertNumQueries(0):
+            self.assertIs(self.metrics.get_many([self.get_parts(), self.get_parts()])[1], first)
+
+    def test_reloaded_on_change(self):
+        self.metrics.get(self.get_parts())
+        self.battery.weight = 250
+        self.battery.save()
+        self.assertEqual(self.metrics.get(self.get_parts())['weight'], 100 + 4 * 30 + 4 * 4 + 250 + 10 + 2 + 1)
+
+    def test_drone_metrics(self):
+        mixer.blend(Drone, frame=self.frame, motor=self.motor, battery=self.battery)
+        response = self.client.get(reverse('api:v1:builds:drone-list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['metrics']['weight'], 100 + 4 * 30 + 200)
+
+    def test_metrics_endpoint(self):
+        url = reverse('api:v1:builds:drone-metrics')
+        response = self.client.post(url, {'frame': self.frame.pk, 'propeller': self.propeller.pk}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['weight'], 100 + 4 * 4)
+
+        response = self.client.post(url, {'frame': 'x'}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class TestDroneSummary(BaseAPITest):
+
+    def setUp(self):
+        mixer.register(Propeller, description='TestPropeller')
+        self.frame = mixer.blend(Frame, weight=100, configuration=Frame.ConfigurationChoice.X)
+        self.motor = mixer.blend(Motor)
+        mixer.blend(MotorDetail, motor=self.motor, weight=30, kv_per_volt=1700, max_power=800)
+        mixer.blend(MotorDetail, motor=self.motor, weight=32, kv_per_volt=2450, max_power=900)
+        self.propeller = mixer.blend(Propeller, weight=4)
+        self.pal = mixer.blend(VideoFormat, format='PAL')
+        self.ntsc = mixer.blend(VideoFormat, format='NTSC')
+        self.camera = mixer.blend(Camera, weight=6)
+        self.camera.video_formats.add(self.pal)
+        self.receiver = mixer.blend(Receiver)
+        self.receiver.protocols.add(mixer.blend(ReceiverProtocolType, type='CRSF'))
+        mixer.blend(ReceiverDetail, receiver=self.receiver, weight=1, frequency=2400, telemetry_power=20)
+
+        self.drone = mixer.blend(Drone, frame=self.frame, motor=self.motor, propeller=self.propeller,
+                                 camera=self.camera, receiver=self.receiver)
+
+    def get_summary(self):
+        return DroneSummary.objects.get(drone=self.drone)
+
+    def test_summary(self):
+        summary = self.get_summary()
+        self.assertEqual(summary.camera_video_formats, '|PAL|')
+        self.assertEqual(summary.receiver_protocols, '|CRSF|')
+        self.assertEqual(summary.transmitter_video_formats, '')
+        self.assertEqual(summary.weight, 100 + 4 * 30 + 4 * 4 + 6 + 1)
+
+    def test_refreshed_on_detail_change(self):
+        detail = mixer.blend(MotorDetail, motor=self.motor, weight=25, kv_per_volt=3000, max_power=700)
+        self.assertEqual(self.get_summary().weight, 100 + 4 * 25 + 4 * 4 + 6 + 1)
+
+        detail.delete()
+        self.assertEqual(self.get_summary().weight, 100 + 4 * 30 + 4 * 4 + 6 + 1)
+
+    def test_refreshed_on_relation_change(self):
+        self.camera.video_formats.add(self.ntsc)
+        self.assertEqual(self.get_summary().camera_video_formats, '|NTSC|PAL|')
+        self.pal.camera_set.remove(self.camera)
+        self.assertEqual(self.get_summary().camera_video_formats, '|NTSC|')
+        self.camera.video_formats.clear()
+        self.assertEqual(self.get_summary().camera_video_formats, '')
+
+        self.ntsc.format = 'HD'
+        self.ntsc.save()
+        self.camera.video_formats.add(self.ntsc)
+        self.assertEqual(self.get_summary().camera_video_formats, '|HD|')
+
+    def test_refreshed_on_part_change(self):
+        self.frame.weight = 120
+        self.frame.save()
+        self.assertEqual(self.get_summary().weight, 120 + 4 * 30 + 4 * 4 + 6 + 1)
+
+        self.receiver.delete()
+        summary = self.get_summary()
+        self.assertEqual(summary.weight, 120 + 4 * 30 + 4 * 4 + 6)
+        self.assertEqual(summary.receiver_protocols, '')
+
+    def test_rebuild(self):
+        DroneSummary.objects.all().delete()
+        rebuild_summaries()
+        self.assertEqual(self.get_summary().weight, 100 + 4 * 30 + 4 * 4 + 6 + 1)
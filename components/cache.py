@@ -0,0 +1,51 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+TRACKED_APPS = ('components', 'builds', 'galleries', 'documents', 'lists', 'users')
+
+GENERATION_KEY = 'catalog:generation:{}'
+
+
+def get_cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def is_tracked_model(model):
+    return model._meta.app_label in TRACKED_APPS
+
+
+def get_generation_key(model):
+    return GENERATION_KEY.format(model._meta.label_lower)
+
+
+def start_generation(cache, key):
+    cache.add(key, time.time_ns(), timeout=None)
+
+
+def get_generations(models):
+    """
+    Current generation of every model, as ``(key, generation)`` pairs ordered
+    by key. A generation is the time of the model's last change, in
+    nanoseconds; a counter that was never set (or was evicted) starts at the
+    current time, so it never comes back at a value something was cached
+    under.
+    """
+    cache = get_cache()
+    keys = sorted({get_generation_key(model) for model in models})
+    generations = cache.get_many(keys)
+    missing = [key for key in keys if key not in generations]
+    if missing:
+        for key in missing:
+            start_generation(cache, key)
+        generations.update(cache.get_many(missing))
+    return [(key, generations.get(key)) for key in keys]
+
+
+def bump_generation(model):
+    """
+    Moves the model to a new generation, so every cached response built from
+    it gets a new key. Responses built from other models keep theirs.
+    """
+    get_cache().set(get_generation_key(model), time.time_ns(), timeout=None)
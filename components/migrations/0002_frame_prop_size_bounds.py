@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:00
+
+import re
+
+from django.db import migrations, models
+
+
+def get_prop_sizes(prop_size):
+    # Copy of components.models.frame.get_prop_sizes as of this migration
+    sizes = [float(size) for size in re.findall(r'\d+(?:\.\d+)?', prop_size or '')]
+    if not sizes:
+        return None, None
+    return (min(sizes) if len(sizes) > 1 else None), max(sizes)
+
+
+def populate(apps, schema_editor):
+    Frame = apps.get_model('components', 'Frame')
+    frames = list(Frame.objects.only('prop_size'))
+    for frame in frames:
+        frame.prop_size_min, frame.prop_size_max = get_prop_sizes(frame.prop_size)
+    Frame.objects.bulk_update(frames, ['prop_size_min', 'prop_size_max'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('components', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='frame',
+            name='prop_size_max',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='frame',
+            name='prop_size_min',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,5 @@
+import re
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -9,7 +11,29 @@ from components.mixins.base_frame_mixins import (
 )
 
 
+def get_prop_sizes(prop_size):
+    """
+    Propeller size bounds of a frame's ``prop_size``, in inches: ``'5'``
+    takes props up to 5" (no lower bound), ``'5-6'`` from 5" to 6".
+    """
+    sizes = [float(size) for size in re.findall(r'\d+(?:\.\d+)?', prop_size or '')]
+    if not sizes:
+        return None, None
+    return (min(sizes) if len(sizes) > 1 else None), max(sizes)
+
+
 class Frame(BaseFrameMixin):
+    # Numeric bounds of prop_size, so compatibility filters can compare them in SQL
+    prop_size_min = models.FloatField(null=True, blank=True, editable=False)
+    prop_size_max = models.FloatField(null=True, blank=True, editable=False)
+
+    def set_prop_sizes(self):
+        self.prop_size_min, self.prop_size_max = get_prop_sizes(self.prop_size)
+
+    def save(self, *args, **kwargs):
+        self.set_prop_sizes()
+        super().save(*args, **kwargs)
+
     class Meta:
         app_label = 'components'
         db_table = 'components_frame'
@@ -0,0 +1,34 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from components.cache import bump_generation, is_tracked_model
+from components.similarity import similarity_index
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_model(sender, **kwargs):
+    if is_tracked_model(sender):
+        bump_generation(sender)
+
+
+@receiver(m2m_changed)
+def invalidate_relation(sender, instance, action, model, **kwargs):
+    if not action.startswith('post_'):
+        return
+    for changed_model in (type(instance), model):
+        if is_tracked_model(changed_model):
+            bump_generation(changed_model)
+
+
+# Registered after invalidate_model, so the similarity index sees the generation a change moved its models to
+@receiver(pre_save)
+@receiver(pre_delete)
+def similarity_changing(sender, instance, **kwargs):
+    similarity_index.before_change(sender, instance.pk)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def similarity_changed(sender, instance, **kwargs):
+    similarity_index.after_change(sender, instance.pk)
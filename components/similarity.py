@@ -0,0 +1,248 @@
+import threading
+import warnings
+from functools import cache
+
+import numpy as np
+from django.db.models import Avg, F, Max, Min
+from django.db.models.constants import LOOKUP_SEP
+
+from components.cache import get_generations
+from components.models import (
+    Antenna, Camera, FlightController, Frame, Motor, Propeller, Receiver, SpeedController, Stack, Transmitter
+)
+
+DEFAULT_LIMIT = 10
+
+# Component type -> (model, feature name -> lookup or aggregate); parts with variants use their details' aggregate
+FEATURES = {
+    'antenna': (Antenna, {'center_frequency': 'center_frequency', 'gain': 'gain', 'swr': 'swr'}),
+    'camera': (Camera, {'fov': 'fov', 'tvl': 'tvl', 'weight': 'weight'}),
+    'frame': (Frame, {'prop_size_min': 'prop_size_min', 'prop_size_max': 'prop_size_max', 'weight': 'weight'}),
+    'motor': (Motor, {
+        'stator_diameter': 'stator_diameter',
+        'stator_height': 'stator_height',
+        'kv_per_volt': Avg('details__kv_per_volt'),
+        'max_power': Max('details__max_power'),
+        'weight': Min('details__weight'),
+    }),
+    'propeller': (Propeller, {'size': 'size', 'pitch': 'pitch', 'weight': 'weight'}),
+    'receiver': (Receiver, {
+        'frequency': Avg('details__frequency'),
+        'telemetry_power': Max('details__telemetry_power'),
+        'weight': Min('details__weight'),
+    }),
+    'transmitter': (Transmitter, {
+        'max_power': 'max_power', 'channels_quantity': 'channels_quantity', 'output_voltage': 'output_voltage',
+        'weight': 'weight',
+    }),
+    'flight_controller': (FlightController, {
+        'mount_length': 'mount_length', 'mount_width': 'mount_width', 'gyro_max_freq': 'gyro__max_freq',
+        'weight': 'weight',
+    }),
+    'speed_controller': (SpeedController, {
+        'mount_length': 'mount_length', 'mount_width': 'mount_width', 'cont_current': 'cont_current',
+        'burst_current': 'burst_current', 'weight': 'weight',
+    }),
+    'stack': (Stack, {
+        'mount_length': 'flight_controller__mount_length',
+        'mount_width': 'flight_controller__mount_width',
+        'gyro_max_freq': 'flight_controller__gyro__max_freq',
+        'cont_current': 'speed_controller__cont_current',
+        'flight_controller_weight': 'flight_controller__weight',
+        'speed_controller_weight': 'speed_controller__weight',
+    }),
+}
+
+
+def get_lookup(feature):
+    if isinstance(feature, str):
+        return feature
+    return feature.get_source_expressions()[0].name
+
+
+@cache
+def get_dependents(component_type):
+    """
+    Models the features of ``component_type`` are read from, each with its
+    lookups from the part model, e.g. MotorDetail to ``details``.
+    """
+    part_model, features = FEATURES[component_type]
+    dependents = {part_model: []}
+    for feature in features.values():
+        model = part_model
+        path = []
+        for name in get_lookup(feature).split(LOOKUP_SEP):
+            field = model._meta.get_field(name)
+            if not field.is_relation:
+                break
+            path.append(name)
+            model = field.related_model
+            lookup = LOOKUP_SEP.join(path)
+            if lookup not in dependents.setdefault(model, []):
+                dependents[model].append(lookup)
+    return dependents
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def load_features(component_type, pks=None):
+    """Feature vectors by part id, ``NaN`` for unknown values; all parts, or those of ``pks`` that exist."""
+    model, features = FEATURES[component_type]
+    queryset = model.objects.order_by()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    annotations = {f'feature_{name}': F(feature) if isinstance(feature, str) else feature
+                   for name, feature in features.items()}
+    rows = queryset.values('pk').annotate(**annotations).values_list('pk', *annotations)
+    return {pk: [to_float(value) for value in values] for pk, *values in rows}
+
+
+class FeatureIndex:
+    """
+    Feature matrix of one component type, z-score normalized per feature, and
+    the nearest-neighbour search over it. Rows are patched in place when parts
+    change; the normalization follows every patch.
+    """
+
+    def __init__(self, rows, features):
+        self.ids = np.fromiter(rows, dtype=np.int64, count=len(rows))
+        self.raw = np.array(list(rows.values()), dtype=float).reshape(len(rows), features)
+        self.index_positions()
+        self.normalize()
+
+    def index_positions(self):
+        self.position = {pk: row for row, pk in enumerate(self.ids.tolist())}
+
+    def normalize(self):
+        with warnings.catch_warnings():
+            # Features no part has a value for are all NaN
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.nanmean(self.raw, axis=0)
+            std = np.nanstd(self.raw, axis=0)
+        std = np.where(np.isfinite(std) & (std > 0), std, 1)
+        self.matrix = (self.raw - np.nan_to_num(mean)) / std
+
+    def update(self, rows, pks):
+        """Replaces the rows of ``pks`` with ``rows``; ids missing from ``rows`` were deleted."""
+        removed = [self.position[pk] for pk in pks if pk not in rows and pk in self.position]
+        for pk, values in rows.items():
+            if pk in self.position:
+                self.raw[self.position[pk]] = values
+        added = [pk for pk in rows if pk not in self.position]
+        if removed:
+            self.ids = np.delete(self.ids, removed)
+            self.raw = np.delete(self.raw, removed, axis=0)
+        if added:
+            self.ids = np.concatenate([self.ids, np.array(added, dtype=np.int64)])
+            self.raw = np.vstack([self.raw, np.array([rows[pk] for pk in added], dtype=float)])
+        if removed or added:
+            self.index_positions()
+        self.normalize()
+
+    def nearest(self, pk, limit):
+        """
+        Up to ``limit`` ``(id, distance)`` pairs closest to part ``pk``, nearest
+        first. The distance is the root mean square of the normalized
+        differences over the features both parts have.
+        """
+        row = self.position.get(pk)
+        if row is None or limit < 1:
+            return []
+        difference = self.matrix - self.matrix[row]
+        known = ~np.isnan(difference)
+        counts = known.sum(axis=1)
+        distances = np.sqrt((np.where(known, difference, 0) ** 2).sum(axis=1) / np.maximum(counts, 1))
+        distances[counts == 0] = np.inf
+        distances[row] = np.inf
+
+        candidates = np.flatnonzero(np.isfinite(distances))
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(distances[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.lexsort((self.ids[candidates], distances[candidates]))]
+        return [(int(self.ids[index]), round(float(distances[index]), 4)) for index in candidates]
+
+
+class SimilarityIndex:
+    """
+    Nearest parts of the same type by normalized numeric features, for
+    suggesting substitutes. Feature matrices are loaded per component type on
+    first use.
+
+    Changes are followed through the cache generations of the models features
+    are read from (see ``components.cache``). When this process saw every
+    change since the matrix was loaded (``before_change`` / ``after_change``,
+    called by ``components.signals``), only the changed parts are read again;
+    changes made elsewhere reload the whole matrix.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.indexes = {}
+            self.generations = {}
+            self.pending = {}
+
+    def get_index(self, component_type):
+        generations = get_generations(get_dependents(component_type))
+        with self.lock:
+            index = self.indexes.get(component_type)
+            pending = self.pending.pop(component_type, set())
+            if index is None or self.generations.get(component_type) != generations:
+                index = FeatureIndex(load_features(component_type), len(FEATURES[component_type][1]))
+                self.indexes[component_type] = index
+            elif pending:
+                index.update(load_features(component_type, pending), pending)
+            self.generations[component_type] = generations
+            return index
+
+    def get_alternatives(self, component_type, pk, limit=DEFAULT_LIMIT):
+        """``(id, distance)`` pairs of the parts most similar to part ``pk``, nearest first."""
+        return self.get_index(component_type).nearest(pk, limit)
+
+    def get_changed_parts(self, component_type, model, pk):
+        """Ids of the ``component_type`` parts whose features read from ``model`` object ``pk``."""
+        part_model = FEATURES[component_type][0]
+        if model is part_model:
+            return {pk}
+        parts = set()
+        for lookup in get_dependents(component_type)[model]:
+            parts.update(part_model.objects.filter(**{lookup: pk}).values_list('pk', flat=True))
+        return parts
+
+    def get_loaded_types(self, model):
+        with self.lock:
+            return [component_type for component_type in self.indexes if model in get_dependents(component_type)]
+
+    def before_change(self, model, pk):
+        """
+        Collects the parts an object is about to move away from or be deleted
+        from, and drops matrices whose models changed since they were read.
+        """
+        for component_type in self.get_loaded_types(model):
+            generations = get_generations(get_dependents(component_type))
+            parts = self.get_changed_parts(component_type, model, pk) if pk is not None else set()
+            with self.lock:
+                if self.generations.get(component_type) != generations:
+                    self.generations.pop(component_type, None)
+                self.pending.setdefault(component_type, set()).update(parts)
+
+    def after_change(self, model, pk):
+        """Collects the parts an object now belongs to; called after its generation moved."""
+        for component_type in self.get_loaded_types(model):
+            parts = self.get_changed_parts(component_type, model, pk)
+            generations = get_generations(get_dependents(component_type))
+            with self.lock:
+                self.pending.setdefault(component_type, set()).update(parts)
+                if component_type in self.generations:
+                    self.generations[component_type] = generations
+
+
+similarity_index = SimilarityIndex()
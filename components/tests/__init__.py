@@ -4,4 +4,5 @@ from .frame_tests import TestFrameModel
 from .motor_tests import TestMotorModel
 from .receiver_tests import TestReceiverModel
 from .stack_tests import TestStackModel
-from .transmitter_tests import TestTransmitterModel
\ No newline at end of file
+from .transmitter_tests import TestTransmitterModel
+from .similarity_tests import TestSimilarityIndex
@@ -0,0 +1,61 @@
+from django.test import TestCase
+from mixer.backend.django import mixer
+
+from components.cache import bump_generation
+from components.models import Antenna, AntennaType, Motor, MotorDetail, RatedVoltage
+from components.similarity import FeatureIndex, similarity_index
+
+
+class TestSimilarityIndex(TestCase):
+
+    def setUp(self):
+        similarity_index.clear()
+        antenna_type = mixer.blend(AntennaType)
+        self.antennas = [mixer.blend(Antenna, type=antenna_type, description='Antenna', center_frequency=frequency,
+                                     bandwidth_min=1, bandwidth_max=10, gain=gain, swr=1.5)
+                         for frequency, gain in ((5.8, 3), (5.8, 2.5), (5.7, 3.2), (2.4, 8))]
+
+    def test_nearest(self):
+        index = FeatureIndex({1: [0, 0], 2: [1, 0], 3: [0, 3], 4: [float('nan'), 0.1], 5: [float('nan')] * 2}, 2)
+        self.assertEqual([pk for pk, _distance in index.nearest(1, 10)], [4, 2, 3])
+        self.assertEqual([pk for pk, _distance in index.nearest(1, 2)], [4, 2])
+        self.assertEqual(index.nearest(5, 10), [])
+        self.assertEqual(index.nearest(6, 10), [])
+
+    def test_alternatives(self):
+        first, second, third, fourth = self.antennas
+        alternatives = similarity_index.get_alternatives('antenna', first.pk)
+        self.assertEqual([pk for pk, _distance in alternatives], [third.pk, second.pk, fourth.pk])
+        self.assertEqual(alternatives, sorted(alternatives, key=lambda alternative: alternative[1]))
+
+    def test_detail_features(self):
+        voltage = mixer.blend(RatedVoltage, min_cells=2, max_cells=6)
+        motors = [mixer.blend(Motor, stator_diameter=diameter, stator_height='07', description='Motor')
+                  for diameter in ('22', '23', '28')]
+        for motor, kv_per_volt in zip(motors, (2400, 2300, 1300)):
+            mixer.blend(MotorDetail, motor=motor, voltage=voltage, kv_per_volt=kv_per_volt, max_power=600, weight=30,
+                        peak_current=30, idle_current=1, resistance=50)
+
+        alternatives = similarity_index.get_alternatives('motor', motors[0].pk)
+        self.assertEqual([pk for pk, _distance in alternatives], [motors[1].pk, motors[2].pk])
+
+    def test_incremental_update(self):
+        first, second, third, fourth = self.antennas
+        index = similarity_index.get_index('antenna')
+
+        fourth.center_frequency = 5.8
+        fourth.gain = 3
+        fourth.save()
+        with self.assertNumQueries(1):
+            alternatives = similarity_index.get_alternatives('antenna', first.pk, limit=1)
+        self.assertIs(similarity_index.get_index('antenna'), index)
+        self.assertEqual(alternatives, [(fourth.pk, 0.0)])
+
+        third.delete()
+        self.assertNotIn(third.pk, [pk for pk, _distance in similarity_index.get_alternatives('antenna', first.pk)])
+        self.assertIs(similarity_index.get_index('antenna'), index)
+
+    def test_reload_on_changes_made_elsewhere(self):
+        index = similarity_index.get_index('antenna')
+        bump_generation(Antenna)
+        self.assertIsNot(similarity_index.get_index('antenna'), index)
@@ -66,7 +66,8 @@ INSTALLED_APPS = [
     'documents',
     'suggestions',
     'users',
-    'lists.apps.ListsConfig'
+    'lists.apps.ListsConfig',
+    'search',
 ]
 
 AUTH_USER_MODEL = 'users.User'
@@ -250,6 +251,22 @@ STATICFILES_DIRS = [
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# CACHE
+# locmem by default; point CACHE_BACKEND at django.core.cache.backends.redis.RedisCache
+# (or filebased.FileBasedCache) to share cached API responses between workers.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    },
+}
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', 60 * 60))
+
+# SEARCH
+# Dotted path to a search.backends.SearchBackend; picked from the database vendor when empty.
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND')
+
 # REDIS
 CHANNEL_LAYERS = {
     "default": {
@@ -1,6 +1,12 @@
-from django.db import models
-from django.db.models import QuerySet
+from functools import reduce
 from itertools import chain
+from operator import add
+
+from django.db import models
+from django.db.models import Count, IntegerField, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+from .registry import ComponentRegistry
 
 
 class ListItemQuerySet(QuerySet):
@@ -32,3 +38,28 @@ class ListItemManager(models.Manager):
         This helps prevent the N+1 query problem when accessing component details.
         """
         return self.get_queryset().include_component_data()
+
+
+
+def get_item_count_name(component_type):
+    return f'{component_type}_items_count'
+
+
+class ListQuerySet(QuerySet):
+    """QuerySet for lists with their item counts."""
+
+    def with_item_counts(self):
+        """
+        Annotates every list with the number of its items of each component
+        type (``<type>_items_count``) and in total (``parts_count``), as
+        correlated subqueries on the ``list_id`` of each item table, instead
+        of joining all ten tables and counting distinct rows.
+        """
+        counts = {
+            get_item_count_name(component_type): Coalesce(Subquery(
+                item_model.objects.filter(list=OuterRef('pk')).order_by().values('list')
+                .annotate(count=Count('pk')).values('count'),
+                output_field=IntegerField()), 0)
+            for component_type, item_model in ComponentRegistry.get_items()
+        }
+        return self.annotate(**counts, parts_count=reduce(add, counts.values()))
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('components', '0002_frame_prop_size_bounds'),
+        ('lists', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='antennalistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_anten_list_id_a64fbb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cameralistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_camer_list_id_8f3752_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='flightcontrollerlistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_fligh_list_id_feda89_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='framelistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_frame_list_id_043a0e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='motorlistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_motor_list_id_fcdad4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propellerlistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_prope_list_id_253197_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='receiverlistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_recei_list_id_aa008d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='speedcontrollerlistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_speed_list_id_4803be_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stacklistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_stack_list_id_80d66c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transmitterlistitem',
+            index=models.Index(fields=['list', 'added_at'], name='lists_trans_list_id_8b1922_idx'),
+        ),
+    ]
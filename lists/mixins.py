@@ -54,4 +54,5 @@ class BaseListItemMixin(models.Model):
     class Meta:
         abstract = True
         unique_together = [('list', 'component')]
-        ordering = ['-added_at']
\ No newline at end of file
+        ordering = ['-added_at']
+        indexes = [models.Index(fields=['list', 'added_at'])]
\ No newline at end of file
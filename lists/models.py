@@ -1,53 +1,144 @@
+from collections import defaultdict
 from itertools import chain
 
-from django.db import models
-from django.db.models import Count
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connections, models, transaction
+from django.db.models import Q, Value
 from django.utils.translation import gettext_lazy as _
+from components.cache import bump_generation
 from components.mixins import BaseModelMixin
-from .managers import ListItemManager
+from .managers import ListItemManager, ListQuerySet, get_item_count_name
 from .mixins import BaseListMixin, BaseListItemMixin
 from .registry import ComponentRegistry
 
+# Items loaded per batch by ``List.iter_items``
+ITEMS_BATCH_SIZE = 500
+
+
+# Order of the items of a list; ids only tell apart items of one type added at the same time
+ITEM_ORDERING = ('-added_at', 'component_type', '-id')
+
+
+def get_item_position_filter(component_type, added_at, after_type, after_id):
+    """
+    Items of ``component_type`` sorted after the item ``(added_at, after_type,
+    after_id)`` in ``ITEM_ORDERING``.
+    """
+    if component_type < after_type:
+        return Q(added_at__lt=added_at)
+    if component_type > after_type:
+        return Q(added_at__lte=added_at)
+    return Q(added_at__lt=added_at) | Q(added_at=added_at, id__lt=after_id)
+
+
+def get_component_model(component_type):
+    return ComponentRegistry.get_model(component_type)._meta.get_field('component').related_model
+
 
 class List(BaseListMixin, BaseModelMixin):
     """
     Represents a user's list of favorite components.
     Users can create multiple lists to organize their components.
     """
+    objects = ListQuerySet.as_manager()
 
     def get_all_items(self):
         """
         Returns all items in the list, sorted by when they were added.
-        Uses a more efficient approach that works with all databases.
+        Loaded with one UNION query plus one per component type in the list.
         """
-        # Use a list to collect all items
-        all_items = []
-
-        for component_type in ComponentRegistry.get_all_types():
-            related_name = f"{component_type}_items"
-            if not hasattr(self, related_name):
-                continue
+        return self.get_items()
 
-            # Get items for this component type
-            items = getattr(self, related_name).include_component_data()
-
-            # Add component type info to each item
-            for item in items:
-                # Set an attribute so the template can determine the component type
-                item.component_type = component_type
-                all_items.append(item)
+    def get_item_rows(self, component_types=None, after=None, limit=None):
+        """
+        ``(component_type, id, component_id, added_at)`` of the items of the
+        list, newest first, as a single ``UNION ALL`` query across the list
+        item tables; only those of ``component_types`` when given.
+
+        ``after`` is the ``(added_at, component_type, id)`` of an item; only
+        the items sorted after it are returned, each table reading from its
+        ``(list, added_at)`` index. ``limit`` is the number of rows the caller
+        reads at most: where the database allows it, every table returns no
+        more than that many before they are merged.
+        """
+        types = [component_type for component_type in ComponentRegistry.get_all_types()
+                 if component_types is None or component_type in component_types]
+        features = connections[self._state.db or DEFAULT_DB_ALIAS].features
+        limit_tables = limit is not None and len(types) > 1 and features.supports_slicing_ordering_in_compound
+
+        querysets = []
+        for component_type, item_model in ComponentRegistry.get_items():
+            if component_type not in types:
+                # Left out of the UNION
+                queryset = item_model.objects.none()
+            else:
+                queryset = item_model.objects.filter(list=self)
+            if after is not None:
+                queryset = queryset.filter(get_item_position_filter(component_type, *after))
+            queryset = (queryset.annotate(component_type=Value(component_type, output_field=models.CharField()))
+                        .values_list('component_type', 'id', 'component_id', 'added_at'))
+            querysets.append(queryset.order_by('-added_at', '-id')[:limit] if limit_tables else queryset.order_by())
+        return querysets[0].union(*querysets[1:], all=True).order_by(*ITEM_ORDERING)
+
+    def get_items(self, offset=0, limit=None, component_types=None, after=None):
+        """
+        Items of the list, newest first, each with its ``component`` and
+        ``component_type`` set. ``offset`` and ``limit`` are applied in SQL,
+        ``component_types`` and ``after`` as in ``get_item_rows``.
+        """
+        rows = self.get_item_rows(component_types, after, offset + limit if limit is not None else None)
+        rows = rows[offset:offset + limit] if limit is not None else rows[offset:]
+        return self.load_items(rows)
 
-        # Sort by added_at (newest first)
-        return sorted(all_items, key=lambda x: x.added_at, reverse=True)
-    
-    
+    def iter_items(self, batch_size=ITEMS_BATCH_SIZE):
+        """
+        Yields every item of the list, newest first, like ``get_items``, while
+        holding one batch of them in memory at a time.
+        """
+        batch = []
+        for row in self.get_item_rows().iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield from self.load_items(batch)
+                batch = []
+        yield from self.load_items(batch)
+
+    def load_items(self, rows):
+        """
+        List item instances for the rows of ``get_item_rows``, with their
+        components read with one ``in_bulk`` per component type in the rows.
+        """
+        component_ids = defaultdict(list)
+        for component_type, _pk, component_id, _added_at in rows:
+            component_ids[component_type].append(component_id)
+        components = {
+            component_type: get_component_model(component_type)._default_manager.order_by().in_bulk(ids)
+            for component_type, ids in component_ids.items()
+        }
+
+        items = []
+        for component_type, pk, component_id, added_at in rows:
+            component = components[component_type].get(component_id)
+            if component is None:
+                # Deleted since the rows were read
+                continue
+            item_model = ComponentRegistry.get_model(component_type)
+            values = {'id': pk, 'list_id': self.pk, 'component_id': component_id, 'added_at': added_at}
+            fields = item_model._meta.concrete_fields
+            item = item_model.from_db(self._state.db, [field.attname for field in fields],
+                                      [values[field.attname] for field in fields])
+            item.component = component
+            item.component_type = component_type
+            items.append(item)
+        return items
 
     @property
     def count_all(self) -> int:
         """
-        Counts all items in the list using a single database query.
-        More efficient than counting each type separately.
+        Counts all items in the list, taken from the ``parts_count`` annotation
+        of ``List.objects.with_item_counts()`` when the list was loaded with it.
         """
+        if hasattr(self, 'parts_count'):
+            return self.parts_count
         return sum(self.count_by_type().values())
 
     def count_by_type(self) -> dict:
@@ -55,12 +146,12 @@ class List(BaseListMixin, BaseModelMixin):
         Returns a dictionary with counts for each component type.
         Useful for displaying detailed statistics about the list.
         """
-        counts = {}
-        for component_type in ComponentRegistry.get_all_types():
-            counts[f"{component_type}"] = Count(f"{component_type}_items", distinct=True)
-
-        result = List.objects.filter(id=self.id).aggregate(**counts)
-        return result
+        names = {component_type: get_item_count_name(component_type)
+                 for component_type in ComponentRegistry.get_all_types()}
+        if not all(hasattr(self, name) for name in names.values()):
+            counts = List.objects.filter(id=self.id).with_item_counts().values(*names.values()).first() or {}
+            return {component_type: counts.get(name, 0) for component_type, name in names.items()}
+        return {component_type: getattr(self, name) for component_type, name in names.items()}
 
     def filter_by_type(self, component_type):
         """
@@ -71,6 +162,77 @@ class List(BaseListMixin, BaseModelMixin):
             return getattr(self, related_name).include_component_data().order_by('-added_at')
         return []
 
+    def add_items_bulk(self, items_data):
+        """
+        Add multiple items at once, of any component types, in one transaction.
+
+        items_data should be a list of dicts like:
+        [
+            {'component_type': 'antenna', 'component_id': 1},
+            {'component_type': 'camera', 'component_id': 3},
+        ]
+
+        Components are checked with one ``in_bulk`` per type and inserted with
+        one ``bulk_create`` per list item model (see ``create_missing_items``).
+        Returns the items in the same order, each with its ``status``:
+        ``added``, ``exists`` (already in the list), ``duplicate`` (repeated in
+        items_data), ``not_found`` or ``invalid_type``.
+        """
+        results = []
+        requested = defaultdict(dict)
+        for item_data in items_data:
+            component_type = item_data.get('component_type')
+            component_id = item_data.get('component_id')
+            result = {'component_type': component_type, 'component_id': component_id}
+            results.append(result)
+            if ComponentRegistry.get_model(component_type) is None:
+                result['status'] = 'invalid_type'
+            elif component_id in requested[component_type]:
+                result['status'] = 'duplicate'
+            else:
+                requested[component_type][component_id] = result
+
+        added_models = []
+        with transaction.atomic():
+            for component_type, type_results in requested.items():
+                item_model = ComponentRegistry.get_model(component_type)
+                found = get_component_model(component_type)._default_manager.only('pk').in_bulk(list(type_results))
+                added = set(self.create_missing_items(item_model, list(found)))
+                for component_id, result in type_results.items():
+                    if component_id not in found:
+                        result['status'] = 'not_found'
+                    else:
+                        result['status'] = 'added' if component_id in added else 'exists'
+                if added:
+                    added_models.append(item_model)
+
+        # bulk_create() sends no post_save, so cached responses reading the items are moved on here
+        for item_model in added_models:
+            bump_generation(item_model)
+        return results
+
+    def create_missing_items(self, item_model, component_ids):
+        """
+        Insert the items of ``component_ids`` that are not in the list yet and
+        return their component ids. When another request adds one of them
+        between the check and the insert, the insert fails as a whole and is
+        retried without it, so only the items inserted here are returned.
+        """
+        items = item_model.objects.filter(list=self, component_id__in=component_ids)
+        existing = set(items.values_list('component_id', flat=True))
+        while True:
+            new_ids = [component_id for component_id in component_ids if component_id not in existing]
+            try:
+                with transaction.atomic():
+                    item_model.objects.bulk_create([item_model(list=self, component_id=component_id)
+                                                    for component_id in new_ids])
+                return new_ids
+            except IntegrityError:
+                added_meanwhile = set(items.values_list('component_id', flat=True)) - existing
+                if not added_meanwhile:
+                    raise
+                existing |= added_meanwhile
+
     def remove_items_bulk(self, items_data):
         """
         Remove multiple items at once.
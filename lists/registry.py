@@ -21,3 +21,8 @@ class ComponentRegistry:
     def get_all_models(cls):
         """Get all registered list item models."""
         return list(cls._registry.values())
+
+    @classmethod
+    def get_items(cls):
+        """Get all registered ``(component_type, item model)`` pairs."""
+        return list(cls._registry.items())
@@ -1,4 +1,5 @@
 # favorites/tests/test_models.py
+from django.db import connection
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -66,6 +67,32 @@ class ListModelTests(TestCase):
         self.assertEqual(items[0], camera_item)
         self.assertEqual(items[1], antenna_item)
 
+    def test_items_single_union_query(self):
+        """Test that items load with one query plus one per component type, in SQL order"""
+        now = timezone.now()
+        antenna_item1 = mixer.blend(AntennaListItem, list=self.list, component=self.antenna1)
+        antenna_item2 = mixer.blend(AntennaListItem, list=self.list, component=self.antenna2)
+        camera_item1 = mixer.blend(CameraListItem, list=self.list, component=self.camera1)
+        camera_item2 = mixer.blend(CameraListItem, list=self.list, component=self.camera2)
+        for minutes, item in enumerate([camera_item2, antenna_item1, camera_item1, antenna_item2]):
+            type(item).objects.filter(pk=item.pk).update(added_at=now - timedelta(minutes=minutes))
+
+        with self.assertNumQueries(3):
+            items = self.list.get_all_items()
+            self.assertEqual([item.component.model for item in items],
+                             ['Camera Two', 'Antenna One', 'Camera One', 'Antenna Two'])
+        self.assertEqual(items, [camera_item2, antenna_item1, camera_item1, antenna_item2])
+        self.assertEqual([item.component_type for item in items], ['camera', 'antenna', 'camera', 'antenna'])
+
+        # Only the types on the page are read
+        with self.assertNumQueries(2):
+            items = self.list.get_items(offset=2, limit=1)
+            self.assertEqual([item.component.model for item in items], ['Camera One'])
+        self.assertEqual(self.list.get_items(offset=1, limit=2), [antenna_item1, camera_item1])
+        self.assertEqual(self.list.get_items(offset=3), [antenna_item2])
+
+        self.assertEqual(list(self.list.iter_items(batch_size=3)), self.list.get_all_items())
+
     def test_delete_specific_item(self):
         """Test removing a single item from a list"""
         antenna_item = mixer.blend(AntennaListItem,
@@ -102,6 +129,26 @@ class ListModelTests(TestCase):
         self.assertIn('antenna', all_types)
         self.assertIn('camera', all_types)
 
+    def test_bulk_add_items_added_meanwhile(self):
+        """Test that items another request adds between the check and the insert are not reported as added"""
+        checks = []
+
+        def add_after_check(execute, sql, params, many, context):
+            result = execute(sql, params, many, context)
+            if not checks and sql.startswith('SELECT') and CameraListItem._meta.db_table in sql:
+                checks.append(sql)
+                CameraListItem.objects.create(list=self.list, component=self.camera1)
+            return result
+
+        with connection.execute_wrapper(add_after_check):
+            results = self.list.add_items_bulk([
+                {'component_type': 'camera', 'component_id': self.camera1.id},
+                {'component_type': 'camera', 'component_id': self.camera2.id},
+            ])
+
+        self.assertEqual([result['status'] for result in results], ['exists', 'added'])
+        self.assertEqual(self.list.count_by_type()['camera'], 2)
+
     def test_bulk_remove_items(self):
         """Test removing multiple items at once from a list"""
         # Add several items to the list
@@ -0,0 +1,25 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+
+    def ready(self):
+        from builds.models import Drone
+        from components.models import (
+            Antenna, Camera, Frame, Motor, Propeller, Receiver,
+            Stack, FlightController, SpeedController, Transmitter
+        )
+        from .registry import SearchRegistry
+        from . import signals  # noqa: F401
+
+        # Keep in sync with the search_fields of the API viewsets
+        for model in (Antenna, Camera, Frame, Motor, Propeller, Transmitter,
+                      FlightController, SpeedController, Drone):
+            SearchRegistry.register(model, ['model', 'manufacturer'])
+
+        SearchRegistry.register(Receiver, ['model', 'manufacturer', 'processor', 'details__rf_chip'])
+        SearchRegistry.register(Stack, ['model', 'manufacturer',
+                                        'flight_controller__model', 'flight_controller__manufacturer',
+                                        'speed_controller__model', 'speed_controller__manufacturer'])
@@ -0,0 +1,167 @@
+import heapq
+import threading
+from collections import defaultdict, namedtuple
+
+from components.cache import get_generation_key, get_generations
+from lists.registry import ComponentRegistry
+
+DEFAULT_LIMIT = 10
+
+# Fields str() reads, per component type; the rest use BaseComponentMixin's manufacturer + model.
+LABEL_FIELDS = ('manufacturer', 'model')
+EXTRA_LABEL_FIELDS = {
+    'motor': ('stator_diameter', 'stator_height'),
+}
+
+Entry = namedtuple('Entry', 'component_type id label text words')
+
+
+def get_component_models():
+    """Component model of every type in the list registry, by type."""
+    return {component_type: ComponentRegistry.get_model(component_type)._meta.get_field('component').related_model
+            for component_type in ComponentRegistry.get_all_types()}
+
+
+def get_component_type(model):
+    for component_type, component_model in get_component_models().items():
+        if component_model is model:
+            return component_type
+    return None
+
+
+def get_trigrams(text):
+    """
+    Trigrams of the text, plus two padded ones per word start (``'  m'``,
+    ``' mo'``) so one and two letter word prefixes are looked up the same way.
+    """
+    trigrams = {text[i:i + 3] for i in range(len(text) - 2)}
+    for word in text.split():
+        trigrams.update((f'  {word[:1]}', f' {word[:2]}'))
+    return trigrams
+
+
+def get_query_trigrams(word):
+    if len(word) < 3:
+        return {f'  {word}'[-3:]}
+    return get_trigrams(word) - {f'  {word[:1]}', f' {word[:2]}'}
+
+
+class AutocompleteIndex:
+    """
+    In-memory trigram index of every component's label (``str()``:
+    manufacturer, model and, for motors, the stator size).
+
+    Each component type is loaded on first use and whenever its generation
+    (see ``components.cache``) moved without this process seeing the
+    change; saves in this process update the index in place. A lookup costs
+    a few set intersections and one cache read, no database queries.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.entries = {}
+            self.trigrams = defaultdict(set)
+            self.generations = {}
+
+    def search(self, query, limit=DEFAULT_LIMIT, component_types=None):
+        """
+        Top ``limit`` entries containing every word of the query, whole
+        label prefixes first, then word prefixes, then shorter labels.
+        """
+        words = query.lower().split()
+        if not words:
+            return []
+        self.refresh(component_types)
+
+        with self.lock:
+            candidates = None
+            for word in words:
+                keys = set.intersection(*(self.trigrams.get(trigram, set()) for trigram in get_query_trigrams(word)))
+                candidates = keys if candidates is None else candidates & keys
+            matches = [self.entries[key] for key in candidates]
+
+        if component_types is not None:
+            matches = [entry for entry in matches if entry.component_type in component_types]
+        query = ' '.join(words)
+        matches = [entry for entry in matches if all(self.matches_word(entry, word) for word in words)]
+        return heapq.nsmallest(limit, matches, key=lambda entry: self.get_score(entry, query, words))
+
+    def matches_word(self, entry, word):
+        if len(word) < 3:
+            return any(entry_word.startswith(word) for entry_word in entry.words)
+        return word in entry.text
+
+    def get_score(self, entry, query, words):
+        if entry.text.startswith(query):
+            position = 0
+        elif all(any(entry_word.startswith(word) for entry_word in entry.words) for word in words):
+            position = 1
+        else:
+            position = 2
+        return position, len(entry.text), entry.text, entry.component_type, entry.id
+
+    def refresh(self, component_types=None):
+        """Reload the component types that changed since they were loaded."""
+        models = get_component_models()
+        if component_types is not None:
+            models = {component_type: models[component_type] for component_type in component_types}
+        generations = dict(get_generations(models.values()))
+        for component_type, model in models.items():
+            generation = generations[get_generation_key(model)]
+            if self.generations.get(component_type) != generation:
+                self.load(component_type, model, generation)
+
+    def load(self, component_type, model, generation):
+        fields = LABEL_FIELDS + EXTRA_LABEL_FIELDS.get(component_type, ())
+        objects = list(model._default_manager.only(*fields))
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == component_type]:
+                self.remove_entry(key)
+            for obj in objects:
+                self.add_entry(component_type, obj)
+            self.generations[component_type] = generation
+
+    def update(self, component_type, obj):
+        """Index a saved object, if its type is loaded; unloaded types are read in full on first use."""
+        with self.lock:
+            if component_type in self.generations:
+                self.remove_entry((component_type, obj.pk))
+                self.add_entry(component_type, obj)
+                self.mark_seen(component_type, type(obj))
+
+    def remove(self, component_type, model, pk):
+        with self.lock:
+            if component_type in self.generations:
+                self.remove_entry((component_type, pk))
+                self.mark_seen(component_type, model)
+
+    def mark_seen(self, component_type, model):
+        # The change bumped the type's generation; this process is already up to date with it.
+        self.generations[component_type] = dict(get_generations([model]))[get_generation_key(model)]
+
+    def add_entry(self, component_type, obj):
+        label = str(obj)
+        text = label.lower()
+        entry = Entry(component_type, obj.pk, label, text, text.split())
+        key = (component_type, obj.pk)
+        self.entries[key] = entry
+        for trigram in get_trigrams(text):
+            self.trigrams[trigram].add(key)
+
+    def remove_entry(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for trigram in get_trigrams(entry.text):
+            postings = self.trigrams.get(trigram)
+            if postings is not None:
+                postings.discard(key)
+                if not postings:
+                    del self.trigrams[trigram]
+
+
+autocomplete_index = AutocompleteIndex()
@@ -0,0 +1,122 @@
+import re
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db import connections
+from django.db.models import FloatField, Func, OuterRef, Subquery, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from search.models import SearchDocument
+
+FTS_TABLE = 'search_document_fts'
+
+# Minimum term length the FTS5 trigram tokenizer can match.
+TRIGRAM_LENGTH = 3
+
+
+class SearchBackend:
+    """
+    Portable backend: every term has to occur in the object's search text
+    (``icontains``, like ``SearchFilter``), results are not ranked.
+    """
+
+    def search(self, queryset, terms):
+        """
+        Filter ``queryset`` down to the objects matching every term, annotated
+        with ``search_rank`` and ordered by it, best match first.
+        """
+        documents = self.get_documents(queryset.model)
+        matches = self.filter_documents(documents, terms)
+        rank = self.get_rank(documents.filter(object_id=OuterRef('pk')), terms)
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return (queryset.filter(pk__in=matches.values('object_id'))
+                .annotate(search_rank=rank)
+                .order_by('-search_rank', *ordering))
+
+    def get_documents(self, model):
+        return SearchDocument.objects.filter(content_type=ContentType.objects.get_for_model(model))
+
+    def filter_documents(self, documents, terms):
+        for term in terms:
+            documents = documents.filter(document__icontains=term)
+        return documents
+
+    def get_rank(self, documents, terms):
+        return Value(0.0, output_field=FloatField())
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    ``icontains`` served by the ``pg_trgm`` GIN index on ``UPPER(document)``,
+    ranked by full-text prefix matching (``SearchRank``) plus trigram word
+    similarity, so near and whole-word matches come first.
+    """
+
+    def get_rank(self, documents, terms):
+        rank = TrigramWordSimilarity(' '.join(terms), 'document')
+        words = [word for term in terms for word in re.findall(r'\w+', term)]
+        if words:
+            query = SearchQuery(' & '.join(f'{word}:*' for word in words), config='simple', search_type='raw')
+            rank = rank + SearchRank(SearchVector('document', config='simple'), query)
+        return Subquery(documents.annotate(rank=rank).values('rank')[:1], output_field=FloatField())
+
+
+class BM25Rank(Func):
+    """Relevance of the document with the given row id for an FTS5 match, higher is better."""
+    output_field = FloatField()
+
+    def __init__(self, match, expression, **extra):
+        super().__init__(expression, **extra)
+        self.match = match
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return (f'(SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = {sql})',
+                [self.match, *params])
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    FTS5 index with the trigram tokenizer, so terms match anywhere in a word
+    like ``icontains`` does, ranked by bm25. Terms shorter than a trigram
+    cannot use the index and fall back to ``icontains``.
+    """
+
+    def filter_documents(self, documents, terms):
+        indexed_terms = self.get_indexed_terms(terms)
+        if indexed_terms:
+            documents = documents.filter(id__in=RawSQL(
+                f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [self.get_match(indexed_terms)]))
+        return super().filter_documents(documents, [term for term in terms if term not in indexed_terms])
+
+    def get_rank(self, documents, terms):
+        indexed_terms = self.get_indexed_terms(terms)
+        if not indexed_terms:
+            return super().get_rank(documents, terms)
+        rank = BM25Rank(self.get_match(indexed_terms), 'id')
+        return Subquery(documents.annotate(rank=rank).values('rank')[:1], output_field=FloatField())
+
+    def get_indexed_terms(self, terms):
+        return [term for term in terms if len(term) >= TRIGRAM_LENGTH]
+
+    def get_match(self, terms):
+        """Every term as a quoted FTS5 string; FTS5 ANDs them together."""
+        return ' '.join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+BACKENDS = {
+    'postgresql': PostgresSearchBackend,
+    'sqlite': SQLiteSearchBackend,
+}
+
+
+def get_search_backend(using='default'):
+    """
+    The ``SEARCH_BACKEND`` setting (a dotted path) if set, otherwise the
+    backend for the database vendor.
+    """
+    if settings.SEARCH_BACKEND:
+        return import_string(settings.SEARCH_BACKEND)()
+    return BACKENDS.get(connections[using].vendor, SearchBackend)()
@@ -0,0 +1,58 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from search.models import SearchDocument
+from search.registry import SearchRegistry
+
+BATCH_SIZE = 1000
+
+
+def get_documents(queryset, fields):
+    """
+    Search text of every object in the queryset: the distinct values of
+    ``fields`` joined by spaces. Multi-valued lookups contribute every value.
+    """
+    texts = defaultdict(list)
+    for pk, *values in queryset.order_by().values_list('pk', *fields):
+        words = texts[pk]
+        for value in values:
+            if value not in (None, '') and str(value) not in words:
+                words.append(str(value))
+    return {pk: ' '.join(words) for pk, words in texts.items()}
+
+
+def save_documents(document_model, content_type, documents):
+    document_model.objects.bulk_create(
+        [document_model(content_type=content_type, object_id=pk, document=text) for pk, text in documents.items()],
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['content_type', 'object_id'],
+        update_fields=['document'],
+    )
+
+
+def update_index(model, pks):
+    """Rebuild the search text of the given objects, dropping the ones that no longer exist."""
+    pks = set(pks)
+    if not pks:
+        return
+    content_type = ContentType.objects.get_for_model(model)
+    documents = get_documents(model._default_manager.filter(pk__in=pks), SearchRegistry.get_fields(model))
+    if pks - set(documents):
+        SearchDocument.objects.filter(content_type=content_type, object_id__in=pks - set(documents)).delete()
+    save_documents(SearchDocument, content_type, documents)
+
+
+def remove_from_index(model, pk):
+    content_type = ContentType.objects.get_for_model(model)
+    SearchDocument.objects.filter(content_type=content_type, object_id=pk).delete()
+
+
+def rebuild_index(models=None):
+    """Rebuild the search text of every object of the given (by default all registered) models."""
+    for model in models or SearchRegistry.get_all_models():
+        content_type = ContentType.objects.get_for_model(model)
+        SearchDocument.objects.filter(content_type=content_type).delete()
+        save_documents(SearchDocument, content_type,
+                       get_documents(model._default_manager.all(), SearchRegistry.get_fields(model)))
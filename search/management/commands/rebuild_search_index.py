@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from search.indexing import rebuild_index
+from search.registry import SearchRegistry
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search index of every registered model, e.g. after bulk imports that skip signals."
+
+    def handle(self, *args, **options):
+        for model in SearchRegistry.get_all_models():
+            rebuild_index([model])
+            self.stdout.write(f"Indexed {model._meta.verbose_name_plural}")
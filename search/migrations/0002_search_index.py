@@ -0,0 +1,52 @@
+from django.db import migrations
+
+POSTGRES_INDEX = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    # Matches the UPPER(...::text) LIKE that Django emits for icontains
+    'CREATE INDEX search_document_trgm_idx ON search_document USING gin ((UPPER(document::text)) gin_trgm_ops)',
+]
+POSTGRES_DROP_INDEX = [
+    'DROP INDEX IF EXISTS search_document_trgm_idx',
+]
+
+# External content FTS5 table kept in sync by triggers. SQLite rebuilds a table
+# to alter it, which drops its triggers: recreate them if search_document changes.
+SQLITE_INDEX = [
+    "CREATE VIRTUAL TABLE search_document_fts USING fts5("
+    "document, content='search_document', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER search_document_fts_insert AFTER INSERT ON search_document BEGIN "
+    "INSERT INTO search_document_fts(rowid, document) VALUES (new.id, new.document); END",
+    "CREATE TRIGGER search_document_fts_delete AFTER DELETE ON search_document BEGIN "
+    "INSERT INTO search_document_fts(search_document_fts, rowid, document) VALUES ('delete', old.id, old.document); "
+    "END",
+    "CREATE TRIGGER search_document_fts_update AFTER UPDATE ON search_document BEGIN "
+    "INSERT INTO search_document_fts(search_document_fts, rowid, document) VALUES ('delete', old.id, old.document); "
+    "INSERT INTO search_document_fts(rowid, document) VALUES (new.id, new.document); END",
+]
+SQLITE_DROP_INDEX = [
+    'DROP TRIGGER IF EXISTS search_document_fts_insert',
+    'DROP TRIGGER IF EXISTS search_document_fts_delete',
+    'DROP TRIGGER IF EXISTS search_document_fts_update',
+    'DROP TABLE IF EXISTS search_document_fts',
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({'postgresql': POSTGRES_INDEX, 'sqlite': SQLITE_INDEX}),
+            run_for_vendor({'postgresql': POSTGRES_DROP_INDEX, 'sqlite': SQLITE_DROP_INDEX}),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+from search.indexing import get_documents, save_documents
+from search.registry import SearchRegistry
+
+
+def populate(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    for registered_model in SearchRegistry.get_all_models():
+        model = apps.get_model(registered_model._meta.label)
+        content_type, _ = ContentType.objects.get_or_create(app_label=model._meta.app_label,
+                                                            model=model._meta.model_name)
+        save_documents(SearchDocument, content_type,
+                       get_documents(model.objects.all(), SearchRegistry.get_fields(model)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_search_index'),
+        ('builds', '0002_drone_keyset_index'),
+        ('components', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchDocument(models.Model):
+    """
+    Search text of one object of a registered model, kept up to date by
+    ``search.signals``. The database specific index over ``document`` is
+    created in the migrations (see ``search.backends``).
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    document = models.TextField(blank=True)
+
+    def __str__(self):
+        return f"{self.content_type} #{self.object_id}"
+
+    class Meta:
+        db_table = 'search_document'
+        unique_together = (('content_type', 'object_id'),)
+        verbose_name = _('Search document')
+        verbose_name_plural = _('Search documents')
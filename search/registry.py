@@ -0,0 +1,22 @@
+class SearchRegistry:
+    """Registry of searchable models and the fields their search text is built from."""
+    _registry = {}
+
+    @classmethod
+    def register(cls, model, fields):
+        """Register a model with the fields (lookups across relations allowed) to index."""
+        cls._registry[model._meta.label_lower] = (model, list(fields))
+
+    @classmethod
+    def is_registered(cls, model):
+        return model._meta.label_lower in cls._registry
+
+    @classmethod
+    def get_fields(cls, model):
+        """Get the indexed fields of a model. Works for historical (migration) models too."""
+        return cls._registry[model._meta.label_lower][1]
+
+    @classmethod
+    def get_all_models(cls):
+        """Get all registered models."""
+        return [model for model, _fields in cls._registry.values()]
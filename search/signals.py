@@ -0,0 +1,77 @@
+from functools import cache
+
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from search.autocomplete import autocomplete_index, get_component_type
+from search.indexing import remove_from_index, update_index
+from search.registry import SearchRegistry
+
+
+@cache
+def get_dependents():
+    """
+    Map every model a registered model's search text reads through a
+    relation to ``(registered model, lookup)`` pairs, e.g. FlightController
+    to ``(Stack, 'flight_controller')``.
+    """
+    dependents = {}
+    for model in SearchRegistry.get_all_models():
+        for field_name in SearchRegistry.get_fields(model):
+            related_model = model
+            path = []
+            for name in field_name.split(LOOKUP_SEP):
+                field = related_model._meta.get_field(name)
+                if not field.is_relation:
+                    break
+                path.append(name)
+                related_model = field.related_model
+                lookup = (model, LOOKUP_SEP.join(path))
+                if lookup not in dependents.setdefault(related_model, []):
+                    dependents[related_model].append(lookup)
+    return dependents
+
+
+def get_dependent_pks(model, instance):
+    return [(dependent, list(dependent._default_manager.filter(**{lookup: instance.pk}).values_list('pk', flat=True)))
+            for dependent, lookup in get_dependents().get(model, ())]
+
+
+@receiver(post_save)
+def index_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if SearchRegistry.is_registered(sender):
+        update_index(sender, [instance.pk])
+    for dependent, pks in get_dependent_pks(sender, instance):
+        update_index(dependent, pks)
+
+
+@receiver(pre_delete)
+def collect_dependents(sender, instance, **kwargs):
+    # After the delete the related objects can no longer be looked up by this instance.
+    if sender in get_dependents():
+        instance._search_dependents = get_dependent_pks(sender, instance)
+
+
+@receiver(post_delete)
+def index_deleted(sender, instance, **kwargs):
+    if SearchRegistry.is_registered(sender):
+        remove_from_index(sender, instance.pk)
+    for dependent, pks in getattr(instance, '_search_dependents', ()):
+        update_index(dependent, pks)
+
+
+@receiver(post_save)
+def autocomplete_saved(sender, instance, raw=False, **kwargs):
+    component_type = get_component_type(sender)
+    if component_type is not None and not raw:
+        autocomplete_index.update(component_type, instance)
+
+
+@receiver(post_delete)
+def autocomplete_deleted(sender, instance, **kwargs):
+    component_type = get_component_type(sender)
+    if component_type is not None:
+        autocomplete_index.remove(component_type, sender, instance.pk)
@@ -0,0 +1,63 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from mixer.backend.django import mixer
+
+from components.models import FlightController, Motor, SpeedController, Stack
+from search.backends import get_search_backend
+from search.indexing import rebuild_index
+from search.models import SearchDocument
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        mixer.register(FlightController, description='Test Flight Controller', weight=15)
+        mixer.register(SpeedController, description='Test Speed Controller', weight=15,
+                       cont_current=15, burst_current=20)
+        mixer.register(Stack, description='Test Stack')
+        mixer.register(Motor, description='Test Motor', stator_diameter='26', stator_height='06')
+
+        self.flight_controller = mixer.blend(FlightController, manufacturer='Holybro', model='Kakute H7')
+        self.speed_controller = mixer.blend(SpeedController, manufacturer='T-Motor', model='F55A')
+        self.stack = mixer.blend(Stack, manufacturer='Holybro', model='Tekko32 Stack',
+                                 flight_controller=self.flight_controller,
+                                 speed_controller=self.speed_controller)
+
+    def get_document(self, obj):
+        return SearchDocument.objects.get(content_type=ContentType.objects.get_for_model(obj),
+                                          object_id=obj.pk).document
+
+    def search(self, queryset, *terms):
+        return list(get_search_backend().search(queryset, list(terms)))
+
+    def test_document_built_from_registered_fields(self):
+        self.assertEqual(self.get_document(self.stack), 'Tekko32 Stack Holybro Kakute H7 F55A T-Motor')
+
+    def test_related_change_reindexes(self):
+        self.flight_controller.model = 'Kakute F7'
+        self.flight_controller.save()
+        self.assertIn('Kakute F7', self.get_document(self.stack))
+
+    def test_delete_removes_document(self):
+        stack_pk = self.stack.pk
+        self.stack.delete()
+        self.assertFalse(SearchDocument.objects.filter(object_id=stack_pk,
+                                                       content_type=ContentType.objects.get_for_model(Stack)).exists())
+
+    def test_rebuild_index(self):
+        SearchDocument.objects.all().delete()
+        rebuild_index()
+        self.assertEqual(self.get_document(self.flight_controller), 'Kakute H7 Holybro')
+
+    def test_search_every_term_anywhere_in_word(self):
+        self.assertEqual(self.search(Stack.objects.all(), 'kakute', 'motor'), [self.stack])
+        self.assertEqual(self.search(Stack.objects.all(), 'ekko'), [self.stack])
+        self.assertEqual(self.search(Stack.objects.all(), 'kakute', 'betaflight'), [])
+
+    def test_search_short_terms(self):
+        self.assertEqual(self.search(FlightController.objects.all(), 'H7'), [self.flight_controller])
+        self.assertEqual(self.search(FlightController.objects.all(), 'F4'), [])
+
+    def test_search_ranked_by_relevance(self):
+        long_name = mixer.blend(Motor, manufacturer='Emax Performance Motors', model='Eco II 2207 Extended Edition')
+        short_name = mixer.blend(Motor, manufacturer='Emax', model='Eco 2207')
+        self.assertEqual(self.search(Motor.objects.all(), 'eco'), [short_name, long_name])
@@ -1,4 +1,6 @@
 import base64
+import shutil
+import tempfile
 from io import BytesIO
 
 from django.contrib.auth.hashers import make_password
@@ -6,13 +8,21 @@ from reportlab.pdfgen import canvas
 from PIL import Image
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 User = get_user_model()
 
 class BaseUserTest(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Uploaded test images and documents go to a temporary MEDIA_ROOT instead of the repository
+        media_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media_root))
+
     def create_image(self, filename='test_image.jpg'):
         image = Image.new('RGB', (10, 10))
         image_io = BytesIO()